@@ -0,0 +1,62 @@
+# benchmarks/bench_batch_retrieval.py
+#
+# Throughput of Retriever.retrieve_many against calling
+# Retriever.retrieve once per query, for batches of 1, 32 and 1024 topics.
+#
+# Usage (from the project root):
+#   python -m benchmarks.bench_batch_retrieval --chunks 20000 --mode dense sparse
+
+import argparse
+import logging
+import random
+import time
+
+from benchmarks.bench_sparse_vs_dense import make_chunks
+from benchmarks.synthetic_corpus import TOPICS, WORDS
+from src.components.retriever import Retriever
+
+
+def make_queries(n: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [f"{rng.choice(TOPICS)} {rng.choice(WORDS)}" for _ in range(n)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched retrieval throughput benchmark")
+    parser.add_argument("--chunks", type=int, default=20000)
+    parser.add_argument("--batches", type=int, nargs="+", default=[1, 32, 1024])
+    parser.add_argument("--mode", nargs="+", default=["dense", "sparse"])
+    parser.add_argument("--top-k", type=int, default=5)
+    args = parser.parse_args()
+
+    # Per-call INFO lines would dominate the one-at-a-time loop
+    logging.disable(logging.INFO)
+
+    chunks = make_chunks(args.chunks)
+
+    print(f"{'mode':>7} {'batch':>6} {'loop q/s':>10} {'batch q/s':>10} {'speedup':>8}")
+    for mode in args.mode:
+        retriever = Retriever(index_mode=mode)
+        retriever.index_chunks(chunks)
+
+        for batch_size in args.batches:
+            queries = make_queries(batch_size)
+
+            start = time.perf_counter()
+            looped = [retriever.retrieve_with_scores(q, top_k=args.top_k) for q in queries]
+            loop_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            batched = retriever.retrieve_many(queries, top_k=args.top_k)
+            batch_s = time.perf_counter() - start
+
+            same = sum(
+                [c for c, _ in a] == [c for c, _ in b] for a, b in zip(looped, batched)
+            ) / batch_size
+
+            print(f"{mode:>7} {batch_size:>6} {batch_size / loop_s:>10.0f} {batch_size / batch_s:>10.0f} "
+                  f"{loop_s / batch_s:>7.1f}x   (identical results: {same:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# benchmarks/bench_chunk_filter.py
+#
+# Boilerplate and near-duplicate chunk removal at index time. Builds a
+# lecture-notes style PDF: every page carries a course header, a slide
+# title, a "Page n of N" footer and a copyright line, and a share of the
+# slides is repeated later with a small edit (recap slides). The PDF is
+# indexed with index_pdf() twice, in fresh pipelines:
+#   off  no filtering (the old behaviour)
+#   on   ChunkFilter between page extraction and embedding
+#
+# Reports chunks and index size, ingestion time (and the filter's share
+# of it), and how many of the top-5 results per topic query are wasted
+# on boilerplate or on a near-copy of a better-ranked result.
+#
+# Usage (from the project root):
+#   python -m benchmarks.bench_chunk_filter --pages 200 --repeat-rate 0.15
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.synthetic_corpus import write_pdf, TOPICS
+from src.components.chunk_filter import ChunkFilter
+from src.components.llm_backend import SimulatedBackend
+from src.components.resource_manager import ResourceManager
+from src.pipeline.mcq_pipeline import MCQPipeline
+from tests.corpus import HEADER, COPYRIGHT, make_lecture_pages
+
+
+def wasted_results(results: list, checker: ChunkFilter) -> int:
+    # Results that are boilerplate-heavy or near-copies of a higher-ranked result
+    wasted = 0
+    kept = []
+    for _, chunk, _ in results:
+        sig = checker.signature(chunk)
+        boilerplate = HEADER in chunk or COPYRIGHT in chunk
+        duplicate = any((sig == other).mean() >= checker.threshold for other in kept)
+        wasted += boilerplate or duplicate
+        kept.append(sig)
+    return wasted
+
+
+def run(pdf_path: str, filter_chunks: bool) -> dict:
+    pipeline = MCQPipeline(use_index_cache=False, resources=ResourceManager(),
+                           llm_backend=SimulatedBackend(latency_s=0.0),
+                           filter_chunks=filter_chunks)
+    start = time.perf_counter()
+    num_chunks = pipeline.index_pdf(pdf_path, doc_id="notes")
+    ingest_s = time.perf_counter() - start
+
+    retriever = pipeline.documents.get("notes")
+    checker = ChunkFilter()
+    wasted = sum(
+        wasted_results(pipeline.documents.search(topic, top_k=5, doc_ids="notes"), checker)
+        for topic in TOPICS
+    )
+    stats = pipeline.chunk_filter.last_stats if pipeline.chunk_filter else {}
+    return {
+        "chunks": num_chunks,
+        "index_mb": retriever.memory_bytes() / 1e6,
+        "ingest_s": ingest_s,
+        "filter_s": stats.get("seconds", 0.0),
+        "boilerplate_lines": stats.get("boilerplate_lines", 0),
+        "wasted_top5": wasted / (5 * len(TOPICS)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index-time boilerplate / near-duplicate filter benchmark")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--repeat-rate", type=float, default=0.15,
+                        help="Share of slides repeated later with a small edit")
+    parser.add_argument("--runs", type=int, default=3, help="Best-of runs for timings")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = os.path.join(tmp, "notes.pdf")
+        write_pdf(pdf_path, make_lecture_pages(args.pages, args.repeat_rate))
+
+        results = {}
+        for name, enabled in (("off", False), ("on", True)):
+            runs = [run(pdf_path, enabled) for _ in range(args.runs)]
+            results[name] = min(runs, key=lambda r: r["ingest_s"])
+
+    print(f"{args.pages} pages, {args.repeat_rate:.0%} repeated slides")
+    print(f"{'filter':>7} {'chunks':>7} {'index MB':>9} {'ingest s':>9} {'filter s':>9} "
+          f"{'lines cut':>10} {'wasted top-5':>13}")
+    for name, r in results.items():
+        print(f"{name:>7} {r['chunks']:>7} {r['index_mb']:>9.2f} {r['ingest_s']:>9.3f} "
+              f"{r['filter_s']:>9.3f} {r['boilerplate_lines']:>10} {r['wasted_top5']:>13.1%}")
+
+    off, on = results["off"], results["on"]
+    print(f"index size -{1 - on['index_mb'] / off['index_mb']:.1%}, "
+          f"chunks -{1 - on['chunks'] / off['chunks']:.1%}, "
+          f"ingestion {on['ingest_s'] / off['ingest_s']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+# benchmarks/bench_chunk_store.py
+#
+# Offset-based chunk storage vs a list of chunk strings. A synthetic PDF
+# is chunked with chunk_pages() and the chunks are held two ways:
+#   list   one Python str per chunk (the old in-memory representation;
+#          saved as the chunk texts back to back)
+#   store  ChunkStore: (start, end, page) arrays into one document
+#          buffer shared by overlapping chunks
+#
+# Reports per-document memory (tracemalloc, so interpreter overhead is
+# counted), bytes on disk, the cost of loading a saved index's chunks and
+# of reading the top-5 chunks of a search, and whether every chunk's page
+# number is right (its text must appear on that page).
+#
+# Usage (from the project root):
+#   python -m benchmarks.bench_chunk_store --pages 400 --chunk-size 500 --overlap 50
+#   python -m benchmarks.bench_chunk_store --pages 400 --chunk-size 200 --overlap 100
+
+import argparse
+import gc
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.synthetic_corpus import make_pages
+from src.components.chunk_store import ChunkStore, CHUNKS_FILE, OFFSETS_FILE, PAGES_FILE
+from src.components.text_chunker import TextChunker
+
+
+def allocated_bytes(build) -> tuple:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    value = build()
+    gc.collect()  # count what the result keeps alive, not transient garbage
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return value, used
+
+
+def disk_bytes(directory: str) -> int:
+    return sum(os.path.getsize(os.path.join(directory, name))
+               for name in (CHUNKS_FILE, OFFSETS_FILE, PAGES_FILE)
+               if os.path.exists(os.path.join(directory, name)))
+
+
+def load_texts(directory: str) -> list:
+    # Load the chunks as plain strings, as the old list representation did
+    store = ChunkStore.load(directory, memory_map=False)
+    data = store.buffer
+    return [data[start:end].decode("utf-8") for start, end in zip(store.starts.tolist(), store.ends.tolist())]
+
+
+def best_seconds(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def read_top5_us(chunks, lookups: int) -> float:
+    rng = random.Random(0)
+    hits = [[rng.randrange(len(chunks)) for _ in range(5)] for _ in range(lookups)]
+    start = time.perf_counter()
+    for top in hits:
+        for idx in top:
+            chunks[idx]
+    return (time.perf_counter() - start) * 1e6 / lookups
+
+
+def wrong_pages(store: ChunkStore, pages: list) -> int:
+    return sum(chunk not in pages[store.page(i) - 1] for i, chunk in enumerate(store))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offset-based chunk storage benchmark")
+    parser.add_argument("--pages", type=int, default=400)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--overlap", type=int, default=50)
+    parser.add_argument("--lookups", type=int, default=20000, help="Top-5 reads to time")
+    parser.add_argument("--repeat", type=int, default=5, help="Best-of runs for load time")
+    args = parser.parse_args()
+
+    pages = make_pages(args.pages)
+    chunker = TextChunker(args.chunk_size, args.overlap)
+    store, store_bytes = allocated_bytes(lambda: chunker.chunk_pages(pages))
+    texts, list_bytes = allocated_bytes(lambda: [str(chunk) for chunk in store])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        list_dir, store_dir = os.path.join(tmp, "list"), os.path.join(tmp, "store")
+        os.makedirs(list_dir)
+        os.makedirs(store_dir)
+        ChunkStore.from_texts(texts).save(list_dir)
+        store.save(store_dir)
+
+        rows = {
+            "list": {
+                "memory": list_bytes,
+                "disk": disk_bytes(list_dir),
+                "load_ms": best_seconds(lambda: load_texts(list_dir),
+                                        args.repeat) * 1e3,
+                "read_us": read_top5_us(texts, args.lookups),
+            },
+            "store": {
+                "memory": store_bytes,
+                "disk": disk_bytes(store_dir),
+                "load_ms": best_seconds(lambda: ChunkStore.load(store_dir, memory_map=False),
+                                        args.repeat) * 1e3,
+                "read_us": read_top5_us(store, args.lookups),
+            },
+        }
+        mapped = ChunkStore.load(store_dir)
+        mapped_read_us = read_top5_us(mapped, args.lookups)
+        mapped_load_ms = best_seconds(lambda: ChunkStore.load(store_dir), args.repeat) * 1e3
+        identical = list(mapped) == texts and list(store) == texts
+
+    print(f"{args.pages} pages, {len(store)} chunks of {args.chunk_size} chars "
+          f"(overlap {args.overlap}), {len(store.buffer) / 1e6:.2f} M chars of text")
+    print(f"{'storage':>12} {'memory MB':>10} {'disk MB':>8} {'load ms':>8} {'top-5 read us':>14}")
+    for name, r in rows.items():
+        print(f"{name:>12} {r['memory'] / 1e6:>10.2f} {r['disk'] / 1e6:>8.2f} "
+              f"{r['load_ms']:>8.2f} {r['read_us']:>14.2f}")
+    print(f"{'store (mmap)':>12} {'-':>10} {rows['store']['disk'] / 1e6:>8.2f} "
+          f"{mapped_load_ms:>8.2f} {mapped_read_us:>14.2f}")
+
+    print(f"memory {rows['store']['memory'] / rows['list']['memory'] - 1:+.1%}, "
+          f"disk {rows['store']['disk'] / rows['list']['disk'] - 1:+.1%}; "
+          f"chunks identical: {identical}; "
+          f"chunks with a page: {sum(bool(store.page(i)) for i in range(len(store)))}/{len(store)}, "
+          f"wrong page: {wrong_pages(store, pages)}")
+
+
+if __name__ == "__main__":
+    main()
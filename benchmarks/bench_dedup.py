@@ -0,0 +1,104 @@
+# benchmarks/bench_dedup.py
+#
+# Near-duplicate question suppression. The simulated backend rewords a
+# fraction of recent questions (same answer, different wording), the way
+# an LLM repeats itself when asked for many questions on one context.
+# Each generation mode runs twice:
+#   exact     only exact repeats are dropped (the old behaviour)
+#   semantic  QuestionDeduplicator at the configured cosine threshold
+#
+# Reports questions delivered, LLM calls, duplicates rejected (each one a
+# wasted call or wasted batch slot), paraphrases left in the quiz and the
+# cost of one dedupe check.
+#
+# Usage (from the project root):
+#   python -m benchmarks.bench_dedup --duplicate-rate 0.3 --questions 10 --quizzes 20
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("MCQ_LLM_BACKEND", "simulated")
+
+from benchmarks.synthetic_corpus import make_pages, TOPICS  # noqa: E402
+from src.components.llm_backend import SimulatedBackend  # noqa: E402
+from src.components.llm_scheduler import LLMScheduler  # noqa: E402
+from src.components.question_deduplicator import DEFAULT_THRESHOLD  # noqa: E402
+from src.components.question_generator import QuestionGenerator  # noqa: E402
+from src.pipeline.mcq_pipeline import MCQPipeline  # noqa: E402
+
+def run(mode: str, threshold: float, args) -> dict:
+    backend = SimulatedBackend(latency_s=0.0, duplicate_rate=args.duplicate_rate, seed=7)
+    question_generator = QuestionGenerator(backend=backend, use_response_cache=False,
+                                           dedup_threshold=threshold)
+    question_generator.scheduler = LLMScheduler(
+        backend, requests_per_minute=1e9, tokens_per_minute=1e12
+    )
+    question_generator.generation_mode = mode
+    pipeline = MCQPipeline(question_generator=question_generator, use_index_cache=False)
+    pipeline.index_document("\n".join(make_pages(args.pages)))
+
+    totals = {"questions": 0, "llm_calls": 0, "duplicates": 0, "paraphrases": 0,
+              "short_quizzes": 0, "seconds": 0.0}
+    for i in range(args.quizzes):
+        topic = TOPICS[i % len(TOPICS)]
+        mcqs = pipeline.generate_mcqs(topic, args.questions)
+        stats = question_generator.last_quiz_stats
+        totals["questions"] += len(mcqs)
+        totals["llm_calls"] += stats["llm_calls"]
+        totals["duplicates"] += stats["duplicates"]
+        # A reworded question keeps the original's answer
+        totals["paraphrases"] += len(mcqs) - len({m["correct_answer"] for m in mcqs})
+        totals["short_quizzes"] += len(mcqs) < args.questions
+        totals["seconds"] += stats["wall_seconds"]
+    return totals
+
+
+def check_cost_us(args) -> float:
+    # Cost of one add() once a full quiz has been accepted
+    from src.components.question_deduplicator import QuestionDeduplicator
+    from src.components.retriever import Retriever
+    from src.components.text_chunker import TextChunker
+
+    retriever = Retriever()
+    retriever.index_chunks(TextChunker().split_text("\n".join(make_pages(args.pages))))
+    backend = SimulatedBackend(latency_s=0.0, seed=3)
+    words = backend._context_words(" ".join(make_pages(2)))
+    dedup = QuestionDeduplicator(retriever.embedding_generator, threshold=2.0)
+    mcqs = [backend.make_mcq("gradient descent", words) for _ in range(args.questions + 200)]
+    for mcq in mcqs[:args.questions]:
+        dedup.add(mcq)
+    start = time.perf_counter()
+    for mcq in mcqs[args.questions:]:
+        dedup.add(mcq)
+    return (time.perf_counter() - start) * 1e6 / 200
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Near-duplicate question suppression benchmark")
+    parser.add_argument("--duplicate-rate", type=float, default=0.3,
+                        help="Fraction of simulated questions that reword a recent one")
+    parser.add_argument("--questions", type=int, default=10, help="Questions per quiz")
+    parser.add_argument("--quizzes", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=30)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    print(f"{args.quizzes} quizzes x {args.questions} questions, "
+          f"{args.duplicate_rate:.0%} reworded duplicates, threshold {args.threshold:g}")
+    print(f"{'mode':>13} {'dedupe':>9} {'questions':>10} {'llm calls':>10} {'rejected':>9} "
+          f"{'wasted %':>9} {'paraphrases':>12} {'short':>6} {'seconds':>8}")
+    for mode in ("per_question", "batched"):
+        for name, threshold in (("exact", 2.0), ("semantic", args.threshold)):
+            r = run(mode, threshold, args)
+            generated = r["questions"] + r["duplicates"]
+            wasted = r["duplicates"] / generated if generated else 0.0
+            print(f"{mode:>13} {name:>9} {r['questions']:>10} {r['llm_calls']:>10} "
+                  f"{r['duplicates']:>9} {wasted:>9.1%} {r['paraphrases']:>12} "
+                  f"{r['short_quizzes']:>6} {r['seconds']:>8.2f}")
+
+    print(f"one dedupe check: {check_cost_us(args):.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# benchmarks/bench_generation.py
+#
+# Throughput and tail latency of the MCQ generation path, fully offline:
+# QuestionGenerator talks to the SimulatedBackend (configurable latency
+# distribution and error rates) through the real scheduler, with the
+# response cache off. Reports quiz and question throughput plus p50/p95/p99
+# of quiz latency and time-to-first-question.
+#
+# Usage (from the project root):
+#   python -m benchmarks.bench_generation --quizzes 20 --concurrency 1 4 8
+#   python -m benchmarks.bench_generation --latency-dist lognormal --error-rate 0.05 --mode batched
+
+import argparse
+import time
+
+import numpy as np
+
+from src.components.llm_backend import SimulatedBackend
+from src.components.llm_scheduler import LLMScheduler
+from src.components.question_generator import QuestionGenerator
+
+CHUNKS = [
+    "Gradient descent updates parameters in the direction of the negative gradient. " * 6,
+    "The learning rate controls the step size of each gradient descent update. " * 6,
+    "Stochastic gradient descent estimates the gradient from a mini-batch. " * 6,
+    "Momentum accumulates past gradients to damp oscillations. " * 6,
+    "Adam combines momentum with per-parameter adaptive learning rates. " * 6,
+]
+
+
+def run(generator: QuestionGenerator, num_quizzes: int, num_questions: int) -> dict:
+    quiz_s, first_s, questions = [], [], 0
+
+    start = time.perf_counter()
+    for _ in range(num_quizzes):
+        quiz_start = time.perf_counter()
+        first = None
+        for _ in generator.iter_mcqs(CHUNKS, "gradient descent", num_questions):
+            questions += 1
+            if first is None:
+                first = time.perf_counter() - quiz_start
+        quiz_s.append(time.perf_counter() - quiz_start)
+        first_s.append(first if first is not None else quiz_s[-1])
+    elapsed = time.perf_counter() - start
+
+    return {
+        "quizzes_per_s": num_quizzes / elapsed,
+        "questions_per_s": questions / elapsed,
+        "questions_per_quiz": questions / num_quizzes,
+        "quiz_p50": np.percentile(quiz_s, 50),
+        "quiz_p95": np.percentile(quiz_s, 95),
+        "quiz_p99": np.percentile(quiz_s, 99),
+        "first_p50": np.percentile(first_s, 50),
+        "first_p95": np.percentile(first_s, 95),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline MCQ generation throughput benchmark")
+    parser.add_argument("--quizzes", type=int, default=20)
+    parser.add_argument("--questions", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--mode", choices=["per_question", "batched"], default="per_question")
+    parser.add_argument("--latency", type=float, default=0.2, help="Median simulated latency (s)")
+    parser.add_argument("--latency-dist", choices=["fixed", "uniform", "lognormal"], default="lognormal")
+    parser.add_argument("--spread", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'workers':>7} {'quiz/s':>7} {'q/s':>7} {'q/quiz':>7} "
+          f"{'p50 s':>7} {'p95 s':>7} {'p99 s':>7} {'first p50':>10} {'first p95':>10}")
+    for concurrency in args.concurrency:
+        backend = SimulatedBackend(
+            latency_s=args.latency, latency_dist=args.latency_dist,
+            latency_spread=args.spread, error_rate=args.error_rate, seed=args.seed
+        )
+        generator = QuestionGenerator(
+            max_concurrency=concurrency, generation_mode=args.mode,
+            use_response_cache=False, backend=backend
+        )
+        # Measure the generation path, not the provider's quota
+        generator.scheduler = LLMScheduler(
+            backend, requests_per_minute=1e9, tokens_per_minute=1e12, base_delay=0.05
+        )
+
+        r = run(generator, args.quizzes, args.questions)
+        print(f"{concurrency:>7} {r['quizzes_per_s']:>7.2f} {r['questions_per_s']:>7.2f} "
+              f"{r['questions_per_quiz']:>7.2f} {r['quiz_p50']:>7.3f} {r['quiz_p95']:>7.3f} "
+              f"{r['quiz_p99']:>7.3f} {r['first_p50']:>10.3f} {r['first_p95']:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# benchmarks/bench_import_time.py
+#
+# Cold-start cost of the app, measured in fresh interpreter processes so
+# nothing is already in sys.modules:
+#   import      — import src.pipeline.mcq_pipeline
+#   construct   — import + MCQPipeline() (what the UI does before its first render)
+#   first_index — construct + index a short document (pays the deferred imports)
+#   eager_deps  — importing langchain, sklearn, faiss, scipy, PyPDF2 and groq up
+#                 front, i.e. roughly what start-up cost before they were deferred
+#
+# Reports the median over --runs processes and the heavy modules each step
+# left loaded. Exits 1 if the median "construct" time exceeds --budget.
+#
+# Usage (from the project root):
+#   python -m benchmarks.bench_import_time --runs 5 --budget 1.0
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ("langchain", "sklearn", "faiss", "scipy", "PyPDF2", "groq", "nltk", "streamlit")
+
+SETUP = """
+import json, sys, time
+start = time.perf_counter()
+"""
+
+REPORT = """
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"seconds": elapsed, "loaded": heavy}}))
+"""
+
+STEPS = {
+    "import": "import src.pipeline.mcq_pipeline",
+    "construct": (
+        "from src.pipeline.mcq_pipeline import MCQPipeline\n"
+        "from src.components.llm_backend import SimulatedBackend\n"
+        "MCQPipeline(use_index_cache=False, llm_backend=SimulatedBackend())"
+    ),
+    "first_index": (
+        "from src.pipeline.mcq_pipeline import MCQPipeline\n"
+        "from src.components.llm_backend import SimulatedBackend\n"
+        "pipeline = MCQPipeline(use_index_cache=False, llm_backend=SimulatedBackend())\n"
+        "pipeline.index_document('Gradient descent minimises a loss function. ' * 100)"
+    ),
+    "eager_deps": (
+        "import langchain.text_splitter, sklearn.feature_extraction.text, "
+        "faiss, scipy.sparse, PyPDF2, groq"
+    ),
+}
+
+
+def run_step(code: str) -> dict:
+    script = SETUP + code + "\n" + REPORT.format(heavy=HEAVY_MODULES)
+    env = dict(os.environ, MCQ_METRICS="0")
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start import time benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh processes per step")
+    parser.add_argument("--budget", type=float, default=1.0,
+                        help="Max median seconds for the 'construct' step")
+    parser.add_argument("--steps", nargs="+", choices=list(STEPS), default=list(STEPS))
+    args = parser.parse_args()
+
+    medians = {}
+    print(f"{'step':>12} {'median s':>9} {'min s':>7} {'max s':>7}  heavy modules loaded")
+    for step in args.steps:
+        try:
+            runs = [run_step(STEPS[step]) for _ in range(args.runs)]
+        except subprocess.CalledProcessError as e:
+            print(f"{step:>12} failed: {e.stderr.strip().splitlines()[-1]}")
+            continue
+
+        seconds = [r["seconds"] for r in runs]
+        medians[step] = statistics.median(seconds)
+        print(f"{step:>12} {medians[step]:>9.3f} {min(seconds):>7.3f} {max(seconds):>7.3f}  "
+              f"{', '.join(runs[-1]['loaded']) or '-'}")
+
+    if "construct" in medians:
+        verdict = "OK" if medians["construct"] <= args.budget else "OVER BUDGET"
+        print(f"\nCold start {medians['construct']:.3f}s vs budget {args.budget:.3f}s — {verdict}")
+        if verdict != "OK":
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# benchmarks/bench_index_types.py
+#
+# Recall@k, query latency and build time of approximate FAISS indexes
+# (IVF, HNSW) against the exact flat index, on TF-IDF embeddings of
+# synthetic textbook chunks.
+#
+# Usage (from the project root):
+#   python -m benchmarks.bench_index_types --chunks 20000 100000
+#   python -m benchmarks.bench_index_types --nprobe 4 16 64 --ef-search 32 128
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.bench_sparse_vs_dense import make_chunks
+from src.components.embedding_generator import EmbeddingGenerator
+from src.components.vector_store import VectorStore
+
+
+def build(chunks: list, embeddings: np.ndarray, **params):
+    store = VectorStore(**params)
+    start = time.perf_counter()
+    store.build_index(chunks, embeddings)
+    return store, time.perf_counter() - start
+
+
+def query_ids(store: VectorStore, queries: np.ndarray, top_k: int):
+    start = time.perf_counter()
+    _, ids = store.index.search(queries, top_k)
+    latency_ms = (time.perf_counter() - start) * 1000 / len(queries)
+    return ids, latency_ms
+
+
+def recall_at_k(ids: np.ndarray, exact_ids: np.ndarray) -> float:
+    hits = sum(len(set(a) & set(b)) for a, b in zip(ids, exact_ids))
+    return hits / exact_ids.size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Approximate index recall benchmark")
+    parser.add_argument("--chunks", type=int, nargs="+", default=[20000, 100000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[4, 16, 64])
+    parser.add_argument("--ef-search", type=int, nargs="+", default=[32, 64, 128])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+
+    print(f"{'chunks':>8} {'index':>6} {'knob':>12} {'build s':>8} {'query ms':>9} {'recall@k':>9}")
+    for num_chunks in args.chunks:
+        chunks = make_chunks(num_chunks)
+        embeddings = np.vstack(list(
+            EmbeddingGenerator().generate_embedding_batches(chunks)
+        ))
+        queries = embeddings[rng.choice(len(embeddings), args.queries, replace=False)]
+
+        exact, build_s = build(chunks, embeddings, index_type="flat")
+        exact_ids, latency_ms = query_ids(exact, queries, args.top_k)
+        print(f"{num_chunks:>8} {'flat':>6} {'-':>12} {build_s:>8.2f} {latency_ms:>9.3f} {1.0:>9.3f}")
+
+        ivf, build_s = build(chunks, embeddings, index_type="ivf")
+        for nprobe in args.nprobe:
+            ivf.set_search_params(nprobe=nprobe)
+            ids, latency_ms = query_ids(ivf, queries, args.top_k)
+            print(f"{num_chunks:>8} {'ivf':>6} {'nprobe=' + str(nprobe):>12} {build_s:>8.2f} "
+                  f"{latency_ms:>9.3f} {recall_at_k(ids, exact_ids):>9.3f}")
+
+        hnsw, build_s = build(chunks, embeddings, index_type="hnsw")
+        for ef_search in args.ef_search:
+            hnsw.set_search_params(ef_search=ef_search)
+            ids, latency_ms = query_ids(hnsw, queries, args.top_k)
+            print(f"{num_chunks:>8} {'hnsw':>6} {'ef=' + str(ef_search):>12} {build_s:>8.2f} "
+                  f"{latency_ms:>9.3f} {recall_at_k(ids, exact_ids):>9.3f}")
+
+        auto = VectorStore().choose_index_type(num_chunks, embeddings.shape[1])
+        print(f"{num_chunks:>8} auto-selects: {auto}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# benchmarks/bench_llm_scheduler.py
+#
+# Quiz completeness and latency of QuestionGenerator against the local
+# fake endpoint, with and without the rate-limit-aware scheduler:
+#   burst   — the endpoint's request limit is smaller than a quiz, plus random 503s
+#   outage  — every request fails; shows how fast the circuit breaker gives up
+#
+# Usage (from the project root):
+#   python -m benchmarks.bench_llm_scheduler --questions 10 --quizzes 3
+
+import argparse
+import os
+import time
+
+from benchmarks.fake_llm_server import start_server
+from src.components.llm_scheduler import LLMScheduler, LLMUnavailableError
+
+CHUNKS = [
+    "Gradient descent updates parameters in the direction of the negative gradient. " * 6,
+    "The learning rate controls the step size of each gradient descent update. " * 6,
+    "Stochastic gradient descent estimates the gradient from a mini-batch. " * 6,
+]
+
+
+class DirectBackend:
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    def complete(self, **request):
+        return self.backend.complete(**request)
+
+
+def make_generator(base_url: str, scheduled: bool, rpm: float, window_s: float):
+    os.environ["GROQ_BASE_URL"] = base_url
+    os.environ.setdefault("GROQ_API_KEY", "fake")
+    os.environ["MCQ_LLM_BACKEND"] = "groq"
+    os.environ["MCQ_LLM_CACHE"] = "0"
+    from src.components.question_generator import QuestionGenerator
+
+    generator = QuestionGenerator(max_concurrency=4)
+    if scheduled:
+        # Budget matches the endpoint's limit, scaled to requests per minute
+        generator.scheduler = LLMScheduler(
+            generator.backend, requests_per_minute=rpm * 60 / window_s,
+            tokens_per_minute=1e9, base_delay=0.05, max_delay=window_s,
+            failure_threshold=5, reset_timeout=5.0
+        )
+    else:
+        # Previous behaviour: one attempt per request, failures drop the question
+        generator.scheduler = DirectBackend(generator.backend)
+    return generator
+
+
+def run_quizzes(generator, num_quizzes: int, num_questions: int):
+    sizes, seconds, failures = [], [], 0
+    for _ in range(num_quizzes):
+        start = time.perf_counter()
+        try:
+            sizes.append(len(generator.generate_mcqs(CHUNKS, "gradient descent", num_questions)))
+        except LLMUnavailableError:
+            failures += 1
+            sizes.append(0)
+        seconds.append(time.perf_counter() - start)
+    return sizes, seconds, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM scheduler benchmark against a fake endpoint")
+    parser.add_argument("--questions", type=int, default=10)
+    parser.add_argument("--quizzes", type=int, default=3)
+    parser.add_argument("--limit", type=int, default=6, help="Requests allowed per window")
+    parser.add_argument("--window", type=float, default=2.0, help="Rate limit window in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.1)
+    args = parser.parse_args()
+
+    print(f"{'scenario':>8} {'scheduler':>9} {'quiz sizes':>16} {'mean s':>7} {'failed':>6} {'429s':>5} {'5xx':>5}")
+    for scenario, error_rate in (("burst", args.error_rate), ("outage", 1.0)):
+        for scheduled in (False, True):
+            server, state, base_url = start_server(
+                rate_limit=args.limit, window_s=args.window,
+                error_rate=error_rate, latency_s=0.02
+            )
+            generator = make_generator(base_url, scheduled, args.limit, args.window)
+            sizes, seconds, failures = run_quizzes(generator, args.quizzes, args.questions)
+            server.shutdown()
+
+            print(f"{scenario:>8} {'on' if scheduled else 'off':>9} {str(sizes):>16} "
+                  f"{sum(seconds) / len(seconds):>7.2f} {failures:>6} "
+                  f"{state.counts['429']:>5} {state.counts['5xx']:>5}")
+
+
+if __name__ == "__main__":
+    main()
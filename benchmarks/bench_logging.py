@@ -0,0 +1,109 @@
+# benchmarks/bench_logging.py
+#
+# Latency cost of logging on the retrieval hot path. Each configuration
+# writes to a temporary directory:
+#   legacy_sync    plain FileHandler on the calling thread (the old basicConfig setup)
+#   sync           rotating key/value handler on the calling thread, no sampling
+#   async          queue + background writer thread, no sampling
+#   async_sampled  queue + writer thread with the default per-level sampling
+#   off            root level WARNING (floor: no INFO records at all)
+#
+# Reports the per-call cost of a hot-path log_event and p50/p99 retrieval
+# latency, plus how many lines reached the file.
+#
+# Usage (from the project root):
+#   python -m benchmarks.bench_logging --calls 50000 --queries 3000
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.synthetic_corpus import make_pages
+from src.components.retriever import Retriever
+from src.components.text_chunker import TextChunker
+from src.logger import logger as log_config
+from src.logger.logger import log_event
+
+TOPICS = ["gradient descent", "photosynthesis", "supply and demand", "sorting algorithms"]
+KEEP_ALL = {level: 1 for level in log_config.SAMPLE_EVERY}
+
+
+def configure(name: str, log_dir: str):
+    # Returns the handler to remove afterwards for configs set up here
+    if name == "legacy_sync":
+        log_config.configure_logging(log_dir, async_mode=False)
+        log_config.shutdown_logging()
+        handler = logging.FileHandler(os.path.join(log_dir, log_config.LOG_FILE))
+        handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(name)s - %(message)s"))
+        logging.getLogger().addHandler(handler)
+        return handler
+    elif name == "sync":
+        log_config.configure_logging(log_dir, async_mode=False, sample_every=KEEP_ALL)
+    elif name == "async":
+        log_config.configure_logging(log_dir, async_mode=True, sample_every=KEEP_ALL)
+    elif name == "async_sampled":
+        log_config.configure_logging(log_dir, async_mode=True)
+    else:
+        log_config.configure_logging(log_dir, async_mode=True, level=logging.WARNING)
+    return None
+
+
+def per_call_us(calls: int) -> float:
+    start = time.perf_counter()
+    for i in range(calls):
+        log_event(logging.INFO, "Retrieved chunks", sampled=True, query_chars=14, top_k=5, results=i)
+    return (time.perf_counter() - start) * 1e6 / calls
+
+
+def retrieval_latencies(retriever: Retriever, num_queries: int) -> np.ndarray:
+    latencies = np.empty(num_queries)
+    for i in range(num_queries):
+        start = time.perf_counter()
+        # Distinct queries so the query cache does not short-circuit the search
+        retriever.retrieve(f"{TOPICS[i % len(TOPICS)]} {i}", top_k=5)
+        latencies[i] = time.perf_counter() - start
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Logging overhead benchmark")
+    parser.add_argument("--calls", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=3000)
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--configs", nargs="+",
+                        default=["legacy_sync", "sync", "async", "async_sampled", "off"])
+    args = parser.parse_args()
+
+    chunks = TextChunker().split_text("\n".join(make_pages(args.pages)))
+    retriever = Retriever(query_cache_size=0)
+    retriever.index_chunks(chunks)
+    retrieval_latencies(retriever, 200)  # warm-up
+
+    print(f"{'config':>14} {'log call us':>12} {'retrieve p50 us':>16} "
+          f"{'p99 us':>9} {'mean us':>9} {'lines':>8} {'dropped':>8}")
+    for name in args.configs:
+        with tempfile.TemporaryDirectory() as log_dir:
+            extra_handler = configure(name, log_dir)
+            call_us = per_call_us(args.calls)
+            latencies = retrieval_latencies(retriever, args.queries) * 1e6
+            dropped = log_config.dropped_records()
+            if extra_handler is not None:
+                logging.getLogger().removeHandler(extra_handler)
+                extra_handler.close()
+            # Flush the writer thread before counting what reached disk
+            log_config.configure_logging(log_dir, async_mode=False, level=logging.WARNING)
+            with open(os.path.join(log_dir, log_config.LOG_FILE), encoding="utf-8") as f:
+                lines = sum(1 for _ in f)
+
+        print(f"{name:>14} {call_us:>12.2f} {np.percentile(latencies, 50):>16.1f} "
+              f"{np.percentile(latencies, 99):>9.1f} {latencies.mean():>9.1f} {lines:>8} {dropped:>8}")
+
+    log_config.configure_logging()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# benchmarks/bench_metrics.py
+#
+# Cost of the metrics layer: per-call overhead of timers and counters with
+# metrics disabled vs enabled, and end-to-end retrieval latency both ways.
+# Ends with the per-stage p50/p99 summary and a sample of the Prometheus
+# exposition from an instrumented pipeline run (simulated LLM).
+#
+# Usage (from the project root):
+#   python -m benchmarks.bench_metrics --calls 200000 --queries 2000
+
+import argparse
+import time
+
+from benchmarks.synthetic_corpus import make_pages
+from src.components.llm_backend import SimulatedBackend
+from src.components.llm_scheduler import LLMScheduler
+from src.pipeline.mcq_pipeline import MCQPipeline
+from src.utils import metrics
+
+TOPICS = ["gradient descent", "photosynthesis", "supply and demand", "sorting algorithms"]
+
+
+def per_call_ns(calls: int) -> dict:
+    start = time.perf_counter()
+    for _ in range(calls):
+        with metrics.timer("bench"):
+            pass
+    timer_ns = (time.perf_counter() - start) * 1e9 / calls
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        metrics.SEARCHES.inc()
+    counter_ns = (time.perf_counter() - start) * 1e9 / calls
+
+    return {"timer_ns": timer_ns, "counter_ns": counter_ns}
+
+
+def retrieval_us(pipeline: MCQPipeline, num_queries: int) -> float:
+    retriever = pipeline.retriever
+    start = time.perf_counter()
+    for i in range(num_queries):
+        # Distinct queries so the query cache does not short-circuit the search
+        retriever.retrieve(f"{TOPICS[i % len(TOPICS)]} {i}", top_k=5)
+    return (time.perf_counter() - start) * 1e6 / num_queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Metrics overhead benchmark")
+    parser.add_argument("--calls", type=int, default=200000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--pages", type=int, default=100)
+    args = parser.parse_args()
+
+    backend = SimulatedBackend(latency_s=0.01, latency_dist="lognormal", seed=0)
+    pipeline = MCQPipeline(use_index_cache=False, llm_backend=backend)
+    pipeline.question_generator.response_cache = None
+    pipeline.question_generator.scheduler = LLMScheduler(
+        backend, requests_per_minute=1e9, tokens_per_minute=1e12
+    )
+    pipeline.index_document("\n".join(make_pages(args.pages)))
+
+    metrics.disable()
+    retrieval_us(pipeline, args.queries)  # warm-up
+
+    print(f"{'metrics':>8} {'timer ns':>9} {'counter ns':>11} {'retrieve us':>12}")
+    for enabled in (False, True):
+        metrics.enable() if enabled else metrics.disable()
+        calls = per_call_ns(args.calls)
+        latency = retrieval_us(pipeline, args.queries)
+        print(f"{'on' if enabled else 'off':>8} {calls['timer_ns']:>9.0f} "
+              f"{calls['counter_ns']:>11.0f} {latency:>12.1f}")
+
+    # Instrumented run for the summary and exposition sample
+    metrics.reset()
+    metrics.enable()
+    pipeline.index_document("\n".join(make_pages(args.pages, seed=1)))
+    for topic in TOPICS:
+        pipeline.generate_mcqs(topic, num_questions=5)
+
+    print(f"\n{'stage':>20} {'count':>6} {'p50 ms':>8} {'p99 ms':>8}")
+    for stage, s in sorted(metrics.summary()["stages"].items()):
+        print(f"{stage:>20} {s['count']:>6} {s['p50'] * 1000:>8.2f} {s['p99'] * 1000:>8.2f}")
+
+    print("\n" + "\n".join(
+        line for line in metrics.render_prometheus().splitlines()
+        if line.startswith("mcq_llm") or line.startswith("mcq_chunks")
+    ))
+
+
+if __name__ == "__main__":
+    main()
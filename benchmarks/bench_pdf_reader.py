@@ -0,0 +1,64 @@
+# benchmarks/bench_pdf_reader.py
+#
+# Pages-per-second of extract_text_from_pdf at different worker counts.
+#
+# Usage (from the project root):
+#   python -m benchmarks.bench_pdf_reader
+#   python -m benchmarks.bench_pdf_reader --pdf path/to/textbook.pdf
+
+import argparse
+import os
+import tempfile
+import time
+
+from PyPDF2 import PdfReader
+
+from benchmarks.synthetic_corpus import make_pages, write_pdf
+from src.components.pdf_reader import extract_text_from_pdf
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parallel PDF extraction")
+    parser.add_argument("--pdf", help="PDF to benchmark (default: synthetic PDF)")
+    parser.add_argument("--pages", type=int, default=600, help="Pages in the synthetic PDF")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pdf_path = args.pdf
+    tmp_path = None
+    if pdf_path is None:
+        tmp_path = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf").name
+        write_pdf(tmp_path, make_pages(args.pages))
+        pdf_path = tmp_path
+
+    try:
+        num_pages = len(PdfReader(pdf_path).pages)
+        print(f"{pdf_path}: {num_pages} pages, {os.cpu_count()} CPUs")
+        print(f"{'workers':>8} {'best s':>10} {'pages/s':>10} {'speedup':>8}")
+
+        reference = None
+        serial_time = None
+        for workers in args.workers:
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                text = extract_text_from_pdf(pdf_path, num_workers=workers,
+                                             min_pages_for_parallel=0)
+                timings.append(time.perf_counter() - start)
+
+            if reference is None:
+                reference = text
+            elif text != reference:
+                raise AssertionError(f"Output with {workers} workers differs from serial")
+
+            best = min(timings)
+            serial_time = serial_time or best
+            print(f"{workers:>8} {best:>10.3f} {num_pages / best:>10.1f} {serial_time / best:>7.2f}x")
+    finally:
+        if tmp_path:
+            os.remove(tmp_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# benchmarks/bench_shared_resources.py
+#
+# Memory of many concurrent sessions working on a few documents, e.g. a
+# class of 30 students on 5 handouts. Each mode runs in a fresh process:
+#   per_session  every session owns its indexes (the old st.session_state setup)
+#   shared       sessions share indexes through one ResourceManager with a budget
+#
+# Sessions index their document concurrently, then every session asks a
+# few topic queries. Reports peak RSS, bytes held by indexes, index loads
+# (builds plus reloads of evicted indexes from the IndexCache), evictions
+# and query latency.
+#
+# Usage (from the project root):
+#   python -m benchmarks.bench_shared_resources --sessions 30 --documents 5 --budget-mb 64
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+TOPICS = ["gradient descent", "photosynthesis", "supply and demand", "sorting algorithms"]
+
+
+def run_mode(mode: str, args) -> dict:
+    # Imported here so the parent process stays small
+    from benchmarks.synthetic_corpus import make_pages
+    from src.components.index_cache import IndexCache
+    from src.components.llm_backend import SimulatedBackend
+    from src.components.question_generator import QuestionGenerator
+    from src.components.resource_manager import ResourceManager
+    from src.pipeline.mcq_pipeline import MCQPipeline
+
+    documents = ["\n".join(make_pages(args.pages, seed=i)) for i in range(args.documents)]
+    question_generator = QuestionGenerator(backend=SimulatedBackend(latency_s=0.0))
+    shared = ResourceManager(memory_budget_mb=args.budget_mb)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        sessions = []
+        for _ in range(args.sessions):
+            resources = shared if mode == "shared" else ResourceManager(memory_budget_mb=1e9)
+            pipeline = MCQPipeline(resources=resources, question_generator=question_generator,
+                                   use_index_cache=False)
+            if mode == "shared":
+                pipeline.index_cache = IndexCache(cache_dir=cache_dir)
+            sessions.append(pipeline)
+
+        start = time.perf_counter()
+        threads = [
+            threading.Thread(target=s.index_document, args=(documents[i % args.documents], "doc"))
+            for i, s in enumerate(sessions)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        index_s = time.perf_counter() - start
+
+        latencies = []
+        for round_ in range(args.rounds):
+            for i, session in enumerate(sessions):
+                query_start = time.perf_counter()
+                session.documents.search(f"{TOPICS[(i + round_) % len(TOPICS)]} {round_}", top_k=5,
+                                         doc_ids="doc")
+                latencies.append(time.perf_counter() - query_start)
+
+        managers = [shared] if mode == "shared" else [s.resources for s in sessions]
+        stats = [m.stats() for m in managers]
+
+    return {
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "index_mb": sum(s["bytes"] for s in stats) / 1e6,
+        "loads": sum(s["misses"] for s in stats),
+        "evictions": sum(s["evictions"] for s in stats),
+        "index_s": index_s,
+        "query_p50_ms": float(np.percentile(latencies, 50) * 1000),
+        "query_p99_ms": float(np.percentile(latencies, 99) * 1000),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shared index memory benchmark")
+    parser.add_argument("--sessions", type=int, default=30)
+    parser.add_argument("--documents", type=int, default=5)
+    parser.add_argument("--pages", type=int, default=100, help="Pages per document")
+    parser.add_argument("--rounds", type=int, default=3, help="Queries per session")
+    parser.add_argument("--budget-mb", type=float, default=64)
+    parser.add_argument("--mode", choices=["per_session", "shared"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args)))
+        return
+
+    print(f"{args.sessions} sessions, {args.documents} documents x {args.pages} pages, "
+          f"budget {args.budget_mb:g} MB")
+    print(f"{'mode':>12} {'peak RSS MB':>12} {'index MB':>9} {'loads':>7} {'evicted':>8} "
+          f"{'index s':>8} {'q p50 ms':>9} {'q p99 ms':>9}")
+    for mode in ("per_session", "shared"):
+        result = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_shared_resources", "--mode", mode,
+             *sys.argv[1:]],
+            capture_output=True, text=True, check=True,
+            env=dict(os.environ, MCQ_LLM_BACKEND="simulated")
+        )
+        r = json.loads(result.stdout.strip().splitlines()[-1])
+        print(f"{mode:>12} {r['peak_rss_mb']:>12.1f} {r['index_mb']:>9.1f} {r['loads']:>7} "
+              f"{r['evictions']:>8} {r['index_s']:>8.2f} {r['query_p50_ms']:>9.2f} "
+              f"{r['query_p99_ms']:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# benchmarks/bench_sparse_vs_dense.py
+#
+# Memory and latency of the sparse CSR retrieval path against the
+# dense FAISS path on large synthetic documents.
+#
+# Usage (from the project root):
+#   python -m benchmarks.bench_sparse_vs_dense --chunks 10000 50000
+
+import argparse
+import time
+import tracemalloc
+
+from benchmarks.synthetic_corpus import TOPICS, make_pages
+from src.components.text_chunker import TextChunker
+from src.components.retriever import Retriever
+
+
+def make_chunks(num_chunks: int) -> list:
+    chunker = TextChunker()
+    chunks = []
+    seed = 0
+    while len(chunks) < num_chunks:
+        chunks.extend(chunker.split_pages(make_pages(200, seed=seed)))
+        seed += 1
+    return chunks[:num_chunks]
+
+
+def index_bytes(retriever: Retriever) -> int:
+    store = retriever.vector_store
+    if retriever.index_mode == "sparse":
+        m = store.matrix
+        return m.data.nbytes + m.indices.nbytes + m.indptr.nbytes
+    return store.index.ntotal * store.dimension * 4
+
+
+def run(mode: str, chunks: list, queries: list, top_k: int) -> dict:
+    retriever = Retriever(index_mode=mode)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    retriever.index_chunks(chunks)
+    build_s = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    results = []
+    start = time.perf_counter()
+    for query in queries:
+        results.append(retriever.retrieve(query, top_k=top_k))
+    query_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    return {
+        "build_s": build_s,
+        "peak_mb": peak / 1e6,
+        "index_mb": index_bytes(retriever) / 1e6,
+        "query_ms": query_ms,
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sparse vs dense retrieval benchmark")
+    parser.add_argument("--chunks", type=int, nargs="+", default=[10000, 50000])
+    parser.add_argument("--top-k", type=int, default=5)
+    args = parser.parse_args()
+
+    queries = TOPICS * 10
+
+    print(f"{'chunks':>8} {'mode':>7} {'build s':>8} {'peak MB':>8} {'index MB':>9} {'query ms':>9} {'overlap':>8}")
+    for num_chunks in args.chunks:
+        chunks = make_chunks(num_chunks)
+        dense = run("dense", chunks, queries, args.top_k)
+        sparse = run("sparse", chunks, queries, args.top_k)
+
+        # Fraction of top-k chunks both paths agree on (ties may reorder)
+        overlap = sum(
+            len(set(d) & set(s)) for d, s in zip(dense["results"], sparse["results"])
+        ) / (len(queries) * args.top_k)
+
+        for mode, r in (("dense", dense), ("sparse", sparse)):
+            print(f"{num_chunks:>8} {mode:>7} {r['build_s']:>8.2f} {r['peak_mb']:>8.1f} "
+                  f"{r['index_mb']:>9.1f} {r['query_ms']:>9.3f} {overlap:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# benchmarks/bench_text_splitter.py
+#
+# Native TextChunker splitter vs LangChain's RecursiveCharacterTextSplitter.
+#
+#   equivalence  chunks must be identical: a lecture-notes PDF's text,
+#                the page stream (split_pages), several chunk_size /
+#                chunk_overlap settings and randomized texts full of
+#                separators, long words and whitespace. split_spans()
+#                offsets must slice out exactly the chunks.
+#   import       seconds to import TextChunker and split a paragraph,
+#                in fresh processes
+#   throughput   MB/s splitting the extracted text of a large PDF
+#
+# Exits 1 if any output differs, so it doubles as the equivalence check.
+#
+# Usage (from the project root):
+#   python -m benchmarks.bench_text_splitter --pages 1000 --fuzz 2000
+
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.synthetic_corpus import make_pages, write_pdf
+from src.components.pdf_reader import extract_text_from_pdf, iter_pdf_pages
+from src.components.text_chunker import TextChunker
+
+SETTINGS = [(500, 50), (200, 0), (1000, 200), (100, 100), (50, 10)]
+FUZZ_PIECES = ["word", "ab", " ", "  ", "\n", "\n\n", "\n\n\n", ".", "!", "?", ". ",
+               "\t", "x" * 40, "y" * 600, " \n ", "é"]
+
+IMPORT_SCRIPT = """
+import json, time
+start = time.perf_counter()
+from src.components.text_chunker import TextChunker
+TextChunker(engine={engine!r}).split_text("Gradient descent minimises a loss. " * 40)
+print(json.dumps(time.perf_counter() - start))
+"""
+
+
+def mismatches(text: str, chunk_size: int, chunk_overlap: int, separators=None) -> int:
+    native = TextChunker(chunk_size, chunk_overlap, separators, engine="native")
+    reference = TextChunker(chunk_size, chunk_overlap, separators, engine="langchain")
+    chunks = native._split(text)
+    spans = native.split_spans(text)
+    bad = chunks != reference._split(text)
+    bad |= [text[start:end] for start, end in spans] != chunks
+    return int(bad)
+
+
+def check_equivalence(text: str, pdf_path: str, fuzz: int) -> dict:
+    failures = {"document": 0, "pages": 0, "fuzz": 0}
+
+    for chunk_size, chunk_overlap in SETTINGS:
+        failures["document"] += mismatches(text, chunk_size, chunk_overlap)
+
+    native = list(TextChunker(engine="native").split_pages(iter_pdf_pages(pdf_path)))
+    reference = list(TextChunker(engine="langchain").split_pages(iter_pdf_pages(pdf_path)))
+    failures["pages"] += int(native != reference)
+
+    rng = random.Random(0)
+    for _ in range(fuzz):
+        sample = "".join(rng.choice(FUZZ_PIECES) for _ in range(rng.randint(0, 300)))
+        chunk_size = rng.choice([5, 20, 50, 100, 500])
+        separators = rng.choice([None, ["\n\n", "\n", " ", ""], [".", " "]])
+        failures["fuzz"] += mismatches(sample, chunk_size, rng.randint(0, chunk_size), separators)
+
+    return failures
+
+
+def import_seconds(engine: str, runs: int) -> float:
+    script = IMPORT_SCRIPT.format(engine=engine)
+    times = []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True,
+                                text=True, check=True, env=dict(os.environ, MCQ_METRICS="0"))
+        times.append(json.loads(result.stdout.strip().splitlines()[-1]))
+    return statistics.median(times)
+
+
+def throughput_mb_s(engine: str, text: str, repeat: int) -> tuple:
+    chunker = TextChunker(engine=engine)
+    chunker.split_text(text[:10000])  # warm-up (LangChain import)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        chunks = chunker.split_text(text)
+        best = min(best, time.perf_counter() - start)
+    return len(text.encode("utf-8")) / 1e6 / best, best, len(chunks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Native vs LangChain text splitter benchmark")
+    parser.add_argument("--pages", type=int, default=1000, help="Pages in the large PDF")
+    parser.add_argument("--fuzz", type=int, default=2000, help="Randomized equivalence cases")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh processes for import time")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of runs for throughput")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = os.path.join(tmp, "large.pdf")
+        write_pdf(pdf_path, make_pages(args.pages))
+        text = extract_text_from_pdf(pdf_path, num_workers=1)
+        failures = check_equivalence(text, pdf_path, args.fuzz)
+
+    print(f"equivalence: {failures['document']}/{len(SETTINGS)} document settings, "
+          f"{failures['pages']}/1 page stream, {failures['fuzz']}/{args.fuzz} fuzz cases differ")
+
+    print(f"{args.pages}-page PDF, {len(text.encode('utf-8')) / 1e6:.1f} MB of text")
+    print(f"{'engine':>10} {'import s':>9} {'split s':>8} {'MB/s':>7} {'chunks':>7}")
+    for engine in ("langchain", "native"):
+        mb_s, seconds, num_chunks = throughput_mb_s(engine, text, args.repeat)
+        print(f"{engine:>10} {import_seconds(engine, args.runs):>9.3f} {seconds:>8.3f} "
+              f"{mb_s:>7.1f} {num_chunks:>7}")
+
+    if any(failures.values()):
+        print("FAIL: native splitter output differs from LangChain")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+# benchmarks/fake_llm_server.py
+#
+# Local OpenAI-compatible chat endpoint that imitates Groq's failure modes:
+# a sliding-window request limit answered with 429 + Retry-After, random 5xx
+# errors and configurable latency. Replies are templated MCQ JSON (an array
+# when the prompt asks for one), so QuestionGenerator runs end to end with
+# no network access or API key.
+#
+# Usage (from the project root):
+#   python -m benchmarks.fake_llm_server --port 8765 --rpm 60 --error-rate 0.1
+#   GROQ_BASE_URL=http://127.0.0.1:8765 GROQ_API_KEY=fake streamlit run streamlit_app.py
+
+import argparse
+import json
+import random
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.components.llm_backend import SimulatedBackend
+
+CHAT_PATH = "/openai/v1/chat/completions"
+
+
+class FakeLLMState:
+
+    def __init__(self, rate_limit: int = 0, window_s: float = 60.0,
+                 error_rate: float = 0.0, latency_s: float = 0.05, seed: int = 0):
+        self.rate_limit = rate_limit
+        self.window_s = window_s
+        self.error_rate = error_rate
+        self.latency_s = latency_s
+        self.rng = random.Random(seed)
+        self.recent = deque()
+        self.lock = threading.Lock()
+        self.counts = {"ok": 0, "429": 0, "5xx": 0}
+        # Same templated MCQ JSON as the in-process simulated backend
+        self.renderer = SimulatedBackend(latency_s=0.0, latency_dist="fixed", seed=seed)
+
+    def admit(self):
+        """
+        Returns:
+            tuple: (status, retry_after_seconds or None)
+        """
+        with self.lock:
+            now = time.monotonic()
+            while self.recent and now - self.recent[0] >= self.window_s:
+                self.recent.popleft()
+
+            if self.rate_limit and len(self.recent) >= self.rate_limit:
+                self.counts["429"] += 1
+                return 429, self.window_s - (now - self.recent[0])
+
+            if self.rng.random() < self.error_rate:
+                self.counts["5xx"] += 1
+                return 503, None
+
+            self.recent.append(now)
+            self.counts["ok"] += 1
+            return 200, None
+
+
+def make_completion(state: FakeLLMState, prompt: str) -> dict:
+    content = state.renderer.render(prompt)
+
+    prompt_tokens = len(prompt) // 4 + 1
+    completion_tokens = len(content) // 4 + 1
+    return {
+        "id": "chatcmpl-fake",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": "fake",
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop"
+        }],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens
+        }
+    }
+
+
+def make_handler(state: FakeLLMState):
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status: int, body: dict, headers: dict = None):
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+
+            if self.path != CHAT_PATH:
+                self._send(404, {"error": {"message": "not found"}})
+                return
+
+            time.sleep(state.latency_s)
+            status, retry_after = state.admit()
+
+            if status == 429:
+                self._send(429, {"error": {"message": "rate limit exceeded", "type": "rate_limit"}},
+                           {"retry-after": f"{retry_after:.3f}"})
+            elif status != 200:
+                self._send(status, {"error": {"message": "upstream unavailable"}})
+            else:
+                prompt = "\n".join(m.get("content", "") for m in request.get("messages", []))
+                self._send(200, make_completion(state, prompt))
+
+    return Handler
+
+
+def start_server(port: int = 0, **state_params):
+    """
+    Start the fake endpoint on a background thread.
+
+    Returns:
+        tuple: (server, state, base_url) — call server.shutdown() to stop
+    """
+    state = FakeLLMState(**state_params)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(state))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake OpenAI-compatible LLM endpoint")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rpm", type=int, default=0, help="Requests per minute before 429s (0 = unlimited)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per response")
+    args = parser.parse_args()
+
+    server, _, base_url = start_server(
+        args.port, rate_limit=args.rpm, error_rate=args.error_rate, latency_s=args.latency
+    )
+    print(f"Fake LLM endpoint on {base_url} (GROQ_BASE_URL={base_url})")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+# benchmarks/run_benchmarks.py
+#
+# End-to-end benchmark suite for the RAG MCQ pipeline.
+#
+# Times every stage on synthetic textbooks of several sizes:
+#   pdf_extract_s     extract_text_from_pdf
+#   chunk_s           TextChunker.split_text
+#   embed_s           EmbeddingGenerator.generate_embeddings
+#   index_build_s     VectorStore.build_index
+#   search_ms         VectorStore.search (per query)
+#   retrieve_ms       Retriever.retrieve (per query, query cache off)
+#   generate_mcqs_s   MCQPipeline.generate_mcqs against the simulated LLM
+#
+# Results are written as JSON and compared with a stored baseline; a metric
+# slower than baseline * (1 + threshold) is a regression and the run exits 1.
+# Timings depend on the machine, so record the baseline on the machine that
+# runs the comparison (per-metric limits can be set under "thresholds").
+#
+# Usage (from the project root):
+#   python -m benchmarks.run_benchmarks                          # compare with benchmarks/baseline.json
+#   python -m benchmarks.run_benchmarks --pages 20 200 --threshold 0.5
+#   python -m benchmarks.run_benchmarks --save-baseline          # record a new baseline
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from benchmarks.synthetic_corpus import make_pages, write_pdf
+from src.components.pdf_reader import extract_text_from_pdf
+from src.components.text_chunker import TextChunker
+from src.components.embedding_generator import EmbeddingGenerator
+from src.components.vector_store import VectorStore
+from src.components.retriever import Retriever
+from src.components.llm_backend import SimulatedBackend
+from src.components.llm_scheduler import LLMScheduler
+from src.components.question_generator import QuestionGenerator
+from src.pipeline.mcq_pipeline import MCQPipeline
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+DEFAULT_OUTPUT = os.path.join(BENCH_DIR, "results", "latest.json")
+
+QUERIES = [
+    "gradient descent", "neural network layers", "photosynthesis", "supply and demand",
+    "world war", "sorting algorithms", "cell division", "market equilibrium",
+]
+
+
+def best_of(repeat: int, fn):
+    """
+    Run fn repeat times.
+
+    Returns:
+        tuple: (fastest wall time in seconds, result of the last run)
+    """
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def package_versions() -> dict:
+    versions = {}
+    for name in ("PyPDF2", "langchain", "faiss", "sklearn", "numpy"):
+        try:
+            module = __import__(name)
+            versions[name] = getattr(module, "__version__", "unknown")
+        except ImportError:
+            versions[name] = None
+    return versions
+
+
+def warm_up() -> None:
+    """
+    Pay the deferred imports (LangChain, scikit-learn, FAISS, SciPy) before
+    timing, so stage metrics do not depend on which stage runs first.
+    Start-up cost is measured separately by bench_import_time.
+    """
+    chunks = TextChunker().split_text("Warm up the lazily imported libraries. " * 40)
+    retriever = Retriever(query_cache_size=0)
+    retriever.index_chunks(chunks)
+    retriever.retrieve("warm up", top_k=1)
+
+
+def bench_size(num_pages: int, repeat: int, num_questions: int) -> dict:
+    pages = make_pages(num_pages)
+    metrics = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = os.path.join(tmp, "corpus.pdf")
+        write_pdf(pdf_path, pages)
+        metrics["pdf_extract_s"], text = best_of(repeat, lambda: extract_text_from_pdf(pdf_path))
+
+    chunker = TextChunker()
+    metrics["chunk_s"], chunks = best_of(repeat, lambda: chunker.split_text(text))
+    metrics["embed_s"], embeddings = best_of(repeat, lambda: EmbeddingGenerator().generate_embeddings(chunks))
+
+    def build():
+        store = VectorStore()
+        store.build_index(chunks, embeddings)
+        return store
+
+    metrics["index_build_s"], store = best_of(repeat, build)
+
+    query_vectors = [embeddings[i % len(embeddings)] for i in range(len(QUERIES))]
+    search_s, _ = best_of(repeat, lambda: [store.search(q, top_k=5) for q in query_vectors])
+    metrics["search_ms"] = search_s * 1000 / len(query_vectors)
+
+    retriever = Retriever(query_cache_size=0)
+    retriever.index_chunks(chunks)
+    retrieve_s, _ = best_of(repeat, lambda: [retriever.retrieve(q, top_k=5) for q in QUERIES])
+    metrics["retrieve_ms"] = retrieve_s * 1000 / len(QUERIES)
+
+    # Fixed simulated latency keeps the LLM share of the time constant
+    backend = SimulatedBackend(latency_s=0.02, latency_dist="fixed", seed=0)
+    pipeline = MCQPipeline(use_index_cache=False, llm_backend=backend)
+    pipeline.index_document(text)
+    pipeline.question_generator = QuestionGenerator(
+        max_concurrency=4, use_response_cache=False, backend=backend
+    )
+    pipeline.question_generator.scheduler = LLMScheduler(
+        backend, requests_per_minute=1e9, tokens_per_minute=1e12
+    )
+    metrics["generate_mcqs_s"], mcqs = best_of(
+        repeat, lambda: pipeline.generate_mcqs(QUERIES[0], num_questions=num_questions)
+    )
+
+    info = {"pages": num_pages, "chars": len(text), "chunks": len(chunks), "mcqs": len(mcqs)}
+    return {"info": info, "metrics": metrics}
+
+
+def compare(results: dict, baseline: dict, threshold: float, min_delta_ms: float) -> list:
+    """
+    Compare results with a baseline.
+
+    Args:
+        results (dict): Output of this run
+        baseline (dict): Stored baseline (may carry per-metric "thresholds")
+        threshold (float): Allowed fractional slowdown, e.g. 0.5 = 50%
+        min_delta_ms (float): Slowdowns smaller than this are noise
+
+    Returns:
+        list: (size, metric, baseline, current, ratio, regressed) rows
+    """
+    overrides = baseline.get("thresholds", {})
+    rows = []
+
+    for size, current in results["results"].items():
+        base = baseline.get("results", {}).get(size)
+        if base is None:
+            continue
+
+        for metric, value in current["metrics"].items():
+            if metric not in base["metrics"]:
+                continue
+            base_value = base["metrics"][metric]
+            ratio = value / base_value if base_value else float("inf")
+
+            delta_ms = (value - base_value) * (1 if metric.endswith("_ms") else 1000)
+            limit = 1 + overrides.get(metric, threshold)
+            regressed = ratio > limit and delta_ms > min_delta_ms
+            rows.append((size, metric, base_value, value, ratio, regressed))
+
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end RAG MCQ pipeline benchmarks")
+    parser.add_argument("--pages", type=int, nargs="+", default=[20, 100, 400],
+                        help="Synthetic document sizes in pages")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per stage (fastest is kept)")
+    parser.add_argument("--questions", type=int, default=5)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Where to write results JSON")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON to compare with")
+    parser.add_argument("--threshold", type=float, default=0.5,
+                        help="Allowed fractional slowdown before a metric counts as a regression")
+    parser.add_argument("--min-delta-ms", type=float, default=2.0,
+                        help="Ignore slowdowns smaller than this many milliseconds")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Write this run as the new baseline instead of comparing")
+    args = parser.parse_args()
+
+    results = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "packages": package_versions(),
+            "repeat": args.repeat,
+        },
+        "results": {},
+    }
+
+    warm_up()
+    for num_pages in args.pages:
+        print(f"Benchmarking {num_pages}-page document...", flush=True)
+        results["results"][f"{num_pages}_pages"] = bench_size(num_pages, args.repeat, args.questions)
+
+    print(f"\n{'size':>10} " + " ".join(f"{m:>15}" for m in next(iter(results["results"].values()))["metrics"]))
+    for size, entry in results["results"].items():
+        print(f"{size:>10} " + " ".join(f"{v:>15.4f}" for v in entry["metrics"].values()))
+
+    output = args.baseline if args.save_baseline else args.output
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    if args.save_baseline and os.path.exists(output):
+        # Keep hand-tuned per-metric thresholds when re-recording the baseline
+        with open(output) as f:
+            results["thresholds"] = json.load(f).get("thresholds", {})
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.save_baseline:
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline} — run with --save-baseline to record one")
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    rows = compare(results, baseline, args.threshold, args.min_delta_ms)
+    print(f"\n{'size':>10} {'metric':>16} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for size, metric, base_value, value, ratio, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{size:>10} {metric:>16} {base_value:>10.4f} {value:>10.4f} {ratio:>7.2f}{flag}")
+
+    regressions = [row for row in rows if row[5]]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over baseline")
+        sys.exit(1)
+    print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# benchmarks/synthetic_corpus.py
+
+# The page text generator lives with the tests, so both use the same corpus
+from tests.corpus import TOPICS, WORDS, make_paragraph, make_pages  # noqa: F401
+
+
+def _escape_pdf_text(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_pdf(path: str, pages: list, chars_per_line: int = 90) -> None:
+    """
+    Write page texts to a minimal, valid PDF that PyPDF2 can read.
+
+    Args:
+        path (str): Output file path
+        pages (list): Text of each page
+        chars_per_line (int): Characters per wrapped line
+    """
+    objects = []
+
+    def add(obj: bytes) -> int:
+        objects.append(obj)
+        return len(objects)
+
+    font_id = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    pages_id = add(b"")  # placeholder, filled once kids are known
+    page_ids = []
+
+    for text in pages:
+        lines = []
+        for paragraph in text.split("\n"):
+            while len(paragraph) > chars_per_line:
+                lines.append(paragraph[:chars_per_line])
+                paragraph = paragraph[chars_per_line:]
+            lines.append(paragraph)
+
+        stream = ["BT /F1 9 Tf 11 TL 40 800 Td"]
+        stream += [f"({_escape_pdf_text(line)}) '" for line in lines]
+        stream.append("ET")
+        content = "\n".join(stream).encode("latin-1", "replace")
+
+        content_id = add(
+            b"<< /Length " + str(len(content)).encode() + b" >>\nstream\n"
+            + content + b"\nendstream"
+        )
+        page_ids.append(add(
+            f"<< /Type /Page /Parent {pages_id} 0 R /MediaBox [0 0 612 842] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> "
+            f"/Contents {content_id} 0 R >>".encode()
+        ))
+
+    kids = " ".join(f"{pid} 0 R" for pid in page_ids)
+    objects[pages_id - 1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode()
+    catalog_id = add(f"<< /Type /Catalog /Pages {pages_id} 0 R >>".encode())
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + obj + b"\nendobj\n"
+
+    xref_offset = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root {catalog_id} 0 R >>\n"
+        f"startxref\n{xref_offset}\n%%EOF\n"
+    ).encode()
+
+    with open(path, "wb") as f:
+        f.write(out)
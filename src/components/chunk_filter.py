@@ -0,0 +1,335 @@
+# src/components/chunk_filter.py
+
+import os
+import re
+import sys
+import time
+import zlib
+from collections import Counter, deque
+
+import numpy as np
+
+from src.utils import metrics
+from src.logger.logger import logging
+from src.exception.custom_exception import CustomException
+
+# Estimated Jaccard similarity of word shingles at which a chunk counts
+# as a near-duplicate of an earlier chunk
+NEAR_DUPLICATE_THRESHOLD = float(os.getenv("MCQ_CHUNK_DEDUP_THRESHOLD", "0.7"))
+
+# Mersenne prime for the MinHash permutations (a * x + b) mod p
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+_DIGITS = re.compile(r"\d+")
+_WORDS = re.compile(r"\w+")
+
+
+class ChunkFilter:
+
+    def __init__(self, min_page_fraction: float = 0.5, min_pages: int = 3,
+                 max_line_chars: int = 100, sample_pages: int = 8, page_lines: int = 40,
+                 threshold: float = NEAR_DUPLICATE_THRESHOLD, shingle_size: int = 3,
+                 num_perm: int = 64, bands: int = 16, seed: int = 1):
+        """
+        Ingestion stage between text extraction and embedding that drops
+        text which would only bloat the index.
+
+        Boilerplate: short lines (running headers, footers, copyright
+        notices, slide titles) found on at least min_page_fraction of
+        the pages. Page numbers are ignored when comparing lines, so
+        "Page 3 of 40" and "Page 4 of 40" are the same line.
+
+        Near-duplicate chunks: each chunk gets a MinHash signature of its
+        word shingles; LSH banding finds earlier chunks that may be
+        similar, and a chunk is dropped when its estimated Jaccard
+        similarity to one of them reaches threshold. The first copy is kept.
+
+        min_page_fraction: Share of pages a line must appear on to be boilerplate
+        min_pages: Pages a line must appear on before it can be boilerplate
+        max_line_chars: Longer lines are always kept
+        sample_pages: Pages read ahead on a page stream before the first
+                      page is emitted, so boilerplate is known from the start
+        page_lines: Lines per pseudo-page when a text has no page breaks
+        threshold: Estimated Jaccard similarity of a near-duplicate chunk
+        shingle_size: Words per shingle
+        num_perm: MinHash permutations (signature length)
+        bands: LSH bands; num_perm / bands rows each
+        seed: Seed of the MinHash permutations
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+
+        self.min_page_fraction = min_page_fraction
+        self.min_pages = min_pages
+        self.max_line_chars = max_line_chars
+        self.sample_pages = sample_pages
+        self.page_lines = page_lines
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.num_perm = num_perm
+        self.bands = bands
+        self.seed = seed
+
+        rng = np.random.default_rng(seed)
+        # a * x stays below 2**63 for 32-bit shingle hashes, so uint64 never overflows
+        self._a = rng.integers(1, 1 << 31, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 31, size=num_perm, dtype=np.uint64)
+        self.reset_stats()
+
+    def get_settings(self) -> dict:
+        """
+        Returns:
+            dict: Settings that change which text is indexed (part of index cache keys)
+        """
+        return {
+            "min_page_fraction": self.min_page_fraction,
+            "min_pages": self.min_pages,
+            "max_line_chars": self.max_line_chars,
+            "page_lines": self.page_lines,
+            "threshold": self.threshold,
+            "shingle_size": self.shingle_size,
+            "num_perm": self.num_perm,
+            "bands": self.bands,
+            "seed": self.seed,
+            "shingle_hash": "crc32",
+        }
+
+    def reset_stats(self) -> None:
+        """
+        Start a new document: strip_boilerplate and drop_near_duplicates
+        add their counts and time to last_stats.
+        """
+        self.last_stats = {"pages": 0, "boilerplate_lines": 0, "chars_in": 0, "chars_out": 0,
+                           "chunks_in": 0, "chunks_out": 0, "seconds": 0.0}
+
+    # ------------------------------------------------------------------
+    # Boilerplate lines
+    # ------------------------------------------------------------------
+
+    def _line_key(self, line: str):
+        line = " ".join(line.split())
+        if not line or len(line) > self.max_line_chars:
+            return None
+        return _DIGITS.sub("#", line.lower())
+
+    def _page_keys(self, page_text: str) -> set:
+        return {key for key in map(self._line_key, page_text.splitlines()) if key}
+
+    def _is_boilerplate(self, key, counts: Counter, num_pages: int) -> bool:
+        if key is None:
+            return False
+        count = counts.get(key, 0)
+        return count >= self.min_pages and count >= self.min_page_fraction * num_pages
+
+    def _strip_page(self, page_text: str, counts: Counter, num_pages: int, stats: dict) -> str:
+        start = time.perf_counter()
+        kept = []
+        for line in page_text.splitlines():
+            if self._is_boilerplate(self._line_key(line), counts, num_pages):
+                stats["boilerplate_lines"] += 1
+            else:
+                kept.append(line)
+        stripped = "\n".join(kept)
+        stats["chars_out"] += len(stripped)
+        stats["seconds"] += time.perf_counter() - start
+        return stripped
+
+    def strip_boilerplate(self, pages):
+        """
+        Remove lines repeated across pages from a stream of page texts.
+
+        The first sample_pages pages are read ahead to learn the
+        boilerplate; after that each page is filtered as it arrives,
+        against line counts over all pages seen so far.
+
+        Args:
+            pages (iterable): Page texts in reading order
+
+        Yields:
+            str: Page text without boilerplate lines
+        """
+        try:
+            stats = self.last_stats
+            counts = Counter()
+            held = deque()
+            num_pages = 0
+            lines_before = stats["boilerplate_lines"]
+
+            for page_text in pages:
+                start = time.perf_counter()
+                page_text = page_text or ""
+                num_pages += 1
+                stats["pages"] += 1
+                stats["chars_in"] += len(page_text)
+                counts.update(self._page_keys(page_text))
+                held.append(page_text)
+                stats["seconds"] += time.perf_counter() - start
+
+                if num_pages < self.sample_pages:
+                    continue
+                while held:
+                    yield self._strip_page(held.popleft(), counts, num_pages, stats)
+
+            while held:
+                yield self._strip_page(held.popleft(), counts, num_pages, stats)
+
+            removed = stats["boilerplate_lines"] - lines_before
+            metrics.INGEST_DROPPED.inc(removed, kind="boilerplate_line")
+            logging.info(f"Removed {removed} boilerplate lines from {num_pages} pages")
+
+        except Exception as e:
+            logging.error("Error removing boilerplate lines")
+            raise CustomException(e, sys)
+
+    def _boundary_lines(self, lines: list, boilerplate: list) -> set:
+        # Line numbers in runs of at least two different boilerplate keys
+        # (blank lines in between allowed): where one page's footer meets
+        # the next page's header
+        found, run, keys = set(), [], set()
+        for number, line in enumerate(lines + [None]):
+            if line is not None and not line.strip() and run:
+                continue
+            if line is not None and boilerplate[number] is not None:
+                run.append(number)
+                keys.add(boilerplate[number])
+                continue
+            if len(keys) >= 2:
+                found.update(run)
+            run, keys = [], set()
+        return found
+
+    def _strip_unpaginated(self, text: str) -> str:
+        start = time.perf_counter()
+        stats = self.last_stats
+        lines = text.split("\n")
+        pages = ["\n".join(lines[i:i + self.page_lines])
+                 for i in range(0, len(lines), self.page_lines)]
+        counts = Counter()
+        for page_text in pages:
+            counts.update(self._page_keys(page_text))
+
+        keys = map(self._line_key, lines)
+        boilerplate = [key if self._is_boilerplate(key, counts, len(pages)) else None for key in keys]
+        removed = self._boundary_lines(lines, boilerplate)
+        stripped = "\n".join(line for number, line in enumerate(lines) if number not in removed)
+
+        stats["pages"] += len(pages)
+        stats["boilerplate_lines"] += len(removed)
+        stats["chars_in"] += len(text)
+        stats["chars_out"] += len(stripped)
+        stats["seconds"] += time.perf_counter() - start
+        metrics.INGEST_DROPPED.inc(len(removed), kind="boilerplate_line")
+        logging.info(f"Removed {len(removed)} boilerplate lines from text without page breaks")
+        return stripped
+
+    def strip_boilerplate_text(self, text: str) -> str:
+        """
+        Remove boilerplate from a whole document.
+
+        Pages are separated by form feeds ("\\f") when the text has them.
+        Otherwise (pasted text, extracted text joined with "\\n") page
+        boundaries are unknown, so stripping is stricter: lines are
+        counted over pseudo-pages of page_lines lines, and a line that
+        recurs in enough of them is only removed where it sits next to
+        another, different repeated line — the footer of one page
+        followed by the header of the next. A sentence or heading that
+        merely recurs in the body is kept, and texts shorter than
+        min_pages pseudo-pages are left as they are.
+
+        Args:
+            text (str): Document text
+
+        Returns:
+            str: Text without boilerplate lines
+        """
+        try:
+            if "\f" in text:
+                return "\n".join(self.strip_boilerplate(text.split("\f")))
+            return self._strip_unpaginated(text)
+
+        except Exception as e:
+            logging.error("Error removing boilerplate lines")
+            raise CustomException(e, sys)
+
+    # ------------------------------------------------------------------
+    # Near-duplicate chunks
+    # ------------------------------------------------------------------
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        MinHash signature of a text's word shingles.
+
+        Args:
+            text (str): Chunk text
+
+        Returns:
+            np.ndarray: num_perm uint64 minimum hash values
+        """
+        words = _WORDS.findall(text.lower())
+        k = min(self.shingle_size, len(words)) or 1
+        shingles = {" ".join(words[i:i + k]) for i in range(max(1, len(words) - k + 1))}
+        # crc32, not hash(): str hashes are salted per process, and the
+        # filtered chunk set is persisted in the IndexCache
+        hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles),
+                             dtype=np.uint64, count=len(shingles))
+        # All permutations of all shingles in one broadcast
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=0)
+
+    def drop_near_duplicates(self, chunks, key=None):
+        """
+        Drop chunks that nearly repeat an earlier chunk.
+
+        Only signatures and LSH buckets are kept, so this works on a
+        chunk stream without holding the chunks.
+
+        Args:
+            chunks (iterable): Chunk texts (or items) in document order
+            key (callable): Maps an item to its text; None if items are texts
+
+        Yields:
+            Items that are not near-duplicates of an earlier one
+        """
+        try:
+            stats = self.last_stats
+            rows = self.num_perm // self.bands
+            buckets = [{} for _ in range(self.bands)]  # band -> bucket key -> chunk numbers
+            signatures = []
+            dropped = 0
+
+            for chunk in chunks:
+                start = time.perf_counter()
+                stats["chunks_in"] += 1
+                sig = self.signature(chunk if key is None else key(chunk))
+                keys = [sig[band * rows:(band + 1) * rows].tobytes() for band in range(self.bands)]
+
+                candidates = set()
+                for band, bucket in enumerate(keys):
+                    candidates.update(buckets[band].get(bucket, ()))
+
+                if any(np.mean(signatures[c] == sig) >= self.threshold for c in candidates):
+                    dropped += 1
+                    stats["seconds"] += time.perf_counter() - start
+                    continue
+
+                number = len(signatures)
+                signatures.append(sig)
+                for band, bucket in enumerate(keys):
+                    buckets[band].setdefault(bucket, []).append(number)
+
+                stats["chunks_out"] += 1
+                stats["seconds"] += time.perf_counter() - start
+                yield chunk
+
+            metrics.INGEST_DROPPED.inc(dropped, kind="near_duplicate_chunk")
+            logging.info(
+                f"Dropped {dropped} near-duplicate chunks "
+                f"({stats['chunks_in']} -> {stats['chunks_out']}); "
+                f"{stats['chars_in']} -> {stats['chars_out']} chars after boilerplate removal, "
+                f"filtering took {stats['seconds']:.3f}s"
+            )
+
+        except Exception as e:
+            logging.error("Error dropping near-duplicate chunks")
+            raise CustomException(e, sys)
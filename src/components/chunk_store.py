@@ -0,0 +1,245 @@
+# src/components/chunk_store.py
+
+import os
+import sys
+import mmap
+import numpy as np
+
+CHUNKS_FILE = "chunks.bin"
+OFFSETS_FILE = "chunk_offsets.npy"
+PAGES_FILE = "chunk_pages.npy"
+
+
+class Chunk(str):
+
+    def __new__(cls, text: str, page: int = None):
+        """
+        Chunk text that remembers its source page. It is a plain str
+        everywhere else (embedding, prompts, caches).
+
+        text: Chunk text
+        page: 1-based page the chunk starts on (None if unknown)
+        """
+        chunk = super().__new__(cls, text)
+        chunk.page = page
+        return chunk
+
+    def __reduce__(self):
+        return Chunk, (str(self), self.page)
+
+
+def _offset_dtype(buffer_len: int) -> str:
+    return "int32" if buffer_len < 2 ** 31 else "int64"
+
+
+class ChunkStore:
+
+    def __init__(self, buffer, starts, ends, pages=None):
+        """
+        List-like chunk storage: (start, end, page) integer arrays into
+        one document buffer. Overlapping chunks share their characters in
+        the buffer instead of each holding a copy, and there is no
+        per-chunk string object until a chunk is read — chunk i is
+        materialized as buffer[starts[i]:ends[i]] on access.
+
+        buffer: Document text (str, offsets in characters) or UTF-8
+                bytes / mmap (offsets in bytes, decoded on access)
+        starts: Start offset of each chunk
+        ends: End offset of each chunk
+        pages: 1-based page each chunk starts on (0 = unknown)
+        """
+        self.buffer = buffer
+        self.starts = np.asarray(starts)
+        self.ends = np.asarray(ends)
+        self.pages = np.zeros(len(self.starts), dtype="int32") if pages is None else np.asarray(pages)
+        self._is_text = isinstance(buffer, str)
+
+    @classmethod
+    def from_texts(cls, texts) -> "ChunkStore":
+        """
+        Store separate chunk texts back to back (no shared overlap).
+        Pages are kept for Chunk objects.
+
+        Args:
+            texts (iterable): Chunk texts
+
+        Returns:
+            ChunkStore: Store holding the texts in order
+        """
+        texts = list(texts)
+        lengths = np.fromiter((len(t) for t in texts), dtype="int64", count=len(texts))
+        ends = np.cumsum(lengths)
+        dtype = _offset_dtype(int(ends[-1]) if len(ends) else 0)
+        pages = np.fromiter((getattr(t, "page", None) or 0 for t in texts), dtype="int32", count=len(texts))
+        return cls("".join(texts), (ends - lengths).astype(dtype), ends.astype(dtype), pages)
+
+    @classmethod
+    def from_spans(cls, text: str, spans: list, pages=None) -> "ChunkStore":
+        """
+        Args:
+            text (str): Document text the spans point into
+            spans (list): (start, end) character offsets of each chunk
+            pages (list): 1-based page of each chunk (None = unknown)
+
+        Returns:
+            ChunkStore: Store over text
+        """
+        dtype = _offset_dtype(len(text))
+        bounds = np.array(spans, dtype=dtype).reshape(-1, 2)
+        return cls(text, bounds[:, 0].copy(), bounds[:, 1].copy(),
+                   None if pages is None else np.asarray(pages, dtype="int32"))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def _get(self, i: int) -> Chunk:
+        text = self.buffer[self.starts[i]:self.ends[i]]
+        if not self._is_text:
+            text = text.decode("utf-8")
+        return Chunk(text, self.pages[i].item() or None)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._get(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("chunk index out of range")
+        return self._get(i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._get(i)
+
+    def page(self, i: int):
+        """
+        Returns:
+            int: 1-based page chunk i starts on, or None if unknown
+        """
+        return int(self.pages[i]) or None
+
+    def take(self, indices) -> "ChunkStore":
+        """
+        Keep only some chunks; the buffer is shared, not copied.
+
+        Args:
+            indices (list): Chunk numbers to keep, in order
+
+        Returns:
+            ChunkStore: Store over the same buffer
+        """
+        indices = np.asarray(indices, dtype="int64")
+        return ChunkStore(self.buffer, self.starts[indices], self.ends[indices], self.pages[indices])
+
+    def concat(self, chunks) -> "ChunkStore":
+        """
+        Return a new store with chunks appended. Stores are never
+        modified in place, since an index may be shared between sessions.
+
+        Args:
+            chunks (ChunkStore | list): Chunks to append
+
+        Returns:
+            ChunkStore: Combined store
+        """
+        other = chunks if isinstance(chunks, ChunkStore) else ChunkStore.from_texts(chunks)
+        if not (self._is_text and other._is_text):
+            # Byte-offset (loaded) stores are re-stored as text
+            return ChunkStore.from_texts(list(self) + list(other))
+
+        shift = len(self.buffer)
+        dtype = _offset_dtype(shift + len(other.buffer))
+        return ChunkStore(
+            self.buffer + other.buffer,
+            np.concatenate([self.starts.astype(dtype), (other.starts + shift).astype(dtype)]),
+            np.concatenate([self.ends.astype(dtype), (other.ends + shift).astype(dtype)]),
+            np.concatenate([self.pages, other.pages]).astype("int32"),
+        )
+
+    def nbytes(self) -> int:
+        """
+        Returns:
+            int: Bytes held by the buffer and offset arrays (a mapped
+                 buffer is counted at its mapped size)
+        """
+        buffer_bytes = sys.getsizeof(self.buffer) if self._is_text else len(self.buffer)
+        return buffer_bytes + self.starts.nbytes + self.ends.nbytes + self.pages.nbytes
+
+    def _byte_offsets(self) -> tuple:
+        # UTF-8 buffer plus the byte offset of every chunk boundary
+        data = self.buffer.encode("utf-8")
+        if len(data) == len(self.buffer):  # ASCII: characters are bytes
+            return data, self.starts, self.ends
+
+        points = np.unique(np.concatenate([[0], self.starts, self.ends]))
+        byte_points = np.zeros(len(points), dtype="int64")
+        for k in range(1, len(points)):
+            piece = self.buffer[int(points[k - 1]):int(points[k])]
+            byte_points[k] = byte_points[k - 1] + len(piece.encode("utf-8"))
+        return (data,
+                byte_points[np.searchsorted(points, self.starts)],
+                byte_points[np.searchsorted(points, self.ends)])
+
+    def save(self, directory: str) -> None:
+        """
+        Write the buffer as UTF-8 plus (start, end) byte offsets and pages,
+        so load(memory_map=True) can map it instead of building strings.
+
+        Args:
+            directory (str): Target directory
+        """
+        if self._is_text:
+            data, starts, ends = self._byte_offsets()
+        else:
+            data, starts, ends = self.buffer, self.starts, self.ends
+
+        with open(os.path.join(directory, CHUNKS_FILE), "wb") as f:
+            f.write(data)
+        np.save(os.path.join(directory, OFFSETS_FILE),
+                np.stack([np.asarray(starts, dtype="int64"), np.asarray(ends, dtype="int64")], axis=1))
+        np.save(os.path.join(directory, PAGES_FILE), self.pages.astype("int32"))
+
+    @classmethod
+    def load(cls, directory: str, memory_map: bool = True) -> "ChunkStore":
+        """
+        Read a store written by save(). Stores saved as consecutive
+        chunk texts (a 1-D offsets array, no pages) are read as well.
+
+        Args:
+            directory (str): Directory written by save()
+            memory_map (bool): Map the buffer read-only (shared through the
+                               OS page cache) instead of reading it into RAM
+
+        Returns:
+            ChunkStore: Store with byte offsets
+        """
+        mmap_mode = "r" if memory_map else None
+        offsets = np.load(os.path.join(directory, OFFSETS_FILE), mmap_mode=mmap_mode)
+        if offsets.ndim == 1:
+            starts, ends = offsets[:-1], offsets[1:]
+        else:
+            starts, ends = offsets[:, 0], offsets[:, 1]
+
+        pages_path = os.path.join(directory, PAGES_FILE)
+        pages = np.load(pages_path, mmap_mode=mmap_mode) if os.path.exists(pages_path) else None
+
+        path = os.path.join(directory, CHUNKS_FILE)
+        with open(path, "rb") as f:
+            if not memory_map:
+                buffer = f.read()
+            elif os.fstat(f.fileno()).st_size:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                buffer = b""  # mmap cannot map an empty file
+        return cls(buffer, starts, ends, pages)
+
+
+def as_chunk_store(chunks) -> ChunkStore:
+    """
+    Args:
+        chunks (ChunkStore | list): Chunks from a chunker or caller
+
+    Returns:
+        ChunkStore: chunks itself, or a store holding the texts
+    """
+    return chunks if isinstance(chunks, ChunkStore) else ChunkStore.from_texts(chunks)
@@ -0,0 +1,227 @@
+# src/components/document_registry.py
+
+import sys
+import heapq
+import weakref
+import threading
+
+from src.logger.logger import logging
+from src.exception.custom_exception import CustomException
+
+
+class SharedIndexRef:
+
+    __slots__ = ("key", "loader", "owned", "pinned")
+
+    def __init__(self, key: str, loader=None, owned: bool = False, pinned: bool = False):
+        """
+        A document's handle on an index held by the ResourceManager.
+
+        key: ResourceManager key of the index
+        loader: Rebuilds the index after eviction (None = cannot reload)
+        owned: The index is private to this registry and is dropped
+               from the manager when the document is removed
+        pinned: This handle holds one ResourceManager pin on the index,
+                released when the document is replaced or removed
+        """
+        self.key = key
+        self.loader = loader
+        self.owned = owned
+        self.pinned = pinned
+
+
+def _release_all(resources, entries: dict) -> None:
+    # Runs when a registry is garbage collected (its session ended):
+    # give back the pins and private indexes it still holds
+    for entry in list(entries.values()):
+        if isinstance(entry, SharedIndexRef):
+            if entry.pinned:
+                resources.unpin(entry.key)
+            if entry.owned:
+                resources.remove(entry.key)
+
+
+class DocumentRegistry:
+
+    def __init__(self, resources=None):
+        """
+        Registry of named document indexes.
+
+        Each document ID maps to its own Retriever, so indexing one
+        document never replaces another, and a search filtered to some
+        documents only touches those documents' vectors.
+
+        resources: ResourceManager holding indexes registered with
+                   register_shared(); this registry then keeps only keys
+        """
+        self._retrievers = {}  # doc_id -> Retriever or SharedIndexRef
+        self._lock = threading.Lock()
+        self.resources = resources
+        if resources is not None:
+            weakref.finalize(self, _release_all, resources, self._retrievers)
+
+    def register(self, doc_id: str, retriever) -> None:
+        """
+        Add or replace the index for a document.
+        The old index keeps serving until the new one is swapped in.
+
+        Args:
+            doc_id (str): Document ID e.g. "pdf" or a file name
+            retriever (Retriever): Retriever with a built index
+        """
+        self._set(doc_id, retriever)
+        logging.info(f"Registered document index: {doc_id}")
+
+    def register_shared(self, doc_id: str, key: str, loader=None, owned: bool = False,
+                        pinned: bool = False) -> None:
+        """
+        Point a document at an index held by the ResourceManager.
+
+        An index without a loader cannot come back once evicted, so it
+        must be pinned: pass pinned=True when the caller already took the
+        pin (ResourceManager.put / get_or_load with pin=True), otherwise
+        the pin is taken here.
+
+        Args:
+            doc_id (str): Document ID
+            key (str): ResourceManager key of the index
+            loader (callable): Reloads the index if it was evicted
+            owned (bool): Drop the index from the manager when replaced or removed
+            pinned (bool): The caller holds a pin that this document takes over
+        """
+        if loader is None and not pinned:
+            self.resources.pin(key)
+            pinned = True
+        self._set(doc_id, SharedIndexRef(key, loader, owned, pinned))
+        logging.info(f"Registered shared document index: {doc_id}")
+
+    def _set(self, doc_id: str, entry) -> None:
+        with self._lock:
+            old = self._retrievers.get(doc_id)
+            self._retrievers[doc_id] = entry
+        self._release(old, entry)
+
+    def _release(self, old, new=None) -> None:
+        if not isinstance(old, SharedIndexRef):
+            return
+        if old.pinned:
+            self.resources.unpin(old.key)
+        if old.owned:
+            if not (isinstance(new, SharedIndexRef) and new.key == old.key):
+                self.resources.remove(old.key)
+
+    def remove(self, doc_id: str) -> bool:
+        """
+        Drop a document's index.
+
+        Args:
+            doc_id (str): Document ID
+
+        Returns:
+            bool: True if the document was registered
+        """
+        with self._lock:
+            old = self._retrievers.pop(doc_id, None)
+        if old is not None:
+            self._release(old)
+            logging.info(f"Removed document index: {doc_id}")
+        return old is not None
+
+    def _lookup(self, entry):
+        if not isinstance(entry, SharedIndexRef):
+            return entry
+        if entry.loader is None:
+            retriever = self.resources.get(entry.key)
+        else:
+            retriever = self.resources.get_or_load(entry.key, entry.loader)
+        if retriever is None:
+            logging.warning(f"Shared index {entry.key[:12]} was evicted and cannot be reloaded")
+        return retriever
+
+    def get(self, doc_id: str):
+        """
+        Args:
+            doc_id (str): Document ID
+
+        Returns:
+            Retriever: The document's retriever, or None if not registered
+            (or if its shared index was evicted and cannot be reloaded)
+        """
+        return self._lookup(self._retrievers.get(doc_id))
+
+    def get_ref(self, doc_id: str):
+        """
+        Args:
+            doc_id (str): Document ID
+
+        Returns:
+            SharedIndexRef: The document's handle, or None if it is not a shared index
+        """
+        entry = self._retrievers.get(doc_id)
+        return entry if isinstance(entry, SharedIndexRef) else None
+
+    def doc_ids(self) -> list:
+        """
+        Returns:
+            list: IDs of all documents with a ready index
+        """
+        return [doc_id for doc_id, _ in self._resolve(list(self._retrievers), warn=False)]
+
+    def _resolve(self, doc_ids, warn: bool = True) -> list:
+        """
+        Turn a document filter into (doc_id, retriever) pairs.
+        None means every registered document.
+        """
+        if doc_ids is None:
+            doc_ids = list(self._retrievers)
+            warn = False
+        elif isinstance(doc_ids, str):
+            doc_ids = [doc_ids]
+
+        resolved = []
+        for doc_id in doc_ids:
+            retriever = self.get(doc_id)
+            if retriever is None or not retriever.is_ready():
+                if warn:
+                    logging.warning(f"Document not indexed: {doc_id}")
+                continue
+            resolved.append((doc_id, retriever))
+        return resolved
+
+    def is_ready(self, doc_ids=None) -> bool:
+        """
+        Check if at least one document matching the filter is indexed.
+
+        Args:
+            doc_ids (str | list | None): Document filter (None = all)
+
+        Returns:
+            bool: True if a matching index is ready
+        """
+        return len(self._resolve(doc_ids)) > 0
+
+    def search(self, query: str, top_k: int = 5, doc_ids=None) -> list:
+        """
+        Retrieve the top-k chunks for a query across the filtered documents.
+        Only the filtered documents' indexes are searched; their
+        results are merged by similarity score.
+
+        Args:
+            query (str): User's topic query
+            top_k (int): Number of chunks to return
+            doc_ids (str | list | None): Document filter (None = all)
+
+        Returns:
+            list: (doc_id, chunk, score) tuples, best first
+        """
+        try:
+            results = []
+            for doc_id, retriever in self._resolve(doc_ids):
+                for chunk, score in retriever.retrieve_with_scores(query, top_k=top_k):
+                    results.append((doc_id, chunk, score))
+
+            return heapq.nlargest(top_k, results, key=lambda r: r[2])
+
+        except Exception as e:
+            logging.error("Error searching document registry")
+            raise CustomException(e, sys)
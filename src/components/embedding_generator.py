@@ -1,13 +1,17 @@
 # src/components/embedding_generator.py
 
 import sys
+import pickle
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.preprocessing import normalize
 
-from src.logger.logger import logging
+from src.utils.lazy_import import lazy_import
+from src.logger.logger import logging, log_event
 from src.exception.custom_exception import CustomException
 
+# scikit-learn takes about a second to import — load it on first use
+sklearn_text = lazy_import("sklearn.feature_extraction.text")
+sklearn_preprocessing = lazy_import("sklearn.preprocessing")
+
 
 class EmbeddingGenerator:
 
@@ -16,14 +20,25 @@ class EmbeddingGenerator:
         TF-IDF based embeddings — no torch, no onnx, no DLL issues.
         Pure Python + scikit-learn only.
         """
-        self.vectorizer = TfidfVectorizer(
-            max_features=512,
-            stop_words="english",
-            ngram_range=(1, 2)
-        )
+        self._vectorizer = None
         self.is_fitted = False
         logging.info("TF-IDF EmbeddingGenerator initialized")
 
+    @property
+    def vectorizer(self):
+        # Built on first use so constructing the generator does not import scikit-learn
+        if self._vectorizer is None:
+            self._vectorizer = sklearn_text.TfidfVectorizer(
+                max_features=512,
+                stop_words="english",
+                ngram_range=(1, 2)
+            )
+        return self._vectorizer
+
+    @vectorizer.setter
+    def vectorizer(self, vectorizer) -> None:
+        self._vectorizer = vectorizer
+
     def generate_embeddings(self, chunks: list) -> np.ndarray:
         """
         Convert list of text chunks into TF-IDF vectors.
@@ -41,7 +56,7 @@ class EmbeddingGenerator:
                 return np.array([])
 
             embeddings = self.vectorizer.fit_transform(chunks).toarray()
-            embeddings = normalize(embeddings, norm="l2")
+            embeddings = sklearn_preprocessing.normalize(embeddings, norm="l2")
             self.is_fitted = True
 
             logging.info(f"Generated {len(embeddings)} embeddings successfully")
@@ -51,6 +66,81 @@ class EmbeddingGenerator:
             logging.error("Error generating embeddings")
             raise CustomException(e, sys)
 
+    def reset(self) -> None:
+        """
+        Mark the vectorizer as unfitted (used when a new document replaces the index).
+        """
+        self.is_fitted = False
+
+    def fit(self, chunks: list) -> None:
+        """
+        Learn the TF-IDF vocabulary from all chunks without
+        producing the dense embedding matrix.
+
+        Args:
+            chunks (list): List of text chunks
+        """
+        try:
+            logging.info(f"Fitting TF-IDF vectorizer on {len(chunks)} chunks")
+
+            self.vectorizer.fit(chunks)
+            self.is_fitted = True
+
+        except Exception as e:
+            logging.error("Error fitting TF-IDF vectorizer")
+            raise CustomException(e, sys)
+
+    def generate_embedding_batches(self, chunks: list, batch_size: int = 1024):
+        """
+        Lazily convert chunks into TF-IDF vectors, one batch at a time.
+        Only one dense batch exists at once, so peak memory is set by
+        batch_size instead of the number of chunks. Call fit() first.
+
+        Args:
+            chunks (list): List of text chunks
+            batch_size (int): Chunks per yielded batch
+
+        Yields:
+            np.ndarray: float32 embedding vectors for the next batch
+        """
+        try:
+            if not self.is_fitted:
+                self.fit(chunks)
+
+            for start in range(0, len(chunks), batch_size):
+                batch = self.vectorizer.transform(chunks[start:start + batch_size])
+                batch = sklearn_preprocessing.normalize(batch, norm="l2").toarray()
+                yield batch.astype("float32", copy=False)
+
+        except Exception as e:
+            logging.error("Error generating embedding batches")
+            raise CustomException(e, sys)
+
+    def generate_incremental_embeddings(self, chunks: list, sparse: bool = False):
+        """
+        Embed chunks being appended to an existing index.
+        The fitted vocabulary and IDF are frozen, so terms unseen at
+        fit time are ignored; use HashingEmbeddingGenerator when new
+        text should also update the statistics.
+
+        Args:
+            chunks (list): New text chunks
+            sparse (bool): Return CSR rows instead of a dense array
+
+        Returns:
+            np.ndarray | scipy.sparse.csr_matrix: L2-normalized float32 vectors
+        """
+        try:
+            if not self.is_fitted:
+                raise ValueError("Vectorizer must be fitted before adding chunks")
+
+            embeddings = self.vectorizer.transform(chunks).astype("float32", copy=False)
+            return embeddings if sparse else embeddings.toarray()
+
+        except Exception as e:
+            logging.error("Error generating incremental embeddings")
+            raise CustomException(e, sys)
+
     def generate_single_embedding(self, text: str) -> np.ndarray:
         """
         Convert a single query into a TF-IDF vector.
@@ -62,18 +152,148 @@ class EmbeddingGenerator:
             np.ndarray: Embedding vector
         """
         try:
-            logging.info(f"Generating embedding for query: {text[:50]}")
-
             if not self.is_fitted:
                 logging.warning("Vectorizer not fitted yet")
                 return np.zeros(512, dtype="float32")
 
             embedding = self.vectorizer.transform([text]).toarray()
-            embedding = normalize(embedding, norm="l2")
+            embedding = sklearn_preprocessing.normalize(embedding, norm="l2")
 
-            logging.info("Query embedding generated successfully")
+            log_event(logging.INFO, "Query embedding generated", sampled=True,
+                      query_chars=len(text))
             return embedding[0].astype("float32")
 
         except Exception as e:
             logging.error("Error generating query embedding")
-            raise CustomException(e, sys)
\ No newline at end of file
+            raise CustomException(e, sys)
+
+    def generate_query_embeddings(self, texts: list, sparse: bool = False):
+        """
+        Convert many queries into TF-IDF vectors with one transform call.
+
+        Args:
+            texts (list): Topic queries
+            sparse (bool): Return CSR rows instead of a dense array
+
+        Returns:
+            np.ndarray | scipy.sparse.csr_matrix: L2-normalized float32 rows, one per query
+        """
+        try:
+            logging.info(f"Generating embeddings for {len(texts)} queries")
+
+            if not self.is_fitted:
+                logging.warning("Vectorizer not fitted yet")
+                return None
+
+            # TfidfVectorizer output rows are already unit length
+            embeddings = self.vectorizer.transform(texts).astype("float32", copy=False)
+            return embeddings if sparse else embeddings.toarray()
+
+        except Exception as e:
+            logging.error("Error generating query embeddings")
+            raise CustomException(e, sys)
+
+    def generate_sparse_embeddings(self, chunks: list):
+        """
+        Convert chunks into a sparse CSR TF-IDF matrix.
+        TfidfVectorizer already L2-normalizes its rows, so the
+        matrix is returned as produced — no densifying, no renormalizing.
+
+        Args:
+            chunks (list): List of text chunks
+
+        Returns:
+            scipy.sparse.csr_matrix: One L2-normalized row per chunk
+        """
+        try:
+            logging.info(f"Generating sparse TF-IDF embeddings for {len(chunks)} chunks")
+
+            embeddings = self.vectorizer.fit_transform(chunks)
+            self.is_fitted = True
+
+            logging.info(f"Generated sparse embeddings with {embeddings.nnz} non-zeros")
+            return embeddings.astype("float32", copy=False)
+
+        except Exception as e:
+            logging.error("Error generating sparse embeddings")
+            raise CustomException(e, sys)
+
+    def generate_single_sparse_embedding(self, text: str):
+        """
+        Convert a single query into a sparse 1 x n_features TF-IDF row.
+
+        Args:
+            text (str): User's topic query
+
+        Returns:
+            scipy.sparse.csr_matrix: L2-normalized query row
+        """
+        try:
+            if not self.is_fitted:
+                logging.warning("Vectorizer not fitted yet")
+                return None
+
+            return self.vectorizer.transform([text]).astype("float32", copy=False)
+
+        except Exception as e:
+            logging.error("Error generating sparse query embedding")
+            raise CustomException(e, sys)
+
+    def get_settings(self) -> dict:
+        """
+        Vectorizer settings that determine the embeddings.
+        Used to key cached indexes so a settings change never
+        reuses vectors produced by a different configuration.
+
+        Returns:
+            dict: JSON-serializable vectorizer parameters
+        """
+        return {
+            "type": type(self.vectorizer).__name__,
+            "params": {k: repr(v) for k, v in sorted(self.vectorizer.get_params().items())}
+        }
+
+    def memory_bytes(self) -> int:
+        """
+        Approximate memory held by the fitted vocabulary and IDF weights.
+
+        Returns:
+            int: Bytes
+        """
+        vocabulary = getattr(self._vectorizer, "vocabulary_", None)
+        if not vocabulary:
+            return 0
+        # dict slot + term string + int index per vocabulary entry
+        terms = sum(sys.getsizeof(term) for term in vocabulary)
+        return sys.getsizeof(vocabulary) + terms + 28 * len(vocabulary) + 8 * len(vocabulary)
+
+    def save(self, file_path: str) -> None:
+        """
+        Persist the fitted vectorizer.
+
+        Args:
+            file_path (str): Target file path
+        """
+        try:
+            with open(file_path, "wb") as f:
+                pickle.dump(self.vectorizer, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        except Exception as e:
+            logging.error("Error saving vectorizer")
+            raise CustomException(e, sys)
+
+    def load(self, file_path: str) -> None:
+        """
+        Load a fitted vectorizer saved with save().
+
+        Args:
+            file_path (str): File written by save()
+        """
+        try:
+            with open(file_path, "rb") as f:
+                self.vectorizer = pickle.load(f)
+            self.is_fitted = True
+
+        except Exception as e:
+            logging.error("Error loading vectorizer")
+            raise CustomException(e, sys)
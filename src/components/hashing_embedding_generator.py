@@ -0,0 +1,292 @@
+# src/components/hashing_embedding_generator.py
+
+import sys
+import pickle
+import numpy as np
+
+from src.utils.lazy_import import lazy_import
+from src.logger.logger import logging
+from src.exception.custom_exception import CustomException
+
+# scikit-learn takes about a second to import — load it on first use
+sklearn_text = lazy_import("sklearn.feature_extraction.text")
+sklearn_preprocessing = lazy_import("sklearn.preprocessing")
+
+
+class HashingEmbeddingGenerator:
+
+    def __init__(self, n_features: int = 1024):
+        """
+        Fit-free TF-IDF embeddings for incremental indexing.
+
+        Terms are hashed into a fixed number of features, so the vector
+        space never changes and new text can be embedded without touching
+        existing vectors. IDF is kept as running document-frequency
+        counts that grow as chunks are added. Vectors already in an index
+        keep the IDF that was current when they were added; queries always
+        use the latest statistics.
+
+        n_features: Fixed embedding dimension
+        """
+        self.n_features = n_features
+        self._vectorizer = None
+        self.doc_freq = np.zeros(n_features, dtype="int64")
+        self.num_docs = 0
+        self.is_fitted = False
+        logging.info(f"Hashing EmbeddingGenerator initialized with {n_features} features")
+
+    @property
+    def vectorizer(self):
+        # Built on first use so constructing the generator does not import scikit-learn
+        if self._vectorizer is None:
+            self._vectorizer = sklearn_text.HashingVectorizer(
+                n_features=self.n_features,
+                stop_words="english",
+                ngram_range=(1, 2),
+                alternate_sign=False,
+                norm=None
+            )
+        return self._vectorizer
+
+    def reset(self) -> None:
+        """
+        Forget all IDF statistics (used when a new document replaces the index).
+        """
+        self.doc_freq[:] = 0
+        self.num_docs = 0
+        self.is_fitted = False
+
+    def partial_fit(self, chunks: list) -> None:
+        """
+        Update running document frequencies with new chunks.
+
+        Args:
+            chunks (list): Newly added text chunks
+        """
+        try:
+            counts = self.vectorizer.transform(chunks)
+            self.doc_freq += np.bincount(counts.indices, minlength=self.n_features)
+            self.num_docs += len(chunks)
+            self.is_fitted = True
+
+        except Exception as e:
+            logging.error("Error updating IDF statistics")
+            raise CustomException(e, sys)
+
+    def fit(self, chunks: list) -> None:
+        """
+        Start fresh IDF statistics from chunks.
+
+        Args:
+            chunks (list): List of text chunks
+        """
+        self.reset()
+        self.partial_fit(chunks)
+
+    def _idf(self) -> np.ndarray:
+        # Same smoothed formula as TfidfVectorizer(smooth_idf=True)
+        return np.log((1 + self.num_docs) / (1 + self.doc_freq)) + 1.0
+
+    def _transform(self, texts: list):
+        """
+        Hashed term counts weighted by current IDF, L2-normalized.
+
+        Returns:
+            scipy.sparse.csr_matrix: float32 rows
+        """
+        counts = self.vectorizer.transform(texts).astype("float32")
+        counts.data *= self._idf()[counts.indices].astype("float32")
+        return sklearn_preprocessing.normalize(counts, norm="l2", copy=False)
+
+    def generate_embeddings(self, chunks: list) -> np.ndarray:
+        """
+        Update IDF statistics with chunks, then embed them.
+        Only the new chunks are embedded — cost scales with new text.
+
+        Args:
+            chunks (list): List of text chunks
+
+        Returns:
+            np.ndarray: float32 embedding vectors
+        """
+        try:
+            logging.info(f"Generating hashed TF-IDF embeddings for {len(chunks)} chunks")
+
+            if not chunks:
+                return np.array([])
+
+            self.partial_fit(chunks)
+            return self._transform(chunks).toarray()
+
+        except Exception as e:
+            logging.error("Error generating hashed embeddings")
+            raise CustomException(e, sys)
+
+    def generate_embedding_batches(self, chunks: list, batch_size: int = 1024):
+        """
+        Lazily embed chunks one batch at a time. Call fit() first.
+
+        Args:
+            chunks (list): List of text chunks
+            batch_size (int): Chunks per yielded batch
+
+        Yields:
+            np.ndarray: float32 embedding vectors for the next batch
+        """
+        try:
+            if not self.is_fitted:
+                self.fit(chunks)
+
+            for start in range(0, len(chunks), batch_size):
+                yield self._transform(chunks[start:start + batch_size]).toarray()
+
+        except Exception as e:
+            logging.error("Error generating hashed embedding batches")
+            raise CustomException(e, sys)
+
+    def generate_sparse_embeddings(self, chunks: list):
+        """
+        Update IDF statistics with chunks and embed them as CSR rows.
+
+        Args:
+            chunks (list): List of text chunks
+
+        Returns:
+            scipy.sparse.csr_matrix: One L2-normalized row per chunk
+        """
+        try:
+            self.partial_fit(chunks)
+            return self._transform(chunks)
+
+        except Exception as e:
+            logging.error("Error generating sparse hashed embeddings")
+            raise CustomException(e, sys)
+
+    def generate_incremental_embeddings(self, chunks: list, sparse: bool = False):
+        """
+        Embed chunks being appended to an existing index, updating
+        IDF statistics first. Existing vectors are not touched.
+
+        Args:
+            chunks (list): New text chunks
+            sparse (bool): Return CSR rows instead of a dense array
+
+        Returns:
+            np.ndarray | scipy.sparse.csr_matrix: L2-normalized float32 vectors
+        """
+        try:
+            self.partial_fit(chunks)
+            embeddings = self._transform(chunks)
+            return embeddings if sparse else embeddings.toarray()
+
+        except Exception as e:
+            logging.error("Error generating incremental hashed embeddings")
+            raise CustomException(e, sys)
+
+    def generate_single_embedding(self, text: str) -> np.ndarray:
+        """
+        Convert a single query into a hashed TF-IDF vector.
+
+        Args:
+            text (str): User's topic query
+
+        Returns:
+            np.ndarray: Embedding vector
+        """
+        try:
+            return self._transform([text]).toarray()[0]
+
+        except Exception as e:
+            logging.error("Error generating hashed query embedding")
+            raise CustomException(e, sys)
+
+    def generate_query_embeddings(self, texts: list, sparse: bool = False):
+        """
+        Convert many queries into hashed TF-IDF vectors with one transform call.
+
+        Args:
+            texts (list): Topic queries
+            sparse (bool): Return CSR rows instead of a dense array
+
+        Returns:
+            np.ndarray | scipy.sparse.csr_matrix: L2-normalized float32 rows, one per query
+        """
+        try:
+            embeddings = self._transform(texts)
+            return embeddings if sparse else embeddings.toarray()
+
+        except Exception as e:
+            logging.error("Error generating hashed query embeddings")
+            raise CustomException(e, sys)
+
+    def generate_single_sparse_embedding(self, text: str):
+        """
+        Convert a single query into a sparse 1 x n_features row.
+
+        Args:
+            text (str): User's topic query
+
+        Returns:
+            scipy.sparse.csr_matrix: L2-normalized query row
+        """
+        try:
+            return self._transform([text])
+
+        except Exception as e:
+            logging.error("Error generating sparse hashed query embedding")
+            raise CustomException(e, sys)
+
+    def get_settings(self) -> dict:
+        """
+        Vectorizer settings that determine the embeddings.
+
+        Returns:
+            dict: JSON-serializable vectorizer parameters
+        """
+        return {
+            "type": type(self.vectorizer).__name__,
+            "params": {k: repr(v) for k, v in sorted(self.vectorizer.get_params().items())}
+        }
+
+    def memory_bytes(self) -> int:
+        """
+        Returns:
+            int: Bytes held by the document-frequency counts
+        """
+        return self.doc_freq.nbytes
+
+    def save(self, file_path: str) -> None:
+        """
+        Persist the running IDF statistics.
+
+        Args:
+            file_path (str): Target file path
+        """
+        try:
+            with open(file_path, "wb") as f:
+                pickle.dump(
+                    {"doc_freq": self.doc_freq, "num_docs": self.num_docs},
+                    f, protocol=pickle.HIGHEST_PROTOCOL
+                )
+
+        except Exception as e:
+            logging.error("Error saving IDF statistics")
+            raise CustomException(e, sys)
+
+    def load(self, file_path: str) -> None:
+        """
+        Load IDF statistics saved with save().
+
+        Args:
+            file_path (str): File written by save()
+        """
+        try:
+            with open(file_path, "rb") as f:
+                state = pickle.load(f)
+            self.doc_freq = state["doc_freq"]
+            self.num_docs = state["num_docs"]
+            self.is_fitted = self.num_docs > 0
+
+        except Exception as e:
+            logging.error("Error loading IDF statistics")
+            raise CustomException(e, sys)
@@ -0,0 +1,170 @@
+# src/components/index_cache.py
+
+import os
+import sys
+import json
+import shutil
+import hashlib
+import threading
+
+from src.logger.logger import logging
+from src.exception.custom_exception import CustomException
+
+DEFAULT_CACHE_DIR = os.getenv("MCQ_INDEX_CACHE_DIR", "index_cache")
+DEFAULT_MAX_SIZE_MB = int(os.getenv("MCQ_INDEX_CACHE_MAX_MB", "1024"))
+
+# Bump when the on-disk entry layout or a pickled object inside it
+# (vectorizer, ChunkStore) changes, so old entries are not loaded
+CACHE_FORMAT_VERSION = 2
+
+# Touched on every hit — its mtime is the entry's last-used time
+LAST_USED_FILE = ".last_used"
+
+
+class IndexCache:
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_size_mb: int = DEFAULT_MAX_SIZE_MB):
+        """
+        Content-addressed on-disk cache of indexed documents.
+
+        Each entry is a directory named by the SHA-256 of the input
+        bytes plus the chunker and vectorizer settings, holding the
+        chunks, fitted vectorizer and FAISS index. When the total size
+        goes over max_size_mb, least recently used entries are removed.
+
+        cache_dir: Directory holding cached entries
+        max_size_mb: Size cap for the whole cache in megabytes
+        """
+        self.cache_dir = cache_dir
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(data: bytes, settings: dict) -> str:
+        """
+        Build the cache key for a document.
+
+        Args:
+            data (bytes): Raw document bytes (PDF file or UTF-8 text)
+            settings (dict): Chunker / vectorizer settings
+
+        Returns:
+            str: Hex digest identifying the document + settings
+        """
+        digest = hashlib.sha256()
+        digest.update(json.dumps(settings, sort_keys=True).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(data)
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key)
+
+    def load(self, key: str, retriever) -> bool:
+        """
+        Restore a cached document into the given retriever.
+
+        Args:
+            key (str): Key from make_key()
+            retriever (Retriever): Retriever to load into
+
+        Returns:
+            bool: True on a cache hit, False on a miss
+        """
+        path = self._entry_path(key)
+
+        if not os.path.isdir(path):
+            logging.info(f"Index cache miss: {key[:12]}")
+            return False
+
+        try:
+            retriever.load(path)
+            os.utime(os.path.join(path, LAST_USED_FILE), None)
+            logging.info(f"Index cache hit: {key[:12]}")
+            return True
+
+        except Exception as e:
+            # A half-written or corrupted entry is treated as a miss
+            logging.warning(f"Discarding unreadable index cache entry {key[:12]}: {e}")
+            shutil.rmtree(path, ignore_errors=True)
+            return False
+
+    def save(self, key: str, retriever) -> None:
+        """
+        Store an indexed retriever under the given key,
+        then evict old entries if the cache is over its size cap.
+
+        Args:
+            key (str): Key from make_key()
+            retriever (Retriever): Retriever with a built index
+        """
+        try:
+            path = self._entry_path(key)
+            if os.path.isdir(path):
+                return
+
+            # Write to a temp dir and rename, so readers never see a partial entry
+            tmp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+            retriever.save(tmp_path)
+            open(os.path.join(tmp_path, LAST_USED_FILE), "w").close()
+
+            try:
+                os.rename(tmp_path, path)
+            except OSError:
+                # Another worker stored the same document first
+                shutil.rmtree(tmp_path, ignore_errors=True)
+
+            logging.info(f"Stored index cache entry {key[:12]}")
+            self.evict()
+
+        except Exception as e:
+            logging.error("Error saving index cache entry")
+            raise CustomException(e, sys)
+
+    def _entries(self) -> list:
+        """
+        List cached entries as (last_used, size_bytes, path).
+        """
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            path = self._entry_path(name)
+            marker = os.path.join(path, LAST_USED_FILE)
+            if not os.path.isfile(marker):
+                continue  # in-progress temp dir or foreign file
+            size = sum(
+                os.path.getsize(os.path.join(root, f))
+                for root, _, files in os.walk(path) for f in files
+            )
+            entries.append((os.path.getmtime(marker), size, path))
+        return entries
+
+    def size_bytes(self) -> int:
+        """
+        Returns:
+            int: Total size of all cached entries in bytes
+        """
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until the cache fits max_size_mb.
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock:
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+
+            for _, size, path in entries:
+                if total <= self.max_size_bytes:
+                    break
+                shutil.rmtree(path, ignore_errors=True)
+                total -= size
+                removed += 1
+
+            if removed:
+                logging.info(f"Evicted {removed} index cache entries")
+            return removed
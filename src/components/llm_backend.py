@@ -0,0 +1,284 @@
+# src/components/llm_backend.py
+
+import os
+import re
+import json
+import time
+import random
+import itertools
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+
+from src.logger.logger import logging
+
+LLM_BACKENDS = ("groq", "simulated")
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+
+
+class LLMResponse:
+
+    def __init__(self, content: str, prompt_tokens: int = 0, completion_tokens: int = 0):
+        """
+        Provider-independent chat completion result.
+
+        content: Model response text
+        prompt_tokens: Tokens billed for the prompt
+        completion_tokens: Tokens billed for the response
+        """
+        self.content = content
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+
+class LLMBackend(ABC):
+    """
+    Chat completion provider used by QuestionGenerator (through LLMScheduler).
+
+    Implementations send one request and return an LLMResponse. Failures
+    are raised as exceptions carrying an HTTP-style status_code (and a
+    response with headers for Retry-After) so the scheduler can tell
+    retryable errors apart. complete() is abstract, so a backend that
+    does not implement it fails when it is constructed.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def complete(self, model: str, messages: list, temperature: float) -> LLMResponse:
+        """
+        Send one chat completion request.
+
+        Args:
+            model (str): Model name
+            messages (list): Chat messages ({"role", "content"} dicts)
+            temperature (float): Sampling temperature
+
+        Returns:
+            LLMResponse: Response text and token usage
+        """
+
+
+class GroqBackend(LLMBackend):
+
+    name = "groq"
+
+    def __init__(self, api_key: str = None, base_url: str = None, timeout: float = None):
+        """
+        Groq chat completions.
+
+        api_key: Groq API key (default: GROQ_API_KEY)
+        base_url: API root (default: GROQ_BASE_URL or Groq's endpoint),
+                  e.g. a local OpenAI-compatible fake server
+        timeout: Request timeout in seconds (default: MCQ_LLM_TIMEOUT or 30)
+        """
+        from groq import Groq
+
+        api_key = api_key or os.getenv("GROQ_API_KEY")
+        if not api_key:
+            raise ValueError("GROQ_API_KEY not found in .env file")
+
+        # The scheduler owns retries, so the SDK's own retries are disabled
+        self.client = Groq(
+            api_key=api_key,
+            base_url=base_url or os.getenv("GROQ_BASE_URL") or None,
+            timeout=timeout or float(os.getenv("MCQ_LLM_TIMEOUT", "30")),
+            max_retries=0
+        )
+        logging.info("Groq client initialized successfully")
+
+    def complete(self, model: str, messages: list, temperature: float) -> LLMResponse:
+        response = self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature
+        )
+        usage = getattr(response, "usage", None)
+        return LLMResponse(
+            response.choices[0].message.content,
+            getattr(usage, "prompt_tokens", 0) or 0,
+            getattr(usage, "completion_tokens", 0) or 0
+        )
+
+
+class SimulatedAPIError(Exception):
+
+    def __init__(self, status_code: int, message: str, retry_after: float = None):
+        """
+        Error raised by SimulatedBackend, shaped like an SDK status error.
+
+        status_code: HTTP status (429, 503, ...)
+        message: Error message
+        retry_after: Seconds sent back as a Retry-After header
+        """
+        super().__init__(f"Error code: {status_code} - {message}")
+        self.status_code = status_code
+        self.response = _SimulatedHTTPResponse(
+            {"retry-after": f"{retry_after:.3f}"} if retry_after is not None else {}
+        )
+
+
+class _SimulatedHTTPResponse:
+
+    def __init__(self, headers: dict):
+        self.headers = headers
+
+
+class SimulatedBackend(LLMBackend):
+
+    name = "simulated"
+
+    def __init__(self, latency_s: float = float(os.getenv("MCQ_SIM_LATENCY_S", "0.8")),
+                 latency_dist: str = os.getenv("MCQ_SIM_LATENCY_DIST", "lognormal"),
+                 latency_spread: float = 0.5,
+                 error_rate: float = float(os.getenv("MCQ_SIM_ERROR_RATE", "0.0")),
+                 rate_limit_rate: float = 0.0, invalid_rate: float = 0.0,
+                 duplicate_rate: float = float(os.getenv("MCQ_SIM_DUPLICATE_RATE", "0.0")),
+                 retry_after_s: float = 1.0, seed: int = None):
+        """
+        Offline stand-in for an LLM provider, for load tests and benchmarks.
+
+        Each request sleeps for a latency drawn from the chosen distribution,
+        may fail with a 503 or a 429 (with Retry-After), and otherwise
+        returns templated MCQ JSON — a JSON array when the prompt asks for
+        several questions. Questions pair up words taken from the prompt's
+        context, so different questions differ in content the way real
+        ones do. Token usage is estimated at ~4 characters per token.
+
+        latency_s: Median latency in seconds
+        latency_dist: "fixed", "uniform" (latency_s ± spread fraction)
+                      or "lognormal" (sigma = spread, heavy right tail)
+        latency_spread: Spread parameter for the distribution
+        error_rate: Fraction of requests failing with 503
+        rate_limit_rate: Fraction of requests failing with 429
+        invalid_rate: Fraction of responses that are not valid MCQ JSON
+        duplicate_rate: Fraction of questions that reword a recent question
+                        with the same answer (a paraphrased duplicate)
+        retry_after_s: Retry-After sent with simulated 429s
+        seed: Random seed for reproducible runs
+        """
+        if latency_dist not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {latency_dist}")
+
+        self.latency_s = latency_s
+        self.latency_dist = latency_dist
+        self.latency_spread = latency_spread
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.invalid_rate = invalid_rate
+        self.duplicate_rate = duplicate_rate
+        self.retry_after_s = retry_after_s
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._question_ids = itertools.count(1)
+        self._recent = deque(maxlen=8)  # (topic, a, b, options) of recent questions
+        logging.info(
+            f"Simulated LLM backend: {latency_dist} latency ~{latency_s}s, "
+            f"{error_rate:.0%} errors, {rate_limit_rate:.0%} rate limits"
+        )
+
+    def sample_latency(self) -> float:
+        with self._rng_lock:
+            if self.latency_dist == "fixed":
+                return self.latency_s
+            if self.latency_dist == "uniform":
+                spread = self.latency_s * self.latency_spread
+                return max(0.0, self._rng.uniform(self.latency_s - spread, self.latency_s + spread))
+            return self.latency_s * self._rng.lognormvariate(0.0, self.latency_spread)
+
+    def _draw(self) -> float:
+        with self._rng_lock:
+            return self._rng.random()
+
+    @staticmethod
+    def _context_words(prompt: str) -> list:
+        context = re.search(r"Context:\n(.*?)(?:\n\n[A-Z][a-z]+[^\n]*:|\Z)", prompt, re.S)
+        words = re.findall(r"[a-z]{4,}", (context.group(1) if context else prompt).lower())
+        return list(dict.fromkeys(words))
+
+    def make_mcq(self, topic: str, words: list = None) -> dict:
+        if self._recent and self._draw() < self.duplicate_rate:
+            with self._rng_lock:
+                topic, a, b, options = self._rng.choice(self._recent)
+            return {
+                "question": f"In {topic}, what is the relationship between {a} and {b}?",
+                "options": list(options),
+                "correct_answer": options[0]
+            }
+
+        n = next(self._question_ids)
+        words = words or []
+        if len(words) >= 4:
+            # Consecutive questions draw disjoint word pairs from the context
+            a, b = words[(2 * n) % len(words)], words[(2 * n + 1) % len(words)]
+            others = [w for w in words if w not in (a, b)]
+            distractors = [others[(3 * n + k) % len(others)] for k in range(3)]
+        else:
+            a, b = f"concept{n}", f"property{n}"
+            distractors = [f"factor{n}{k}" for k in range(3)]
+        options = [f"{a} determines {b}"] + [f"{d} determines {b}" for d in distractors]
+        self._recent.append((topic, a, b, options))
+        return {
+            "question": f"How does {a} relate to {b} in {topic}?",
+            "options": options,
+            "correct_answer": options[0]
+        }
+
+    def render(self, prompt: str) -> str:
+        """
+        Templated MCQ JSON answering a QuestionGenerator prompt.
+
+        Args:
+            prompt (str): Full prompt text
+
+        Returns:
+            str: One MCQ object, or an array when the prompt asks for several
+        """
+        topic = re.search(r'topic: "([^"]*)"', prompt)
+        topic = topic.group(1) if topic else "the topic"
+
+        words = self._context_words(prompt)
+        batch = re.search(r"JSON array of exactly (\d+)", prompt)
+        if batch:
+            return json.dumps([self.make_mcq(topic, words) for _ in range(int(batch.group(1)))])
+        return json.dumps(self.make_mcq(topic, words))
+
+    def complete(self, model: str, messages: list, temperature: float) -> LLMResponse:
+        time.sleep(self.sample_latency())
+
+        draw = self._draw()
+        if draw < self.rate_limit_rate:
+            raise SimulatedAPIError(429, "rate limit exceeded", retry_after=self.retry_after_s)
+        if draw < self.rate_limit_rate + self.error_rate:
+            raise SimulatedAPIError(503, "service unavailable")
+
+        prompt = "\n".join(m.get("content", "") for m in messages)
+        content = self.render(prompt)
+        if self._draw() < self.invalid_rate:
+            content = content[: len(content) // 2]  # truncated, unparseable JSON
+
+        return LLMResponse(content, len(prompt) // 4 + 1, len(content) // 4 + 1)
+
+
+def make_backend(name: str = None) -> LLMBackend:
+    """
+    Create the LLM backend named by name or MCQ_LLM_BACKEND (default "groq").
+
+    Args:
+        name (str): "groq" or "simulated"
+
+    Returns:
+        LLMBackend: Backend instance
+    """
+    name = (name or os.getenv("MCQ_LLM_BACKEND", "groq")).lower()
+
+    if name == "groq":
+        return GroqBackend()
+    if name == "simulated":
+        return SimulatedBackend()
+
+    raise ValueError(f"Unknown LLM backend: {name} (expected one of {LLM_BACKENDS})")
@@ -0,0 +1,179 @@
+# src/components/llm_cache.py
+
+import os
+import sys
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+from src.logger.logger import logging
+from src.exception.custom_exception import CustomException
+
+DEFAULT_DB_PATH = os.getenv("MCQ_LLM_CACHE_PATH", os.path.join("llm_cache", "responses.sqlite3"))
+DEFAULT_TTL_HOURS = float(os.getenv("MCQ_LLM_CACHE_TTL_HOURS", "168"))
+DEFAULT_MAX_ENTRIES = int(os.getenv("MCQ_LLM_CACHE_MAX_ENTRIES", "20000"))
+
+
+class LLMResponseCache:
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, ttl_hours: float = DEFAULT_TTL_HOURS,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        On-disk SQLite cache of validated LLM responses.
+
+        Entries are keyed by the SHA-256 of the model name, full prompt
+        and sampling parameters, so only byte-identical requests share
+        a response. Entries older than ttl_hours are ignored and purged;
+        over max_entries, least recently used entries are removed.
+
+        db_path: SQLite database file (parent directory is created)
+        ttl_hours: Entry lifetime in hours (0 = never expire)
+        max_entries: Entry cap for the whole cache
+        """
+        try:
+            self.db_path = db_path
+            self.ttl_seconds = ttl_hours * 3600
+            self.max_entries = max_entries
+            self.hits = 0
+            self.misses = 0
+            self._lock = threading.Lock()
+
+            directory = os.path.dirname(db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            # One connection shared by all threads, serialized by _lock
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS responses (
+                       key TEXT PRIMARY KEY,
+                       value TEXT NOT NULL,
+                       created REAL NOT NULL,
+                       last_used REAL NOT NULL
+                   )"""
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses(last_used)")
+            self._conn.commit()
+            logging.info(f"LLM response cache opened at {db_path}")
+
+        except Exception as e:
+            logging.error("Error opening LLM response cache")
+            raise CustomException(e, sys)
+
+    @staticmethod
+    def make_key(model: str, prompt: str, params: dict) -> str:
+        """
+        Build the cache key for a request.
+
+        Args:
+            model (str): Model name
+            prompt (str): Full prompt text
+            params (dict): Sampling parameters e.g. {"temperature": 0.7}
+
+        Returns:
+            str: Hex digest identifying the request
+        """
+        digest = hashlib.sha256()
+        digest.update(json.dumps({"model": model, "params": params}, sort_keys=True).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(prompt.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _expired(self, created: float, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - created > self.ttl_seconds
+
+    def get(self, key: str):
+        """
+        Look up a cached response.
+
+        Args:
+            key (str): Key from make_key()
+
+        Returns:
+            Parsed JSON value, or None on a miss or expired entry
+        """
+        try:
+            now = time.time()
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, created FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+
+                if row is None or self._expired(row[1], now):
+                    if row is not None:
+                        self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                        self._conn.commit()
+                    self.misses += 1
+                    return None
+
+                self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+                self._conn.commit()
+                self.hits += 1
+
+            return json.loads(row[0])
+
+        except Exception as e:
+            # A broken cache must never break generation
+            logging.warning(f"LLM response cache read failed: {e}")
+            return None
+
+    def put(self, key: str, value) -> None:
+        """
+        Store (or replace) a validated response.
+
+        Args:
+            key (str): Key from make_key()
+            value: JSON-serializable response
+        """
+        try:
+            now = time.time()
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, created, last_used) VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(value), now, now)
+                )
+                self._evict(now)
+                self._conn.commit()
+
+        except Exception as e:
+            logging.warning(f"LLM response cache write failed: {e}")
+
+    def _evict(self, now: float) -> None:
+        # Caller holds _lock
+        if self.ttl_seconds > 0:
+            self._conn.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl_seconds,))
+
+        count = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        if count > self.max_entries:
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY last_used ASC LIMIT ?)",
+                (count - self.max_entries,)
+            )
+            logging.info(f"Evicted {count - self.max_entries} LLM cache entries")
+
+    def clear(self) -> None:
+        """
+        Remove every cached response.
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: hits, misses, hit_rate and number of stored entries
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": entries
+        }
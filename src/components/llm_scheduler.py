@@ -0,0 +1,348 @@
+# src/components/llm_scheduler.py
+
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from src.utils import metrics
+from src.logger.logger import logging
+
+# HTTP statuses worth retrying: timeouts, conflicts, rate limits, server errors
+RETRYABLE_STATUS = {408, 409, 429}
+
+# Retryable statuses that mean the upstream itself is failing (plus 5xx).
+# Rate limits and conflicts are absorbed by the buckets and backoff
+# instead of counting towards the circuit breaker.
+UPSTREAM_FAILURE_STATUS = {408}
+
+
+class LLMUnavailableError(Exception):
+    """
+    The LLM request could not be completed: retries were exhausted
+    or the circuit breaker is open.
+    """
+
+
+class LLMRequestError(LLMUnavailableError):
+    """
+    The backend rejected the request (bad request, authentication,
+    permissions) — retrying will not help. The backend's own error
+    is chained as __cause__.
+    """
+
+
+class CircuitOpenError(LLMUnavailableError):
+    """
+    The circuit breaker is open — the upstream is unhealthy,
+    so the request was rejected without being sent.
+    """
+
+
+class TokenBucket:
+
+    def __init__(self, per_minute: float):
+        """
+        Thread-safe token bucket refilled continuously at per_minute / 60 per second.
+
+        per_minute: Capacity and refill rate (e.g. requests or tokens per minute)
+        """
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """
+        Block until amount tokens are available, then take them.
+        Requests larger than the bucket are clamped to its capacity.
+
+        Args:
+            amount (float): Tokens to take
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return waited
+                wait = (amount - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def adjust(self, amount: float) -> None:
+        """
+        Charge (positive) or refund (negative) tokens after the fact,
+        e.g. once a response reports its real token usage.
+        The balance may go negative; later acquires wait it off.
+        """
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens - amount)
+
+
+class CircuitBreaker:
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Fail fast while the upstream is unhealthy.
+
+        closed    — requests flow; consecutive failures are counted
+        open      — requests are rejected until reset_timeout has passed
+        half_open — one trial request is let through; success closes
+                    the circuit, failure re-opens it
+
+        failure_threshold: Consecutive failures that open the circuit
+        reset_timeout: Seconds to stay open before a trial request
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> None:
+        """
+        Raise CircuitOpenError unless a request may be sent now.
+        """
+        with self._lock:
+            if self.state == "open":
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    raise CircuitOpenError("LLM circuit breaker is open")
+                self.state = "half_open"
+                self._trial_in_flight = False
+                logging.info("LLM circuit breaker half-open — sending trial request")
+
+            if self.state == "half_open":
+                if self._trial_in_flight:
+                    raise CircuitOpenError("LLM circuit breaker is half-open, trial in flight")
+                self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != "closed":
+                logging.info("LLM circuit breaker closed")
+            self.state = "closed"
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """
+        End a request that says nothing about upstream health (e.g. a
+        rate limit), so a half-open circuit can send another trial.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                if self.state != "open":
+                    logging.warning(f"LLM circuit breaker opened after {self.failures} failures")
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+
+class LLMScheduler:
+
+    def __init__(self, backend,
+                 requests_per_minute: float = float(os.getenv("MCQ_LLM_RPM", "30")),
+                 tokens_per_minute: float = float(os.getenv("MCQ_LLM_TPM", "6000")),
+                 max_retries: int = 4, base_delay: float = 1.0, max_delay: float = 30.0,
+                 failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 expected_completion_tokens: int = 300):
+        """
+        Rate-limit-aware front end for an LLMBackend.
+
+        Every request waits on a requests-per-minute and a tokens-per-minute
+        bucket before it is sent, so a burst of questions is spread out
+        instead of tripping the provider's limits. Retryable failures
+        (429, 408, 409, 5xx, timeouts, connection errors) are retried with
+        jittered exponential backoff, honoring Retry-After when the server
+        sends it; anything else fails at once. Consecutive retryable
+        upstream failures (5xx, timeouts, connection errors — not rate
+        limits) open a circuit breaker so callers fail fast while the
+        upstream is unhealthy.
+
+        backend: LLMBackend that sends the requests
+        requests_per_minute: RPM budget
+        tokens_per_minute: TPM budget (prompt + completion tokens)
+        max_retries: Retries per request after the first attempt
+        base_delay: First backoff delay in seconds (doubles each retry)
+        max_delay: Cap on a single backoff delay
+        failure_threshold: Consecutive failures that open the circuit
+        reset_timeout: Seconds the circuit stays open
+        expected_completion_tokens: Completion tokens reserved before a request
+        """
+        self.backend = backend
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.expected_completion_tokens = expected_completion_tokens
+
+        self.retries = 0
+        self.rejected = 0
+        logging.info(
+            f"LLMScheduler initialized: {requests_per_minute:g} RPM, "
+            f"{tokens_per_minute:g} TPM, {max_retries} retries"
+        )
+
+    @staticmethod
+    def estimate_tokens(messages: list) -> int:
+        # ~4 characters per token for English text
+        return sum(len(m.get("content", "")) for m in messages) // 4 + 1
+
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        """
+        Args:
+            error (Exception): Error raised by the backend
+
+        Returns:
+            bool: True for rate limits, timeouts, connection and server errors
+        """
+        if getattr(error, "status_code", None) in RETRYABLE_STATUS:
+            return True
+        # Server errors, timeouts and connection failures are transient
+        return LLMScheduler.is_upstream_failure(error)
+
+    @staticmethod
+    def is_upstream_failure(error: Exception) -> bool:
+        """
+        Args:
+            error (Exception): Retryable error raised by the backend
+
+        Returns:
+            bool: True for server errors, timeouts and connection errors —
+                  the failures that count towards the circuit breaker
+        """
+        status = getattr(error, "status_code", None)
+        if status is not None:
+            return status in UPSTREAM_FAILURE_STATUS or status >= 500
+        name = type(error).__name__
+        return "Timeout" in name or "Connection" in name
+
+    def _count(self, counter: str) -> None:
+        # complete() runs on worker threads; share the breaker's lock
+        with self.breaker._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    @staticmethod
+    def retry_after(error: Exception):
+        """
+        Read the server's requested delay from Retry-After / retry-after-ms.
+
+        Returns:
+            float: Seconds to wait, or None if the server did not say
+        """
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        if not headers:
+            return None
+
+        try:
+            if headers.get("retry-after-ms"):
+                return float(headers["retry-after-ms"]) / 1000.0
+
+            value = headers.get("retry-after")
+            if not value:
+                return None
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                # HTTP-date form
+                return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter: uniform in [0, min(max_delay, base * 2^attempt)]
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def complete(self, **request):
+        """
+        Send one chat completion through the rate limiter, retry policy
+        and circuit breaker.
+
+        Args:
+            **request: Keyword arguments for backend.complete (model, messages, temperature)
+
+        Returns:
+            LLMResponse: Backend response
+
+        Raises:
+            CircuitOpenError: The upstream is marked unhealthy
+            LLMUnavailableError: Retries were exhausted
+            LLMRequestError: The backend rejected the request (not retried)
+        """
+        estimate = self.estimate_tokens(request.get("messages", [])) + self.expected_completion_tokens
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.breaker.allow()
+            except CircuitOpenError:
+                self._count("rejected")
+                metrics.LLM_FAILURES.inc(reason="circuit_open")
+                raise
+
+            self.request_bucket.acquire(1)
+            self.token_bucket.acquire(estimate)
+
+            try:
+                response = self.backend.complete(**request)
+
+            except Exception as e:
+                if not self.is_retryable(e):
+                    # Caller error (bad request, auth) — says nothing about
+                    # upstream health, so it neither opens nor closes the circuit
+                    self.breaker.release_trial()
+                    metrics.LLM_FAILURES.inc(reason="client_error")
+                    raise LLMRequestError(f"LLM request rejected: {e}") from e
+
+                if self.is_upstream_failure(e):
+                    self.breaker.record_failure()
+                else:
+                    self.breaker.release_trial()
+                if attempt == self.max_retries:
+                    metrics.LLM_FAILURES.inc(reason="retries_exhausted")
+                    raise LLMUnavailableError(
+                        f"LLM request failed after {attempt + 1} attempts: {e}"
+                    ) from e
+
+                delay = self.retry_after(e)
+                delay = self._backoff(attempt) if delay is None else min(delay, self.max_delay)
+                self._count("retries")
+                metrics.LLM_RETRIES.inc()
+                logging.warning(
+                    f"Retryable LLM error ({type(e).__name__}), "
+                    f"retry {attempt + 1}/{self.max_retries} in {delay:.2f}s"
+                )
+                time.sleep(delay)
+                continue
+
+            self.breaker.record_success()
+
+            # Settle the token bucket with the real usage when reported
+            if response.total_tokens:
+                self.token_bucket.adjust(response.total_tokens - estimate)
+
+            return response
@@ -1,17 +1,136 @@
 # src/components/pdf_reader.py
 
-from PyPDF2 import PdfReader
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from src.utils.lazy_import import lazy_import
 from src.exception.custom_exception import CustomException
 from src.logger.logger import logging
-import sys
+
+PyPDF2 = lazy_import("PyPDF2")
+
+# PDFs with fewer pages than this are always read serially —
+# process start-up costs more than it saves on small handouts
+PARALLEL_MIN_PAGES = 50
+
+
+def _extract_page_range(file_path: str, start: int, end: int) -> list:
+    """
+    Extract text from pages [start, end) of a PDF.
+    Runs inside a worker process, so it opens its own reader.
+
+    Args:
+        file_path (str): Path of the PDF file
+        start (int): First page number (inclusive)
+        end (int): Last page number (exclusive)
+
+    Returns:
+        list: Text of each page in the range, in page order
+    """
+    reader = PyPDF2.PdfReader(file_path)
+    return [reader.pages[i].extract_text() or "" for i in range(start, end)]
+
+
+def _split_page_ranges(num_pages: int, num_parts: int) -> list:
+    """
+    Split page numbers 0..num_pages into contiguous, near-equal ranges.
+
+    Args:
+        num_pages (int): Total number of pages
+        num_parts (int): Number of ranges to produce
+
+    Returns:
+        list: List of (start, end) tuples covering every page once
+    """
+    base, extra = divmod(num_pages, num_parts)
+    ranges = []
+    start = 0
+    for part in range(num_parts):
+        end = start + base + (1 if part < extra else 0)
+        if end > start:
+            ranges.append((start, end))
+        start = end
+    return ranges
 
 
-def extract_text_from_pdf(file_path: str) -> str:
+def iter_pdf_pages(file_path: str, num_workers: int = None,
+                   min_pages_for_parallel: int = PARALLEL_MIN_PAGES):
+    """
+    Lazily yield the text of each PDF page in order.
+    Lets callers process a document page by page instead of
+    holding the whole text in memory.
+
+    Large PDFs are split into page ranges and extracted on a process
+    pool. Only a few ranges per worker are in flight at a time and
+    they are yielded in submission order, so pages stay in order and
+    memory stays bounded by the ranges in flight, not the document.
+    Small PDFs (or num_workers=1) are read serially.
+
+    Args:
+        file_path (str): Path of the uploaded PDF file
+        num_workers (int): Worker processes to use (default: CPU count)
+        min_pages_for_parallel (int): Page count below which extraction stays serial
+
+    Yields:
+        str: Extracted text of one page ("" for pages without text)
+    """
+    try:
+        logging.info("Starting streaming PDF text extraction")
+
+        reader = PyPDF2.PdfReader(file_path)
+        num_pages = len(reader.pages)
+
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        num_workers = max(1, min(num_workers, num_pages))
+
+        if num_workers == 1 or num_pages < min_pages_for_parallel:
+            for page in reader.pages:
+                yield page.extract_text() or ""
+        else:
+            logging.info(f"Extracting {num_pages} pages with {num_workers} workers")
+
+            # A few ranges per worker keeps the pool busy when some
+            # pages (scans, heavy fonts) are much slower than others
+            ranges = iter(_split_page_ranges(num_pages, num_workers * 4))
+            max_in_flight = num_workers * 2
+
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                pending = deque()
+                for start, end in ranges:
+                    pending.append(executor.submit(_extract_page_range, file_path, start, end))
+                    if len(pending) >= max_in_flight:
+                        break
+                # Collect in submission order so pages stay in order,
+                # topping the queue up as each range is consumed
+                while pending:
+                    page_texts = pending.popleft().result()
+                    next_range = next(ranges, None)
+                    if next_range is not None:
+                        pending.append(executor.submit(_extract_page_range, file_path, *next_range))
+                    yield from page_texts
+
+        logging.info(f"Streamed {num_pages} PDF pages")
+
+    except Exception as e:
+        logging.error("Error occurred while streaming text from PDF")
+        raise CustomException(e, sys)
+
+
+def extract_text_from_pdf(file_path: str, num_workers: int = None,
+                          min_pages_for_parallel: int = PARALLEL_MIN_PAGES) -> str:
     """
     Extract text from a given PDF file path.
 
+    Pages come from iter_pdf_pages(), so large PDFs are extracted on a
+    process pool and reassembled in page order.
+
     Args:
         file_path (str): Path of the uploaded PDF file
+        num_workers (int): Worker processes to use (default: CPU count)
+        min_pages_for_parallel (int): Page count below which extraction stays serial
 
     Returns:
         str: Extracted text from PDF
@@ -19,14 +138,8 @@ def extract_text_from_pdf(file_path: str) -> str:
     try:
         logging.info("Starting PDF text extraction")
 
-        reader = PdfReader(file_path)
-        text = ""
-
-        for page_number, page in enumerate(reader.pages):
-            page_text = page.extract_text()
-
-            if page_text:
-                text += page_text + "\n"
+        page_texts = iter_pdf_pages(file_path, num_workers, min_pages_for_parallel)
+        text = "\n".join(page_text for page_text in page_texts if page_text)
 
         logging.info("PDF text extraction completed successfully")
 
@@ -34,4 +147,4 @@ def extract_text_from_pdf(file_path: str) -> str:
 
     except Exception as e:
         logging.error("Error occurred while extracting text from PDF")
-        raise CustomException(e, sys)
\ No newline at end of file
+        raise CustomException(e, sys)
@@ -0,0 +1,101 @@
+# src/components/question_deduplicator.py
+
+import os
+import sys
+import numpy as np
+
+from src.logger.logger import logging
+from src.exception.custom_exception import CustomException
+
+# Cosine similarity at or above which two questions count as the same question
+DEFAULT_THRESHOLD = float(os.getenv("MCQ_DEDUP_THRESHOLD", "0.7"))
+
+
+class QuestionDeduplicator:
+
+    def __init__(self, embedding_generator, threshold: float = DEFAULT_THRESHOLD,
+                 initial_capacity: int = 16):
+        """
+        Rejects MCQs that paraphrase a question already accepted in the quiz.
+
+        Each candidate is embedded as "question + correct answer" with the
+        document's own vectorizer, then compared with every accepted
+        question in one matrix-vector product against a preallocated
+        matrix of unit-length rows.
+
+        embedding_generator: EmbeddingGenerator / HashingEmbeddingGenerator
+                             (anything with generate_query_embeddings)
+        threshold: Reject candidates with cosine similarity >= threshold
+        initial_capacity: Rows preallocated; doubled when full
+        """
+        self.embedding_generator = embedding_generator
+        self.threshold = threshold
+        self._matrix = None
+        self._capacity = initial_capacity
+        self._count = 0
+        self._seen_texts = set()
+        self.rejected = 0
+        self.max_similarities = []  # best match of every candidate, for tuning
+
+    @staticmethod
+    def _text(mcq: dict) -> str:
+        return f"{mcq['question']} {mcq['correct_answer']}"
+
+    def _embed(self, text: str):
+        embedding = self.embedding_generator.generate_query_embeddings([text])
+        if embedding is None:
+            return None
+        vector = np.asarray(embedding, dtype="float32").ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else None
+
+    def _append(self, vector: np.ndarray) -> None:
+        if self._matrix is None:
+            self._matrix = np.empty((self._capacity, vector.shape[0]), dtype="float32")
+        elif self._count == self._matrix.shape[0]:
+            grown = np.empty((self._matrix.shape[0] * 2, self._matrix.shape[1]), dtype="float32")
+            grown[:self._count] = self._matrix[:self._count]
+            self._matrix = grown
+        self._matrix[self._count] = vector
+        self._count += 1
+
+    def add(self, mcq: dict) -> bool:
+        """
+        Accept the MCQ unless it duplicates an accepted one.
+
+        Args:
+            mcq (dict): Validated MCQ
+
+        Returns:
+            bool: True if accepted, False if rejected as a duplicate
+        """
+        try:
+            text = " ".join(self._text(mcq).lower().split())
+
+            # Exact repeats never reach the vectorizer
+            if text in self._seen_texts:
+                self.rejected += 1
+                self.max_similarities.append(1.0)
+                return False
+
+            vector = self._embed(text)
+            if vector is not None and self._count:
+                # One matrix-vector product against all accepted questions
+                best = float((self._matrix[:self._count] @ vector).max())
+                self.max_similarities.append(best)
+                if best >= self.threshold:
+                    self.rejected += 1
+                    logging.info(f"Rejected near-duplicate MCQ (similarity {best:.2f})")
+                    return False
+
+            self._seen_texts.add(text)
+            if vector is not None:
+                self._append(vector)
+            return True
+
+        except Exception as e:
+            logging.error("Error checking MCQ for duplicates")
+            raise CustomException(e, sys)
+
+    def __len__(self) -> int:
+        return len(self._seen_texts)
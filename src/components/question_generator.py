@@ -125,36 +125,189 @@ import random
 import sys
 import json
 import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from groq import Groq
 from dotenv import load_dotenv
 
+from src.components.llm_backend import make_backend
+from src.components.llm_cache import LLMResponseCache
+from src.components.llm_scheduler import LLMScheduler, LLMUnavailableError
+from src.components.question_deduplicator import QuestionDeduplicator, DEFAULT_THRESHOLD
+from src.components.hashing_embedding_generator import HashingEmbeddingGenerator
+from src.utils import metrics
 from src.logger.logger import logging
 from src.exception.custom_exception import CustomException
 
 load_dotenv()
 
+MODEL_NAME = "llama-3.3-70b-versatile"
+TEMPERATURE = 0.7
+
+GENERATION_MODES = ("per_question", "batched")
+
+# Prompt rules shared by the single-question and batched prompts
+MCQ_RULES = """Rules:
+- Question must be based STRICTLY on the provided context
+- Question must test understanding of "{topic}", NOT just recall of a word
+- Question must be clear and specific
+- Provide exactly 4 options
+- Only ONE option should be correct
+- Wrong options must be plausible but clearly wrong
+- Do NOT use fill-in-the-blank style
+- Do NOT make up information outside the context"""
+
 
 class QuestionGenerator:
 
-    def __init__(self):
+    def __init__(self, max_concurrency: int = int(os.getenv("MCQ_LLM_CONCURRENCY", "4")),
+                 generation_mode: str = os.getenv("MCQ_GENERATION_MODE", "per_question"),
+                 max_batch_rounds: int = 3,
+                 use_response_cache: bool = os.getenv("MCQ_LLM_CACHE", "1") == "1",
+                 backend=None, dedup_threshold: float = DEFAULT_THRESHOLD):
+        """
+        Initialize the LLM backend for MCQ generation.
+
+        max_concurrency: Max Groq requests in flight per quiz
+                         (1 = one question at a time)
+        generation_mode: "per_question" — one prompt per MCQ
+                         "batched" — one prompt asks for all N MCQs over the
+                         deduplicated context; follow-ups only for the shortfall
+        max_batch_rounds: Max prompts per quiz in batched mode
+        use_response_cache: Reuse validated MCQs for identical prompts
+                            from the on-disk LLMResponseCache
+        backend: LLMBackend to send prompts to (default: chosen by
+                 MCQ_LLM_BACKEND — "groq", or "simulated" for offline runs)
+        dedup_threshold: Cosine similarity (question + correct answer) at
+                         which a new MCQ counts as a paraphrase of an
+                         accepted one and is dropped (MCQ_DEDUP_THRESHOLD)
+
+        Requests go through an LLMScheduler (rate limits, retries, circuit
+        breaker).
         """
-        Initialize Groq client for LLM-based MCQ generation.
+        if generation_mode not in GENERATION_MODES:
+            raise ValueError(f"Unknown generation_mode: {generation_mode}")
+
+        self.backend = backend if backend is not None else make_backend()
+        self.scheduler = LLMScheduler(self.backend)
+        self.max_concurrency = max(1, max_concurrency)
+        self.generation_mode = generation_mode
+        self.max_batch_rounds = max_batch_rounds
+        self.response_cache = LLMResponseCache() if use_response_cache else None
+        self.dedup_threshold = dedup_threshold
+
+        # Token / latency accounting for the most recent quiz
+        self._stats_lock = threading.Lock()
+        self.last_quiz_stats = {}
+        logging.info(f"QuestionGenerator initialized with {self.backend.name} backend")
+
+    def _complete(self, prompt: str, stats: dict) -> str:
         """
-        api_key = os.getenv("GROQ_API_KEY")
-        if not api_key:
-            raise ValueError("GROQ_API_KEY not found in .env file")
+        Send one prompt to the LLM backend and record its token usage and latency.
 
-        self.client = Groq(api_key=api_key)
-        logging.info("Groq client initialized successfully")
+        Args:
+            prompt (str): Full user prompt
+            stats (dict): Per-quiz counters to update
 
-    def _generate_mcq_with_groq(self, context: str, topic: str) -> dict:
+        Returns:
+            str: Raw model response text
+        """
+        start = time.perf_counter()
+        response = self.scheduler.complete(
+            model=MODEL_NAME,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=TEMPERATURE
+        )
+        elapsed = time.perf_counter() - start
+
+        metrics.observe_stage("llm_call", elapsed)
+        metrics.LLM_CALLS.inc()
+        metrics.LLM_TOKENS.inc(response.prompt_tokens, kind="prompt")
+        metrics.LLM_TOKENS.inc(response.completion_tokens, kind="completion")
+
+        with self._stats_lock:
+            stats["llm_calls"] += 1
+            stats["llm_seconds"] += elapsed
+            stats["prompt_tokens"] += response.prompt_tokens
+            stats["completion_tokens"] += response.completion_tokens
+
+        return (response.content or "").strip()
+
+    @staticmethod
+    def _parse_json(raw: str):
+        """
+        Parse a JSON response, stripping markdown code fences if present.
+        """
+        if "```" in raw:
+            raw = raw.split("```")[1]
+            if raw.startswith("json"):
+                raw = raw[4:]
+        return json.loads(raw.strip())
+
+    @staticmethod
+    def _validate_mcq(mcq) -> bool:
+        """
+        Check one MCQ has a question, exactly 4 options and
+        a correct answer that is one of the options.
+
+        Args:
+            mcq (dict): Parsed MCQ
+
+        Returns:
+            bool: True if the MCQ is usable
+        """
+        if not isinstance(mcq, dict) or not all(k in mcq for k in ["question", "options", "correct_answer"]):
+            logging.warning("Invalid MCQ structure from Groq")
+            metrics.VALIDATION_REJECTS.inc()
+            return False
+
+        if not isinstance(mcq["options"], list) or len(mcq["options"]) != 4:
+            logging.warning("MCQ does not have 4 options")
+            metrics.VALIDATION_REJECTS.inc()
+            return False
+
+        if mcq["correct_answer"] not in mcq["options"]:
+            logging.warning("Correct answer not in options")
+            metrics.VALIDATION_REJECTS.inc()
+            return False
+
+        return True
+
+    @staticmethod
+    def _cache_key(prompt: str, variant: int) -> str:
+        # variant separates repeats of the same prompt within one quiz,
+        # which would otherwise all be served the same cached question
+        return LLMResponseCache.make_key(
+            MODEL_NAME, prompt, {"temperature": TEMPERATURE, "variant": variant}
+        )
+
+    def _cache_get(self, key: str, stats: dict, fresh: bool):
+        if self.response_cache is None or fresh:
+            return None
+
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            metrics.LLM_CACHE_HITS.inc()
+            with self._stats_lock:
+                stats["cache_hits"] += 1
+        return cached
+
+    def _cache_put(self, key: str, value) -> None:
+        if self.response_cache is not None:
+            self.response_cache.put(key, value)
+
+    def _generate_mcq_with_groq(self, context: str, topic: str, stats: dict = None,
+                                fresh: bool = False, variant: int = 0) -> dict:
         """
         Generate ONE MCQ from retrieved context chunks + user topic.
 
         Args:
             context (str): Retrieved relevant text chunks joined together
             topic (str): User's topic query e.g. "Gradient Descent"
+            stats (dict): Per-quiz counters to update
+            fresh (bool): Skip cached responses and ask the model again
+            variant (int): Occurrence of this same context within the quiz
 
         Returns:
             dict: MCQ with question, options, correct_answer
@@ -164,15 +317,7 @@ class QuestionGenerator:
 Context:
 {context}
 
-Rules:
-- Question must be based STRICTLY on the provided context
-- Question must test understanding of "{topic}", NOT just recall of a word
-- Question must be clear and specific
-- Provide exactly 4 options
-- Only ONE option should be correct
-- Wrong options must be plausible but clearly wrong
-- Do NOT use fill-in-the-blank style
-- Do NOT make up information outside the context
+{MCQ_RULES.format(topic=topic)}
 
 Respond in this exact JSON format only, no extra text, no markdown:
 {{
@@ -181,44 +326,159 @@ Respond in this exact JSON format only, no extra text, no markdown:
   "correct_answer": "the correct option text here"
 }}"""
 
-        try:
-            response = self.client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7
-            )
-
-            raw = response.choices[0].message.content.strip()
+        stats = stats if stats is not None else self._new_stats()
+        key = self._cache_key(prompt, variant)
 
-            # Clean markdown code blocks if present
-            if "```" in raw:
-                raw = raw.split("```")[1]
-                if raw.startswith("json"):
-                    raw = raw[4:]
-            raw = raw.strip()
+        cached = self._cache_get(key, stats, fresh)
+        if cached is not None:
+            return cached
 
-            mcq = json.loads(raw)
-
-            # Validate structure
-            if not all(k in mcq for k in ["question", "options", "correct_answer"]):
-                logging.warning("Invalid MCQ structure from Groq")
-                return None
-
-            if len(mcq["options"]) != 4:
-                logging.warning("MCQ does not have 4 options")
-                return None
+        try:
+            mcq = self._parse_json(self._complete(prompt, stats))
 
-            if mcq["correct_answer"] not in mcq["options"]:
-                logging.warning("Correct answer not in options")
+            if not self._validate_mcq(mcq):
                 return None
 
+            self._cache_put(key, mcq)
             return mcq
 
-        except Exception as e:
+        except (json.JSONDecodeError, KeyError, ValueError) as e:
+            # Backend errors (LLMUnavailableError, LLMRequestError) propagate
+            metrics.LLM_FAILURES.inc(reason="invalid_response")
             logging.warning(f"Groq generation failed: {e}")
             return None
 
-    def generate_mcqs(self, retrieved_chunks: list, topic: str, num_questions: int = 5) -> list:
+    def _generate_mcq_batch_with_groq(self, context: str, topic: str, num_questions: int,
+                                      avoid_questions: list, stats: dict, fresh: bool = False) -> list:
+        """
+        Generate several MCQs with ONE prompt over a shared context.
+
+        Args:
+            context (str): Deduplicated retrieved chunks, sent once
+            topic (str): User's topic query
+            num_questions (int): Number of MCQs to ask for
+            avoid_questions (list): Questions already accepted (follow-up rounds)
+            stats (dict): Per-quiz counters to update
+            fresh (bool): Skip cached responses and ask the model again
+
+        Returns:
+            list: Valid MCQs from the response
+        """
+        avoid = ""
+        if avoid_questions:
+            listed = "\n".join(f"- {q}" for q in avoid_questions)
+            avoid = f"\nDo NOT repeat or paraphrase these existing questions:\n{listed}\n"
+
+        prompt = f"""You are an expert MCQ generator. Using ONLY the context provided below, generate {num_questions} DIFFERENT high-quality multiple choice questions specifically about the topic: "{topic}". Each question must test a different fact or idea.
+
+Context:
+{context}
+
+{MCQ_RULES.format(topic=topic)}
+{avoid}
+Respond with a JSON array of exactly {num_questions} objects in this exact format only, no extra text, no markdown:
+[
+  {{
+    "question": "your question here?",
+    "options": ["option A", "option B", "option C", "option D"],
+    "correct_answer": "the correct option text here"
+  }}
+]"""
+
+        key = self._cache_key(prompt, 0)
+
+        cached = self._cache_get(key, stats, fresh)
+        if cached is not None:
+            return cached
+
+        try:
+            parsed = self._parse_json(self._complete(prompt, stats))
+
+            # Accept {"questions": [...]} or a bare object as well as a list
+            if isinstance(parsed, dict):
+                parsed = parsed.get("questions", [parsed])
+
+            if not isinstance(parsed, list):
+                return []
+
+            mcqs = [mcq for mcq in parsed if self._validate_mcq(mcq)]
+            if mcqs:
+                self._cache_put(key, mcqs)
+            return mcqs
+
+        except (json.JSONDecodeError, KeyError, ValueError) as e:
+            metrics.LLM_FAILURES.inc(reason="invalid_response")
+            logging.warning(f"Groq batch generation failed: {e}")
+            return []
+
+    @staticmethod
+    def _accept(mcq: dict, dedup: QuestionDeduplicator) -> bool:
+        if not mcq:
+            return False
+        if dedup.add(mcq):
+            return True
+        metrics.DUPLICATE_REJECTS.inc()
+        return False
+
+    @staticmethod
+    def _context_chunks(retrieved_chunks: list, num_questions: int) -> list:
+        """
+        Pick the chunks for each question's prompt context.
+
+        Strategy: use different chunks for different questions
+        to ensure variety in MCQs — rotate through the chunks and
+        combine 2 neighbouring chunks for richer context.
+
+        Args:
+            retrieved_chunks (list): Relevant chunks from FAISS retrieval
+            num_questions (int): Number of MCQs to generate
+
+        Returns:
+            list: List of chunks for each question, in question order
+        """
+        context_chunks = []
+        for i in range(num_questions):
+            chunk_index = i % len(retrieved_chunks)
+            next_index = (i + 1) % len(retrieved_chunks)
+
+            chunks = [retrieved_chunks[chunk_index]]
+            if len(retrieved_chunks) > 1:
+                chunks.append(retrieved_chunks[next_index])
+            context_chunks.append(chunks)
+        return context_chunks
+
+    @staticmethod
+    def _with_source_pages(mcq: dict, chunks: list) -> dict:
+        """
+        Args:
+            mcq (dict): Validated MCQ (possibly the cached object)
+            chunks (list): Chunks that made up the MCQ's prompt context
+
+        Returns:
+            dict: Copy of the MCQ citing the pages those chunks come from,
+                or the MCQ itself when no chunk knows its page
+        """
+        pages = sorted({chunk.page for chunk in chunks if getattr(chunk, "page", None)})
+        return dict(mcq, source_pages=pages) if pages else mcq
+
+    @staticmethod
+    def _new_stats() -> dict:
+        return {"llm_calls": 0, "cache_hits": 0, "prompt_tokens": 0,
+                "completion_tokens": 0, "llm_seconds": 0.0, "duplicates": 0}
+
+    def _new_deduplicator(self, retrieved_chunks: list, embedding_generator=None):
+        """
+        Near-duplicate filter for one quiz. Uses the document's fitted
+        vectorizer when given; otherwise hashed TF-IDF with IDF taken
+        from the retrieved chunks.
+        """
+        if embedding_generator is None or not embedding_generator.is_fitted:
+            embedding_generator = HashingEmbeddingGenerator()
+            embedding_generator.partial_fit(list(retrieved_chunks))
+        return QuestionDeduplicator(embedding_generator, self.dedup_threshold)
+
+    def generate_mcqs(self, retrieved_chunks: list, topic: str, num_questions: int = 5,
+                      fresh: bool = False, embedding_generator=None) -> list:
         """
         Generate multiple MCQs from retrieved RAG chunks.
 
@@ -226,51 +486,171 @@ Respond in this exact JSON format only, no extra text, no markdown:
             retrieved_chunks (list): Relevant chunks from FAISS retrieval
             topic (str): User's topic query
             num_questions (int): Number of MCQs to generate
+            fresh (bool): Ask the model for new questions instead of reusing
+                cached ones; the new questions replace the cached entries
+            embedding_generator: The document's fitted embedding generator,
+                used to detect paraphrased duplicate questions
 
         Returns:
             list: List of MCQ dictionaries
         """
+        # Question order (and which of two duplicates is kept) must not
+        # depend on which request happened to finish first
+        return list(self.iter_mcqs(retrieved_chunks, topic, num_questions, fresh,
+                                   embedding_generator, ordered=True))
+
+    def iter_mcqs(self, retrieved_chunks: list, topic: str, num_questions: int = 5,
+                  fresh: bool = False, embedding_generator=None, ordered: bool = False):
+        """
+        Generate MCQs from retrieved RAG chunks, yielding each validated,
+        de-duplicated MCQ as soon as it is ready — the first question
+        arrives after one LLM round-trip instead of after the whole quiz.
+
+        Args:
+            retrieved_chunks (list): Relevant chunks from FAISS retrieval
+            topic (str): User's topic query
+            num_questions (int): Number of MCQs to generate
+            fresh (bool): Ask the model for new questions instead of reusing
+                cached ones; the new questions replace the cached entries
+            embedding_generator: The document's fitted embedding generator,
+                used to detect paraphrased duplicate questions
+            ordered (bool): Yield concurrent questions in question order
+                instead of as each request completes
+
+        Yields:
+            dict: MCQ with question, shuffled options, correct_answer
+        """
         try:
             logging.info(f"Generating {num_questions} MCQs for topic: {topic}")
 
             if not retrieved_chunks:
                 logging.warning("No chunks provided for MCQ generation")
-                return []
+                return
+
+            stats = self._new_stats()
+            start = time.perf_counter()
+            count = 0
+            dedup = self._new_deduplicator(retrieved_chunks, embedding_generator)
+
+            if self.generation_mode == "batched":
+                candidates = self._iter_batched(retrieved_chunks, topic, num_questions, stats,
+                                                dedup, fresh)
+            else:
+                candidates = self._iter_per_question(retrieved_chunks, topic, num_questions, stats,
+                                                     dedup, fresh, ordered)
+
+            for mcq in candidates:
+                random.shuffle(mcq["options"])
+                count += 1
+
+                metrics.QUESTIONS_GENERATED.inc()
+                if count == 1:
+                    metrics.observe_stage("first_question", time.perf_counter() - start)
+                    logging.info(f"First MCQ ready after {time.perf_counter() - start:.2f}s")
+                yield mcq
+
+            stats["wall_seconds"] = time.perf_counter() - start
+            metrics.observe_stage("question_generation", stats["wall_seconds"])
+            stats["questions"] = count
+            stats["duplicates"] = dedup.rejected
+            self.last_quiz_stats = stats
+
+            logging.info(
+                f"Successfully generated {count} MCQs for topic: {topic} "
+                f"({stats['llm_calls']} calls, {stats['cache_hits']} cache hits, "
+                f"{stats['duplicates']} near-duplicates rejected, "
+                f"{stats['prompt_tokens']} prompt tokens, "
+                f"{stats['wall_seconds']:.2f}s)"
+            )
 
-            mcqs = []
+        except LLMUnavailableError as e:
+            # Surface an unhealthy upstream or a rejected request
+            # instead of returning a short quiz
+            logging.error(f"MCQ generation aborted for topic: {topic} ({e})")
+            raise
 
-            # Strategy: use different chunks for different questions
-            # to ensure variety in MCQs
-            for i in range(num_questions):
+        except Exception as e:
+            logging.error("Error in MCQ generation")
+            raise CustomException(e, sys)
 
-                if not retrieved_chunks:
-                    break
+    def _iter_per_question(self, retrieved_chunks: list, topic: str,
+                           num_questions: int, stats: dict, dedup: QuestionDeduplicator,
+                           fresh: bool = False, ordered: bool = False):
+        """
+        One prompt per question, sent concurrently up to max_concurrency.
+        Valid, non-duplicate MCQs are yielded in completion order, or in
+        question order when ordered; each duplicate is one wasted request
+        (counted in mcq_duplicate_rejects_total).
+        """
+        context_chunks = self._context_chunks(retrieved_chunks, num_questions)
+        contexts = ["\n\n".join(chunks) for chunks in context_chunks]
+
+        # Number repeated contexts so each repeat has its own cache entry
+        occurrences = {}
+        variants = []
+        for context in contexts:
+            variants.append(occurrences.get(context, 0))
+            occurrences[context] = variants[-1] + 1
+
+        if self.max_concurrency == 1 or len(contexts) == 1:
+            for context, variant, chunks in zip(contexts, variants, context_chunks):
+                mcq = self._generate_mcq_with_groq(context, topic, stats, fresh, variant)
+                if self._accept(mcq, dedup):
+                    yield self._with_source_pages(mcq, chunks)
+            return
+
+        # Requests are independent, so they run concurrently
+        workers = min(self.max_concurrency, len(contexts))
+        logging.info(f"Generating {len(contexts)} MCQs with {workers} concurrent requests")
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = {
+                executor.submit(self._generate_mcq_with_groq, context, topic, stats, fresh, variant): chunks
+                for context, variant, chunks in zip(contexts, variants, context_chunks)
+            }
+            for future in futures if ordered else as_completed(futures):
+                mcq = future.result()
+                if self._accept(mcq, dedup):
+                    yield self._with_source_pages(mcq, futures[future])
+        finally:
+            # A consumer that stops early should not pay for the rest
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _iter_batched(self, retrieved_chunks: list, topic: str,
+                      num_questions: int, stats: dict, dedup: QuestionDeduplicator,
+                      fresh: bool = False):
+        """
+        Ask for all questions in one prompt over the deduplicated context,
+        then issue follow-up prompts only for rejected, duplicate or
+        missing questions. MCQs are yielded as each response is parsed.
+        """
+        # Each chunk is sent once, however many questions it supports
+        chunks = list(dict.fromkeys(retrieved_chunks))
+        context = "\n\n".join(chunks)
 
-                # Rotate through chunks for variety
-                # Use 2 chunks per question for richer context
-                chunk_index = i % len(retrieved_chunks)
-                next_index = (i + 1) % len(retrieved_chunks)
+        accepted = []
 
-                # Combine 2 chunks for better context
-                context = retrieved_chunks[chunk_index]
-                if len(retrieved_chunks) > 1:
-                    context = retrieved_chunks[chunk_index] + "\n\n" + retrieved_chunks[next_index]
+        for round_number in range(self.max_batch_rounds):
+            shortfall = num_questions - len(accepted)
+            if shortfall <= 0:
+                break
 
-                logging.info(f"Generating MCQ {i+1}/{num_questions}")
-                mcq = self._generate_mcq_with_groq(context, topic)
+            if round_number > 0:
+                logging.info(f"Batched generation short by {shortfall} MCQs — follow-up request")
 
-                if mcq:
-                    # Avoid duplicate questions
-                    if mcq["question"] not in [m["question"] for m in mcqs]:
-                        random.shuffle(mcq["options"])
-                        mcqs.append(mcq)
+            candidates = self._generate_mcq_batch_with_groq(
+                context, topic, shortfall, accepted, stats, fresh
+            )
 
-            logging.info(f"Successfully generated {len(mcqs)} MCQs for topic: {topic}")
-            return mcqs
+            for mcq in candidates:
+                if len(accepted) >= num_questions:
+                    break
+                if self._accept(mcq, dedup):
+                    accepted.append(mcq["question"])
+                    # Every question saw the whole shared context
+                    yield self._with_source_pages(mcq, chunks)
 
-        except Exception as e:
-            logging.error("Error in MCQ generation")
-            raise CustomException(e, sys)
 '''
 
 ---
@@ -0,0 +1,256 @@
+# src/components/resource_manager.py
+
+import os
+import threading
+from collections import OrderedDict
+
+from src.utils import metrics
+from src.logger.logger import logging
+
+# Memory allowed for all document indexes in the process
+MEMORY_BUDGET_MB = float(os.getenv("MCQ_MEMORY_BUDGET_MB", "512"))
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+class ResourceManager:
+
+    def __init__(self, memory_budget_mb: float = MEMORY_BUDGET_MB):
+        """
+        Process-wide store of document indexes shared by all sessions.
+
+        Indexes are keyed by content fingerprint (document bytes plus
+        chunker / vectorizer settings), so sessions working on the same
+        document share one Retriever and memory grows with the number
+        of distinct documents, not users. Each index is sized with
+        Retriever.memory_bytes(); when the total exceeds the budget the
+        least recently used indexes are dropped. Sessions keep only keys
+        and reload an evicted index on next use (from the IndexCache).
+        Indexes that cannot be reloaded (session-private appends, or no
+        IndexCache) are pinned: they count towards the budget but are
+        never evicted while pinned.
+
+        memory_budget_mb: Total size of indexes kept in memory
+        """
+        self.memory_budget = int(memory_budget_mb * 1024 * 1024)
+        self._entries = OrderedDict()  # key -> (retriever, size), least recently used first
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._loading = {}  # key -> lock held while that key is being built/loaded
+        self._pins = {}  # key -> number of holders that cannot reload it
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _peek(self, key: str):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def get(self, key: str):
+        """
+        Args:
+            key (str): Index key
+
+        Returns:
+            Retriever: The shared index, or None if not in memory
+        """
+        with self._lock:
+            retriever = self._peek(key)
+            if retriever is not None:
+                self.hits += 1
+            return retriever
+
+    def pin(self, key: str) -> None:
+        """
+        Keep an index in memory until unpin(); pins are counted, so
+        every pin needs its own unpin.
+
+        Args:
+            key (str): Index key
+        """
+        with self._lock:
+            self._pins[key] = self._pins.get(key, 0) + 1
+
+    def unpin(self, key: str) -> None:
+        """
+        Release one pin. The index becomes evictable again once no pins
+        are left; it is evicted at the next insertion if over budget.
+
+        Args:
+            key (str): Index key
+        """
+        with self._lock:
+            count = self._pins.get(key, 0) - 1
+            if count > 0:
+                self._pins[key] = count
+            else:
+                self._pins.pop(key, None)
+
+    def _get_pinned(self, key: str, pin: bool):
+        with self._lock:
+            retriever = self._peek(key)
+            if retriever is not None:
+                self.hits += 1
+                if pin:
+                    self._pins[key] = self._pins.get(key, 0) + 1
+            return retriever
+
+    def get_or_load(self, key: str, loader, pin: bool = False):
+        """
+        Return the shared index for key, calling loader() on a miss.
+
+        Concurrent misses on the same key wait for a single load, so a
+        class uploading the same handout builds its index once.
+
+        Args:
+            key (str): Index key
+            loader (callable): Returns a ready Retriever, or None if the
+                               index cannot be produced
+            pin (bool): Pin the returned index (in the same step, so it
+                        cannot be evicted before the caller registers it)
+
+        Returns:
+            Retriever: The shared index, or None if loader() returned None
+        """
+        retriever = self._get_pinned(key, pin)
+        if retriever is not None:
+            return retriever
+
+        with self._lock:
+            key_lock = self._loading.setdefault(key, threading.Lock())
+
+        try:
+            with key_lock:
+                # Another session may have finished loading while we waited
+                retriever = self._get_pinned(key, pin)
+                if retriever is not None:
+                    return retriever
+
+                with self._lock:
+                    self.misses += 1
+                retriever = loader()
+                if retriever is not None:
+                    self.put(key, retriever, pin=pin)
+                return retriever
+
+        finally:
+            with self._lock:
+                if self._loading.get(key) is key_lock:
+                    del self._loading[key]
+
+    def put(self, key: str, retriever, pin: bool = False) -> None:
+        """
+        Add or replace an index, then evict cold indexes over budget.
+        The index just added is never evicted by its own insertion.
+
+        Args:
+            key (str): Index key
+            retriever (Retriever): Ready retriever
+            pin (bool): Also pin the index (see pin())
+        """
+        size = retriever.memory_bytes()  # outside the lock — walks the chunks
+        with self._lock:
+            if pin:
+                self._pins[key] = self._pins.get(key, 0) + 1
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total_bytes -= old[1]
+            self._entries[key] = (retriever, size)
+            self._total_bytes += size
+            evicted = self._evict_over_budget(keep=key)
+
+        for evicted_key, evicted_size in evicted:
+            metrics.INDEX_EVICTIONS.inc()
+            logging.info(
+                f"Evicted index {evicted_key[:12]} ({evicted_size / 1e6:.1f} MB) — "
+                f"{self._total_bytes / 1e6:.1f}/{self.memory_budget / 1e6:.1f} MB in use"
+            )
+
+    def update_size(self, key: str) -> None:
+        """
+        Re-measure an index that grew in place (e.g. after add_chunks).
+
+        Args:
+            key (str): Index key
+        """
+        retriever = self.get(key)
+        if retriever is not None:
+            self.put(key, retriever)
+
+    def _evict_over_budget(self, keep: str) -> list:
+        # Caller holds self._lock. Pinned indexes cannot be reloaded, so
+        # they are skipped; the budget may stay exceeded if only they remain.
+        evicted = []
+        if self._total_bytes <= self.memory_budget:
+            return evicted
+        for key in list(self._entries):  # least recently used first
+            if self._total_bytes <= self.memory_budget:
+                break
+            if key == keep or key in self._pins:
+                continue
+            _, size = self._entries.pop(key)
+            self._total_bytes -= size
+            self.evictions += 1
+            evicted.append((key, size))
+        if self._total_bytes > self.memory_budget:
+            logging.warning(
+                f"Index memory {self._total_bytes / 1e6:.1f} MB is over budget "
+                f"({self.memory_budget / 1e6:.1f} MB); the rest is pinned or in use"
+            )
+        return evicted
+
+    def remove(self, key: str) -> bool:
+        """
+        Drop an index from memory.
+
+        Args:
+            key (str): Index key
+
+        Returns:
+            bool: True if the index was held
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+            self._total_bytes -= entry[1]
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._pins.clear()
+            self._total_bytes = 0
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: indexes, pinned indexes, bytes in use, budget, hits, misses, evictions
+        """
+        with self._lock:
+            return {
+                "indexes": len(self._entries),
+                "pinned": sum(key in self._entries for key in self._pins),
+                "bytes": self._total_bytes,
+                "budget_bytes": self.memory_budget,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def get_resource_manager() -> ResourceManager:
+    """
+    Returns:
+        ResourceManager: The process-wide manager (created on first call
+        with MCQ_MEMORY_BUDGET_MB)
+    """
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = ResourceManager()
+        return _manager
@@ -1,38 +1,104 @@
 # src/components/retriever.py
 
+import os
 import sys
+import copy
+import itertools
+import threading
+from collections import OrderedDict
 
 from src.components.embedding_generator import EmbeddingGenerator
+from src.components.hashing_embedding_generator import HashingEmbeddingGenerator
 from src.components.vector_store import VectorStore
+from src.components.sparse_vector_store import SparseVectorStore
 
-from src.logger.logger import logging
+from src.utils import metrics
+from src.logger.logger import logging, log_event
 from src.exception.custom_exception import CustomException
 
+# Process-wide, so versions never repeat even across Retriever instances
+_index_versions = itertools.count(1)
+
 
 class Retriever:
 
-    def __init__(self):
+    def __init__(self, index_mode: str = "dense", embedding_mode: str = "tfidf",
+                 index_params: dict = None, query_cache_size: int = 256):
         """
         Initialize Retriever with EmbeddingGenerator and VectorStore.
         This is the core of the RAG pipeline —
         it connects embedding search with vector storage.
+
+        index_mode: "dense" — FAISS over dense TF-IDF vectors
+                    "sparse" — CSR TF-IDF matrix end to end (SparseVectorStore)
+        embedding_mode: "tfidf" — TfidfVectorizer refitted per document
+                        "hashing" — fit-free HashingEmbeddingGenerator with
+                        streaming IDF, for appending via add_chunks()
+        index_params: Extra VectorStore options for dense mode, e.g.
+                      {"index_type": "hnsw", "ef_search": 128}
+        query_cache_size: Max entries in the LRU cache of query embeddings
+                          and results (0 disables caching)
         """
         try:
-            self.embedding_generator = EmbeddingGenerator()
-            self.vector_store = VectorStore()
+            if index_mode not in ("dense", "sparse"):
+                raise ValueError(f"Unknown index_mode: {index_mode}")
+            if embedding_mode not in ("tfidf", "hashing"):
+                raise ValueError(f"Unknown embedding_mode: {embedding_mode}")
+
+            self.index_mode = index_mode
+            self.embedding_mode = embedding_mode
+            if embedding_mode == "hashing":
+                self.embedding_generator = HashingEmbeddingGenerator()
+            else:
+                self.embedding_generator = EmbeddingGenerator()
+            if index_mode == "dense":
+                self.vector_store = VectorStore(**(index_params or {}))
+            else:
+                self.vector_store = SparseVectorStore()
+
+            # LRU cache: normalized query -> (index version, embedding, top_k, results)
+            self.query_cache_size = query_cache_size
+            self._query_cache = OrderedDict()
+            self._cache_lock = threading.Lock()
+            self.cache_hits = 0
+            self.cache_misses = 0
+            self.index_version = next(_index_versions)
+
             logging.info("Retriever initialized successfully")
 
         except Exception as e:
             logging.error("Error initializing Retriever")
             raise CustomException(e, sys)
 
-    def index_chunks(self, chunks: list) -> None:
+    def clone(self) -> "Retriever":
+        """
+        Copy of this retriever that add_chunks() can extend without
+        touching the original (e.g. a session appending to a shared
+        document). Vectors and vectorizer state are copied, not
+        recomputed, so only the appended chunks are ever embedded.
+
+        Returns:
+            Retriever: Ready retriever with an empty query cache
+        """
+        try:
+            clone = Retriever(self.index_mode, self.embedding_mode,
+                              query_cache_size=self.query_cache_size)
+            clone.embedding_generator = copy.deepcopy(self.embedding_generator)
+            clone.vector_store = self.vector_store.copy()
+            return clone
+
+        except Exception as e:
+            logging.error("Error cloning retriever")
+            raise CustomException(e, sys)
+
+    def index_chunks(self, chunks: list, batch_size: int = 1024) -> None:
         """
         Convert chunks to embeddings and store in FAISS index.
         Called once after PDF is uploaded and chunked.
 
         Args:
             chunks (list): List of text chunks from PDF
+            batch_size (int): Chunks embedded and added to FAISS at a time
         """
         try:
             logging.info(f"Indexing {len(chunks)} chunks")
@@ -41,11 +107,32 @@ class Retriever:
                 logging.warning("No chunks to index")
                 return
 
-            # Step 1: Generate embeddings for all chunks
-            embeddings = self.embedding_generator.generate_embeddings(chunks)
+            # A new document replaces the index — start from fresh statistics
+            self.embedding_generator.reset()
+
+            if self.index_mode == "sparse":
+                with metrics.timer("embed"):
+                    embeddings = self.embedding_generator.generate_sparse_embeddings(chunks)
+                with metrics.timer("index_build"):
+                    self.vector_store.build_index(chunks, embeddings)
+                self.invalidate_cache()
+                metrics.CHUNKS_INDEXED.inc(len(chunks))
+                logging.info("Chunks indexed successfully")
+                return
+
+            # Step 1: Learn TF-IDF vocabulary from all chunks
+            with metrics.timer("embed_fit"):
+                self.embedding_generator.fit(chunks)
 
-            # Step 2: Build FAISS index
-            self.vector_store.build_index(chunks, embeddings)
+            # Step 2: Embed and add to FAISS one batch at a time
+            # (embedding runs lazily inside the build, so both are timed together)
+            with metrics.timer("embed_index_build"):
+                self.vector_store.build_index_from_batches(
+                    chunks,
+                    self.embedding_generator.generate_embedding_batches(chunks, batch_size)
+                )
+            self.invalidate_cache()
+            metrics.CHUNKS_INDEXED.inc(len(chunks))
 
             logging.info("Chunks indexed successfully")
 
@@ -53,6 +140,42 @@ class Retriever:
             logging.error("Error indexing chunks")
             raise CustomException(e, sys)
 
+    def add_chunks(self, chunks: list) -> None:
+        """
+        Append chunks (e.g. a new chapter) to the live index.
+        Only the new chunks are embedded; vectors already in the
+        index are kept as they are. Builds a fresh index if none exists.
+
+        Args:
+            chunks (list): New text chunks
+        """
+        try:
+            logging.info(f"Adding {len(chunks)} chunks to index")
+
+            if not chunks:
+                logging.warning("No chunks to add")
+                return
+
+            if not self.is_ready():
+                self.index_chunks(chunks)
+                return
+
+            with metrics.timer("embed"):
+                embeddings = self.embedding_generator.generate_incremental_embeddings(
+                    chunks,
+                    sparse=self.index_mode == "sparse"
+                )
+            with metrics.timer("index_add"):
+                self.vector_store.add(chunks, embeddings)
+            self.invalidate_cache()
+            metrics.CHUNKS_INDEXED.inc(len(chunks))
+
+            logging.info("Chunks added successfully")
+
+        except Exception as e:
+            logging.error("Error adding chunks")
+            raise CustomException(e, sys)
+
     def retrieve(self, query: str, top_k: int = 5) -> list:
         """
         Retrieve most relevant chunks for a given topic query.
@@ -65,9 +188,21 @@ class Retriever:
         Returns:
             list: Most relevant text chunks for the query
         """
-        try:
-            logging.info(f"Retrieving chunks for query: {query}")
+        return [chunk for chunk, _ in self.retrieve_with_scores(query, top_k)]
+
+    def retrieve_with_scores(self, query: str, top_k: int = 5) -> list:
+        """
+        Retrieve most relevant chunks for a query with their similarity
+        scores, so results from several documents can be merged.
+
+        Args:
+            query (str): User's topic query e.g. "Gradient Descent"
+            top_k (int): Number of relevant chunks to retrieve
 
+        Returns:
+            list: (chunk, score) tuples, best first
+        """
+        try:
             if not self.vector_store.is_ready():
                 logging.warning("Vector store not ready — index PDF first")
                 return []
@@ -76,22 +211,202 @@ class Retriever:
                 logging.warning("Empty query provided")
                 return []
 
-            # Step 1: Convert user query to embedding
-            query_embedding = self.embedding_generator.generate_single_embedding(query)
+            # The vectorizers lowercase and split on whitespace,
+            # so these variants embed identically
+            cache_key = " ".join(query.lower().split())
+            version = self.index_version
+            cached = self._cache_get(cache_key, version)
+
+            if cached is not None:
+                query_embedding, cached_top_k, cached_results = cached
+                if top_k <= cached_top_k:
+                    metrics.QUERY_CACHE_HITS.inc()
+                    log_event(logging.DEBUG, "Query cache hit", sampled=True,
+                              query_chars=len(query), top_k=top_k)
+                    return list(cached_results[:top_k])
+            else:
+                query_embedding = None
+
+            # Step 1: Convert user query to embedding (reused if cached)
+            if query_embedding is None:
+                with metrics.timer("query_embed"):
+                    if self.index_mode == "sparse":
+                        query_embedding = self.embedding_generator.generate_single_sparse_embedding(query)
+                    else:
+                        query_embedding = self.embedding_generator.generate_single_embedding(query)
+
+            # Step 2: Search the index for similar chunks
+            with metrics.timer("vector_search"):
+                relevant_chunks = self.vector_store.search_with_scores(
+                    query_embedding,
+                    top_k=top_k
+                )
+            metrics.SEARCHES.inc()
+            metrics.VECTORS_SEARCHED.inc(len(self.vector_store.chunks))
+
+            self._cache_put(cache_key, version, query_embedding, top_k, relevant_chunks)
+
+            log_event(logging.INFO, "Retrieved chunks", sampled=True,
+                      query_chars=len(query), top_k=top_k, results=len(relevant_chunks))
+            return list(relevant_chunks)
+
+        except Exception as e:
+            logging.error("Error retrieving chunks")
+            raise CustomException(e, sys)
 
-            # Step 2: Search FAISS for similar chunks
-            relevant_chunks = self.vector_store.search(
-                query_embedding,
-                top_k=top_k
-            )
+    def _cache_get(self, key: str, version: int):
+        """
+        Look up a query in the LRU cache.
+        Entries from an older index version count as misses.
 
-            logging.info(f"Retrieved {len(relevant_chunks)} chunks for query: {query}")
-            return relevant_chunks
+        Returns:
+            tuple: (embedding, top_k, results), or None on a miss
+        """
+        with self._cache_lock:
+            entry = self._query_cache.get(key)
+            if entry is None or entry[0] != version:
+                self.cache_misses += 1
+                return None
+            self._query_cache.move_to_end(key)
+            self.cache_hits += 1
+            return entry[1:]
+
+    def _cache_put(self, key: str, version: int, embedding, top_k: int, results: list) -> None:
+        if self.query_cache_size <= 0:
+            return
+        with self._cache_lock:
+            # An index rebuild may have finished while this query was searching
+            if version != self.index_version:
+                return
+            self._query_cache[key] = (version, embedding, top_k, tuple(results))
+            self._query_cache.move_to_end(key)
+            while len(self._query_cache) > self.query_cache_size:
+                self._query_cache.popitem(last=False)
+
+    def invalidate_cache(self) -> None:
+        """
+        Move to a new index version so no cached query result from
+        the previous index can be returned. Called on every rebuild.
+        """
+        with self._cache_lock:
+            self.index_version = next(_index_versions)
+            self._query_cache.clear()
+
+    def cache_stats(self) -> dict:
+        """
+        Returns:
+            dict: Query cache hits, misses, current size and index version
+        """
+        with self._cache_lock:
+            return {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+                "size": len(self._query_cache),
+                "max_size": self.query_cache_size,
+                "index_version": self.index_version
+            }
+
+    def retrieve_many(self, queries: list, top_k: int = 5) -> list:
+        """
+        Retrieve relevant chunks for many topic queries at once.
+        All queries are embedded with one vectorizer transform and
+        searched with one index call, instead of one of each per query.
+
+        Args:
+            queries (list): Topic queries e.g. a syllabus topic list
+            top_k (int): Number of chunks to retrieve per query
+
+        Returns:
+            list: One list of (chunk, score) tuples per query, in input order
+        """
+        try:
+            logging.info(f"Retrieving chunks for {len(queries)} queries")
+
+            results = [[] for _ in queries]
+
+            if not self.vector_store.is_ready():
+                logging.warning("Vector store not ready — index PDF first")
+                return results
+
+            # Empty queries get no results, as in retrieve()
+            positions = [i for i, q in enumerate(queries) if q and len(q.strip()) > 0]
+            if not positions:
+                return results
+
+            with metrics.timer("query_embed_batch"):
+                query_embeddings = self.embedding_generator.generate_query_embeddings(
+                    [queries[i] for i in positions],
+                    sparse=self.index_mode == "sparse"
+                )
+            if query_embeddings is None:
+                return results
+
+            with metrics.timer("vector_search_batch"):
+                found_batch = self.vector_store.search_batch(query_embeddings, top_k=top_k)
+            metrics.SEARCHES.inc(len(positions))
+            metrics.VECTORS_SEARCHED.inc(len(positions) * len(self.vector_store.chunks))
+
+            for i, found in zip(positions, found_batch):
+                results[i] = found
+
+            return results
 
         except Exception as e:
-            logging.error("Error retrieving chunks")
+            logging.error("Error retrieving chunks for query batch")
             raise CustomException(e, sys)
 
+    def save(self, directory: str) -> None:
+        """
+        Persist the fitted vectorizer, FAISS index and chunks.
+
+        Args:
+            directory (str): Target directory
+        """
+        try:
+            self.vector_store.save(directory)
+            self.embedding_generator.save(os.path.join(directory, "vectorizer.pkl"))
+
+        except Exception as e:
+            logging.error("Error saving retriever")
+            raise CustomException(e, sys)
+
+    def load(self, directory: str, memory_map: bool = True) -> None:
+        """
+        Restore a retriever saved with save() — no refitting needed.
+
+        Args:
+            directory (str): Directory written by save()
+            memory_map (bool): Share the index and chunks read-only
+                               through the OS page cache
+        """
+        try:
+            self.embedding_generator.load(os.path.join(directory, "vectorizer.pkl"))
+            self.vector_store.load(directory, memory_map=memory_map)
+            self.invalidate_cache()
+
+        except Exception as e:
+            logging.error("Error loading retriever")
+            raise CustomException(e, sys)
+
+    def memory_bytes(self) -> int:
+        """
+        Approximate memory held by this document's index: vectors,
+        chunk texts, vectorizer state and cached query embeddings.
+        Used by ResourceManager to enforce its memory budget.
+
+        Returns:
+            int: Bytes
+        """
+        total = self.vector_store.memory_bytes() + self.embedding_generator.memory_bytes()
+        with self._cache_lock:
+            embeddings = [entry[1] for entry in self._query_cache.values()]
+        for embedding in embeddings:
+            if hasattr(embedding, "indptr"):
+                total += embedding.data.nbytes + embedding.indices.nbytes + embedding.indptr.nbytes
+            else:
+                total += embedding.nbytes
+        return total
+
     def is_ready(self) -> bool:
         """
         Check if retriever is ready to search.
@@ -0,0 +1,267 @@
+# src/components/sparse_vector_store.py
+
+import os
+import sys
+import numpy as np
+
+from src.components.chunk_store import ChunkStore, as_chunk_store
+from src.utils.lazy_import import lazy_import
+from src.logger.logger import logging, log_event
+from src.exception.custom_exception import CustomException
+
+sparse = lazy_import("scipy.sparse")
+
+MATRIX_FILE = "embeddings.npz"
+
+
+class SparseVectorStore:
+
+    def __init__(self):
+        """
+        Sparse-native alternative to VectorStore.
+
+        Keeps the TF-IDF CSR matrix exactly as the vectorizer produced it
+        and scores a query with one sparse matrix-vector product, so a
+        512-feature bigram matrix with a handful of non-zeros per row is
+        never densified. Same interface as VectorStore.
+        """
+        self.matrix = None     # CSR, one L2-normalized row per chunk
+        self.chunks = ChunkStore.from_texts([])  # chunk offsets into the document text
+        self.dimension = None  # number of vectorizer features
+
+    def copy(self) -> "SparseVectorStore":
+        """
+        Independent store with the same rows and chunks. Both are
+        shared: add() replaces them instead of modifying them in place.
+
+        Returns:
+            SparseVectorStore: Copy of this store
+        """
+        store = SparseVectorStore()
+        store.matrix = self.matrix
+        store.chunks = self.chunks
+        store.dimension = self.dimension
+        return store
+
+    def build_index(self, chunks: list, embeddings) -> None:
+        """
+        Store chunks and their sparse embeddings.
+
+        Args:
+            chunks (ChunkStore | list): Original text chunks
+            embeddings (scipy.sparse.csr_matrix): L2-normalized rows, one per chunk
+        """
+        try:
+            logging.info("Building sparse index")
+
+            if len(chunks) == 0 or embeddings.shape[0] == 0:
+                logging.warning("No chunks or embeddings provided")
+                return
+
+            self.chunks = as_chunk_store(chunks)
+            self.matrix = sparse.csr_matrix(embeddings)
+            self.dimension = self.matrix.shape[1]
+
+            logging.info(f"Sparse index built with {self.matrix.shape[0]} vectors, {self.matrix.nnz} non-zeros")
+
+        except Exception as e:
+            logging.error("Error building sparse index")
+            raise CustomException(e, sys)
+
+    def add(self, chunks: list, embeddings) -> None:
+        """
+        Append new chunks and their sparse embeddings to the index
+        without touching rows already stored.
+
+        Args:
+            chunks (ChunkStore | list): New text chunks
+            embeddings (scipy.sparse.csr_matrix): L2-normalized rows, one per chunk
+        """
+        try:
+            logging.info(f"Adding {len(chunks)} chunks to sparse index")
+
+            if len(chunks) == 0 or embeddings.shape[0] == 0:
+                logging.warning("No chunks or embeddings provided")
+                return
+
+            if self.matrix is None:
+                self.build_index(chunks, embeddings)
+                return
+
+            self.matrix = sparse.vstack([self.matrix, embeddings], format="csr")
+            self.chunks = self.chunks.concat(chunks)
+
+            logging.info(f"Sparse index now holds {self.matrix.shape[0]} vectors")
+
+        except Exception as e:
+            logging.error("Error adding to sparse index")
+            raise CustomException(e, sys)
+
+    def search(self, query_embedding, top_k: int = 5) -> list:
+        """
+        Search for top-k most similar chunks to the query embedding.
+
+        Args:
+            query_embedding (scipy.sparse.csr_matrix): 1 x d L2-normalized query row
+            top_k (int): Number of relevant chunks to retrieve
+
+        Returns:
+            list: Top-k most relevant text chunks
+        """
+        return [chunk for chunk, _ in self.search_with_scores(query_embedding, top_k)]
+
+    def search_with_scores(self, query_embedding, top_k: int = 5) -> list:
+        """
+        Search for top-k most similar chunks, keeping their similarity scores.
+
+        Args:
+            query_embedding (scipy.sparse.csr_matrix): 1 x d L2-normalized query row
+            top_k (int): Number of relevant chunks to retrieve
+
+        Returns:
+            list: (chunk, cosine similarity) tuples, best first
+        """
+        try:
+            if self.matrix is None:
+                logging.warning("Sparse index not built yet")
+                return []
+
+            if query_embedding is None or query_embedding.nnz == 0:
+                # Every chunk scores 0 — return the first top_k, as the dense index does
+                logging.warning("Query has no known terms")
+                return self._unscored(top_k)
+
+            # Cosine similarity of every chunk with the query (rows are unit length)
+            scores = (self.matrix @ query_embedding.T).toarray().ravel()
+
+            top_k = min(top_k, len(scores))
+            top = np.argpartition(-scores, top_k - 1)[:top_k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+
+            retrieved = [(self.chunks[idx], float(scores[idx])) for idx in top]
+
+            log_event(logging.INFO, "Searched sparse index", sampled=True,
+                      top_k=top_k, results=len(retrieved))
+            return retrieved
+
+        except Exception as e:
+            logging.error("Error searching sparse index")
+            raise CustomException(e, sys)
+
+    def _unscored(self, top_k: int) -> list:
+        return [(self.chunks[idx], 0.0) for idx in range(min(top_k, len(self.chunks)))]
+
+    def search_batch(self, query_embeddings, top_k: int = 5, block_size: int = 256) -> list:
+        """
+        Search for the top-k chunks of many queries with sparse matrix products.
+        Queries are scored in blocks so the dense score matrix stays
+        at block_size x num_chunks.
+
+        Args:
+            query_embeddings (scipy.sparse.csr_matrix): One L2-normalized query row each
+            top_k (int): Number of chunks to retrieve per query
+            block_size (int): Queries scored per matrix product
+
+        Returns:
+            list: One list of (chunk, score) tuples per query, best first
+        """
+        try:
+            num_queries = query_embeddings.shape[0]
+            logging.info(f"Batch searching sparse index for {num_queries} queries")
+
+            if self.matrix is None:
+                logging.warning("Sparse index not built yet")
+                return [[] for _ in range(num_queries)]
+
+            top_k = min(top_k, self.matrix.shape[0])
+            results = []
+
+            for start in range(0, num_queries, block_size):
+                block = query_embeddings[start:start + block_size]
+                scores = (block @ self.matrix.T).toarray()
+
+                top = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+                top_scores = np.take_along_axis(scores, top, axis=1)
+                order = np.argsort(-top_scores, axis=1, kind="stable")
+                top = np.take_along_axis(top, order, axis=1)
+
+                for row, query_nnz in enumerate(np.diff(block.indptr)):
+                    if query_nnz == 0:
+                        results.append(self._unscored(top_k))  # no known terms, same as search()
+                        continue
+                    results.append([(self.chunks[idx], float(scores[row, idx])) for idx in top[row]])
+
+            return results
+
+        except Exception as e:
+            logging.error("Error batch searching sparse index")
+            raise CustomException(e, sys)
+
+    def get_settings(self) -> dict:
+        """
+        Index settings that change search results.
+
+        Returns:
+            dict: JSON-serializable index settings
+        """
+        return {"index_type": "sparse"}
+
+    def save(self, directory: str) -> None:
+        """
+        Persist the sparse matrix and chunk texts to a directory.
+
+        Args:
+            directory (str): Target directory (created if missing)
+        """
+        try:
+            logging.info(f"Saving sparse index to {directory}")
+
+            os.makedirs(directory, exist_ok=True)
+            sparse.save_npz(os.path.join(directory, MATRIX_FILE), self.matrix, compressed=False)
+            self.chunks.save(directory)
+
+        except Exception as e:
+            logging.error("Error saving sparse index")
+            raise CustomException(e, sys)
+
+    def load(self, directory: str, memory_map: bool = True) -> None:
+        """
+        Load a sparse index saved with save().
+        The matrix is small enough to read into memory; chunk
+        texts are memory-mapped when memory_map is True.
+
+        Args:
+            directory (str): Directory written by save()
+            memory_map (bool): Memory-map chunk texts instead of reading them
+        """
+        try:
+            logging.info(f"Loading sparse index from {directory}")
+
+            self.matrix = sparse.load_npz(os.path.join(directory, MATRIX_FILE)).tocsr()
+            self.dimension = self.matrix.shape[1]
+            self.chunks = ChunkStore.load(directory, memory_map)
+
+        except Exception as e:
+            logging.error("Error loading sparse index")
+            raise CustomException(e, sys)
+
+    def memory_bytes(self) -> int:
+        """
+        Approximate memory held by the CSR matrix and chunk texts.
+
+        Returns:
+            int: Bytes
+        """
+        total = self.chunks.nbytes()
+        if self.matrix is not None:
+            total += self.matrix.data.nbytes + self.matrix.indices.nbytes + self.matrix.indptr.nbytes
+        return total
+
+    def is_ready(self) -> bool:
+        """
+        Check if sparse store is built and ready for search.
+
+        Returns:
+            bool: True if index is ready, False otherwise
+        """
+        return self.matrix is not None and len(self.chunks) > 0
@@ -1,27 +1,175 @@
 # src/components/text_chunker.py
 
+import bisect
+import os
+import re
 import sys
-from langchain.text_splitter import RecursiveCharacterTextSplitter
+from functools import lru_cache
 
+from src.components.chunk_store import Chunk, ChunkStore
+from src.utils.lazy_import import lazy_import
 from src.logger.logger import logging
 from src.exception.custom_exception import CustomException
 
+# Only the "langchain" engine (kept as the reference implementation) needs LangChain
+text_splitter = lazy_import("langchain.text_splitter")
+
+# Paragraphs first, then lines, sentences and words
+SEPARATORS = ["\n\n", "\n", ".", "!", "?", " "]
+SPLITTER_ENGINES = ("native", "langchain")
+
+
+@lru_cache(maxsize=None)
+def _separator_pattern(separator: str):
+    return re.compile(re.escape(separator))
+
 
 class TextChunker:
 
-    def __init__(self, chunk_size: int = 500, chunk_overlap: int = 50):
+    def __init__(self, chunk_size: int = 500, chunk_overlap: int = 50,
+                 separators: list = None,
+                 engine: str = os.getenv("MCQ_TEXT_SPLITTER", "native")):
         """
         Initialize the text chunker with chunk size and overlap.
 
         chunk_size: Maximum characters per chunk
         chunk_overlap: Characters shared between consecutive chunks
                        (helps preserve context across chunk boundaries)
+        separators: Split points, tried in order (default: SEPARATORS)
+        engine: "native" (offset-based splitter in this module) or
+                "langchain" (RecursiveCharacterTextSplitter; same chunks)
+        """
+        if chunk_overlap > chunk_size:
+            raise ValueError(
+                f"Chunk overlap ({chunk_overlap}) is larger than chunk size ({chunk_size})"
+            )
+        if engine not in SPLITTER_ENGINES:
+            raise ValueError(f"Unknown splitter engine: {engine} (expected one of {SPLITTER_ENGINES})")
+
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.separators = list(separators or SEPARATORS)
+        self.engine = engine
+        self._splitter = None
+
+    @property
+    def splitter(self):
+        if self._splitter is None:
+            self._splitter = text_splitter.RecursiveCharacterTextSplitter(
+                chunk_size=self.chunk_size,
+                chunk_overlap=self.chunk_overlap,
+                separators=self.separators
+            )
+        return self._splitter
+
+    def _split(self, text: str) -> list:
+        if self.engine == "langchain":
+            return self.splitter.split_text(text)
+        return [text[start:end] for start, end in self.split_spans(text)]
+
+    def _spans(self, text: str) -> list:
+        if self.engine == "native":
+            return self.split_spans(text)
+        # Locate LangChain's chunks in the text, as its add_start_index does
+        spans = []
+        index, previous_len = 0, 0
+        for chunk in self.splitter.split_text(text):
+            index = text.find(chunk, max(0, index + previous_len - self.chunk_overlap))
+            spans.append((index, index + len(chunk)))
+            previous_len = len(chunk)
+        return spans
+
+    def split_spans(self, text: str) -> list:
         """
-        self.splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            separators=["\n\n", "\n", ".", "!", "?", " "]
-        )
+        Chunk boundaries as character offsets: text[start:end] is each chunk.
+
+        Produces the same chunks as LangChain's RecursiveCharacterTextSplitter
+        (separator kept at the start of the following piece, whitespace
+        stripped from merged chunks), but works on offsets into the
+        original string: pieces are cut points found by one regex scan
+        per separator level, merged by their lengths, and each chunk is
+        sliced out once.
+
+        Args:
+            text (str): Text to split
+
+        Returns:
+            list: (start, end) offsets of each chunk, in document order
+        """
+        spans = []
+        if text:
+            self._split_span(text, 0, len(text), self.separators, spans)
+        return spans
+
+    def _split_span(self, text: str, start: int, end: int, separators: list, spans: list) -> None:
+        # Use the first separator present in text[start:end]; the ones
+        # after it split pieces that are still too long
+        separator, remaining = separators[-1], []
+        for i, candidate in enumerate(separators):
+            if candidate == "":
+                separator = candidate
+                break
+            if text.find(candidate, start, end) != -1:
+                separator, remaining = candidate, separators[i + 1:]
+                break
+
+        # Piece i is text[cuts[i]:cuts[i + 1]]
+        cuts = self._cut_points(text, start, end, separator)
+        run_start = None  # first piece of the current run of short pieces
+        for i in range(len(cuts) - 1):
+            if cuts[i + 1] - cuts[i] < self.chunk_size:
+                if run_start is None:
+                    run_start = i
+                continue
+            if run_start is not None:
+                self._merge(text, cuts, run_start, i, spans)
+                run_start = None
+            if remaining:
+                self._split_span(text, cuts[i], cuts[i + 1], remaining, spans)
+            else:
+                # Nothing left to split on — kept whole, like LangChain
+                spans.append((cuts[i], cuts[i + 1]))
+        if run_start is not None:
+            self._merge(text, cuts, run_start, len(cuts) - 1, spans)
+
+    @staticmethod
+    def _cut_points(text: str, start: int, end: int, separator: str) -> list:
+        # Split at each separator, keeping it at the start of the next piece
+        if separator == "":
+            return list(range(start, end + 1))
+
+        pattern = _separator_pattern(separator)
+        cuts = [start]
+        cuts.extend(m.start() for m in pattern.finditer(text, start, end) if m.start() > start)
+        cuts.append(end)
+        return cuts
+
+    def _merge(self, text: str, cuts: list, first_piece: int, stop_piece: int, spans: list) -> None:
+        # Pieces first_piece..stop_piece-1 are contiguous, so a chunk is the
+        # span from its first to its last piece: the window over pieces is
+        # two indices and its length a difference of cut points
+        chunk_size, chunk_overlap = self.chunk_size, self.chunk_overlap
+        first = first_piece
+        for j in range(first_piece, stop_piece):
+            length = cuts[j + 1] - cuts[j]
+            total = cuts[j] - cuts[first]
+            if total + length > chunk_size and j > first:
+                self._add_stripped(text, cuts[first], cuts[j], spans)
+                # Keep at most chunk_overlap characters for the next chunk
+                while total > chunk_overlap or (total + length > chunk_size and total > 0):
+                    first += 1
+                    total = cuts[j] - cuts[first]
+        self._add_stripped(text, cuts[first], cuts[stop_piece], spans)
+
+    @staticmethod
+    def _add_stripped(text: str, start: int, end: int, spans: list) -> None:
+        # Same whitespace as str.strip(); whitespace-only chunks are dropped
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        if end > start:
+            spans.append((start, end))
 
     def split_text(self, text: str) -> list:
         """
@@ -40,7 +188,33 @@ class TextChunker:
                 logging.warning("Empty text provided for chunking")
                 return []
 
-            chunks = self.splitter.split_text(text)
+            chunks = self._split(text)
+
+            logging.info(f"Text split into {len(chunks)} chunks")
+            return chunks
+
+        except Exception as e:
+            logging.error("Error in text chunking")
+            raise CustomException(e, sys)
+
+    def chunk_text(self, text: str) -> ChunkStore:
+        """
+        Split a text into chunks stored as offsets into the text itself.
+
+        Args:
+            text (str): Full document text
+
+        Returns:
+            ChunkStore: Chunks without page numbers
+        """
+        try:
+            logging.info("Starting text chunking")
+
+            if not text or len(text.strip()) == 0:
+                logging.warning("Empty text provided for chunking")
+                return ChunkStore.from_texts([])
+
+            chunks = ChunkStore.from_spans(text, self._spans(text))
 
             logging.info(f"Text split into {len(chunks)} chunks")
             return chunks
@@ -48,6 +222,105 @@ class TextChunker:
         except Exception as e:
             logging.error("Error in text chunking")
             raise CustomException(e, sys)
+
+    def _iter_page_chunks(self, pages, parts: list = None):
+        # Yields (text, start, end, page) for each chunk as soon as it is
+        # final; start/end are offsets into the pages joined with "\n".
+        # Only the last chunk so far (the next one's overlap lies inside
+        # it) and the pages it can start on are kept between pages.
+        length = 0                         # characters in the document so far
+        page_starts, page_numbers = [], []
+        tail, tail_start, tail_end = "", 0, 0  # last chunk so far and the text after it
+
+        def page_of(offset: int) -> int:
+            return page_numbers[bisect.bisect_right(page_starts, offset) - 1]
+
+        for number, page_text in enumerate(pages, start=1):
+            if not page_text or len(page_text.strip()) == 0:
+                continue
+
+            if length:
+                length += 1
+                if parts is not None:
+                    parts.append("\n")
+            page_starts.append(length)
+            page_numbers.append(number)
+            if parts is not None:
+                parts.append(page_text)
+
+            # The window is document[window_start:] — the carried tail plus this page
+            window_start = tail_start if tail else length
+            window = tail + "\n" + page_text if tail else page_text
+            length += len(page_text)
+
+            window_spans = self._spans(window)
+            if not window_spans:
+                continue
+
+            # Last chunk may continue on the next page — hold it back
+            for start, end in window_spans[:-1]:
+                yield window[start:end], window_start + start, window_start + end, page_of(window_start + start)
+            start, end = window_spans[-1]
+            tail, tail_start, tail_end = window[start:], window_start + start, window_start + end
+
+            # Forget the pages before the one the tail starts on
+            first = bisect.bisect_right(page_starts, tail_start) - 1
+            del page_starts[:first], page_numbers[:first]
+
+        if tail:
+            yield tail[:tail_end - tail_start], tail_start, tail_end, page_of(tail_start)
+
+    def chunk_pages(self, pages) -> ChunkStore:
+        """
+        Incrementally split a stream of page texts into overlapping chunks
+        stored as (start, end, page) offsets into one document buffer.
+
+        Pages are joined with "\\n" into the buffer as they arrive; each is
+        split together with the unfinished last chunk of the previous
+        page, which keeps chunk boundaries and overlap continuous across
+        pages. Only that short window is re-split, never the whole text.
+
+        Args:
+            pages (iterable): Page texts in reading order
+
+        Returns:
+            ChunkStore: Chunks with the 1-based page each one starts on
+        """
+        try:
+            logging.info("Starting incremental text chunking")
+
+            parts = []  # document buffer, page by page
+            spans, page_numbers = [], []
+            for _, start, end, page in self._iter_page_chunks(pages, parts):
+                spans.append((start, end))
+                page_numbers.append(page)
+
+            chunks = ChunkStore.from_spans("".join(parts), spans, page_numbers)
+
+            logging.info(f"Page stream split into {len(chunks)} chunks")
+            return chunks
+
+        except Exception as e:
+            logging.error("Error in incremental text chunking")
+            raise CustomException(e, sys)
+
+    def split_pages(self, pages):
+        """
+        Split a stream of page texts into chunks as they are read.
+
+        Same chunks as chunk_pages(), but each one is yielded as soon as
+        no later page can change it, and the document text is not kept:
+        memory stays at one page plus the last chunk, whatever the
+        document length.
+
+        Args:
+            pages (iterable): Page texts in reading order
+
+        Yields:
+            Chunk: Chunk text (a str) with its source page, in document order
+        """
+        for text, _, _, page in self._iter_page_chunks(pages):
+            yield Chunk(text, page)
 '''
 
 ---
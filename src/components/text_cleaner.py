@@ -3,30 +3,29 @@
 import re
 import string
 import sys
-import nltk
+import functools
 
-# src/components/text_cleaner.py
+from src.utils.lazy_import import lazy_import
+from src.utils.nltk_resources import ensure_nltk_resources
+from src.logger.logger import logging
+from src.exception.custom_exception import CustomException
 
-import re
-import string
-import sys
-import nltk
+# NLTK and its data are loaded on first use, not at import time
+nltk = lazy_import("nltk")
 
-# Download required NLTK data
-nltk.download('stopwords', quiet=True)
-nltk.download('punkt', quiet=True)
-nltk.download('punkt_tab', quiet=True)
-nltk.download('averaged_perceptron_tagger', quiet=True)
-nltk.download('averaged_perceptron_tagger_eng', quiet=True)
+TOKENIZER_RESOURCES = ("punkt", "punkt_tab")
 
-from nltk.corpus import stopwords
-from nltk.tokenize import sent_tokenize, word_tokenize
 
-from src.logger.logger import logging
-from src.exception.custom_exception import CustomException
+@functools.lru_cache(maxsize=1)
+def get_stop_words() -> frozenset:
+    """
+    English stopwords, loaded once on first call.
 
-# Load stopwords AFTER download
-STOP_WORDS = set(stopwords.words("english"))
+    Returns:
+        frozenset: Lower-case stopwords
+    """
+    ensure_nltk_resources(("stopwords",))
+    return frozenset(nltk.corpus.stopwords.words("english"))
 
 
 def clean_text(text: str) -> str:
@@ -66,7 +65,8 @@ def get_sentences(text: str) -> list:
     try:
         logging.info("Tokenizing text into sentences")
 
-        sentences = sent_tokenize(text)
+        ensure_nltk_resources(TOKENIZER_RESOURCES)
+        sentences = nltk.tokenize.sent_tokenize(text)
 
         return sentences
 
@@ -81,11 +81,13 @@ def remove_stopwords(sentence: str) -> str:
     """
 
     try:
-        words = word_tokenize(sentence)
+        ensure_nltk_resources(TOKENIZER_RESOURCES)
+        words = nltk.tokenize.word_tokenize(sentence)
+        stop_words = get_stop_words()
 
         filtered_words = [
             word for word in words
-            if word.lower() not in STOP_WORDS
+            if word.lower() not in stop_words
             and word not in string.punctuation
         ]
 
@@ -1,44 +1,186 @@
 # src/components/vector_store.py
 
+import os
 import sys
+import itertools
 import numpy as np
-import faiss
 
-from src.logger.logger import logging
+from src.components.chunk_store import ChunkStore, as_chunk_store
+from src.utils.lazy_import import lazy_import
+from src.logger.logger import logging, log_event
 from src.exception.custom_exception import CustomException
 
+# Imported on first index build / load, not when the module is imported
+faiss = lazy_import("faiss")
+
+INDEX_FILE = "index.faiss"
+
+INDEX_TYPES = ("auto", "flat", "ivf", "hnsw")
+
+# Rough single-core IndexFlatIP scan speed (vector components per ms),
+# used to predict exact-search latency from corpus size
+FLAT_FLOATS_PER_MS = 2.5e6
+
+# Above this many vectors "auto" prefers IVF over HNSW — HNSW build
+# time and graph memory grow too large for big multi-textbook corpora
+HNSW_MAX_VECTORS = 200_000
+
 
 class VectorStore:
 
-    def __init__(self):
+    def __init__(self, index_type: str = "auto", latency_target_ms: float = 10.0,
+                 nprobe: int = 16, ef_search: int = 64, hnsw_m: int = 32):
         """
         Initialize empty FAISS vector store.
         FAISS = Facebook AI Similarity Search
         - Runs fully locally
         - Extremely fast similarity search
         - Free and open source
+
+        index_type: "flat" (exact), "ivf" (trained centroids), "hnsw" (graph),
+                    or "auto" — flat while its predicted query latency fits
+                    latency_target_ms, otherwise HNSW, or IVF for very large corpora
+        latency_target_ms: Per-query latency budget used by "auto"
+        nprobe: IVF lists scanned per query (higher = better recall, slower)
+        ef_search: HNSW candidate list size per query (higher = better recall, slower)
+        hnsw_m: HNSW graph degree
         """
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"Unknown index_type: {index_type}")
+
+        self.index_type = index_type
+        self.latency_target_ms = latency_target_ms
+        self.nprobe = nprobe
+        self.ef_search = ef_search
+        self.hnsw_m = hnsw_m
+
         self.index = None
-        self.chunks = []       # stores original text chunks
+        self.chunks = ChunkStore.from_texts([])  # chunk offsets into the document text
         self.dimension = None  # embedding dimension (384 for MiniLM)
+        self.is_mapped = False  # True when loaded as read-only memory maps
+        self._source_dir = None  # directory a mapped index was loaded from
+
+    def copy(self) -> "VectorStore":
+        """
+        Independent store with the same vectors, chunks and settings,
+        for modifying a copy of a shared index without re-embedding.
+        Chunks are shared (they are never modified in place); a mapped
+        index is shared too, since add() takes a private copy first.
+
+        Returns:
+            VectorStore: Copy of this store
+        """
+        store = VectorStore(self.index_type, self.latency_target_ms, self.nprobe,
+                            self.ef_search, self.hnsw_m)
+        store.chunks = self.chunks
+        store.dimension = self.dimension
+        if self.is_mapped:
+            store.index = self.index
+            store.is_mapped = True
+            store._source_dir = self._source_dir
+        elif self.index is not None:
+            store.index = faiss.clone_index(self.index)
+            store.set_search_params()
+        return store
+
+    def choose_index_type(self, num_vectors: int, dimension: int) -> str:
+        """
+        Pick the index type for a corpus of the given size.
+
+        Args:
+            num_vectors (int): Number of vectors to index
+            dimension (int): Embedding dimension
+
+        Returns:
+            str: "flat", "ivf" or "hnsw"
+        """
+        if self.index_type != "auto":
+            return self.index_type
+
+        predicted_flat_ms = num_vectors * dimension / FLAT_FLOATS_PER_MS
+        if predicted_flat_ms <= self.latency_target_ms:
+            return "flat"
+        if num_vectors <= HNSW_MAX_VECTORS:
+            return "hnsw"
+        return "ivf"
+
+    def _create_index(self, num_vectors: int, dimension: int):
+        """
+        Create an empty (untrained) FAISS index sized for the corpus.
+        All types use inner product, i.e. cosine similarity on unit vectors.
+        """
+        index_type = self.choose_index_type(num_vectors, dimension)
+
+        if index_type == "ivf":
+            # ~4 * sqrt(n) lists is the usual FAISS starting point
+            nlist = max(1, min(int(4 * np.sqrt(num_vectors)), num_vectors // 39))
+            quantizer = faiss.IndexFlatIP(dimension)
+            index = faiss.IndexIVFFlat(quantizer, dimension, nlist, faiss.METRIC_INNER_PRODUCT)
+        elif index_type == "hnsw":
+            index = faiss.IndexHNSWFlat(dimension, self.hnsw_m, faiss.METRIC_INNER_PRODUCT)
+        else:
+            index = faiss.IndexFlatIP(dimension)
+
+        logging.info(f"Using {index_type} FAISS index for {num_vectors} vectors")
+        return index
+
+    def set_search_params(self, nprobe: int = None, ef_search: int = None) -> None:
+        """
+        Apply recall/latency knobs to the current index.
+        Has no effect on exact (flat) indexes.
+
+        Args:
+            nprobe (int): IVF lists scanned per query
+            ef_search (int): HNSW candidate list size per query
+        """
+        if nprobe is not None:
+            self.nprobe = nprobe
+        if ef_search is not None:
+            self.ef_search = ef_search
+
+        if self.index is None:
+            return
+
+        if isinstance(self.index, faiss.IndexIVF):
+            self.index.nprobe = self.nprobe
+        elif isinstance(self.index, faiss.IndexHNSW):
+            self.index.hnsw.efSearch = self.ef_search
+
+    def get_settings(self) -> dict:
+        """
+        Index settings that change search results.
+        Used to key cached indexes.
+
+        Returns:
+            dict: JSON-serializable index settings
+        """
+        return {
+            "index_type": self.index_type,
+            "latency_target_ms": self.latency_target_ms,
+            "hnsw_m": self.hnsw_m
+        }
 
     def build_index(self, chunks: list, embeddings: np.ndarray) -> None:
         """
         Build FAISS index from chunks and their embeddings.
 
         Args:
-            chunks (list): Original text chunks
+            chunks (ChunkStore | list): Original text chunks
             embeddings (np.ndarray): Embedding vectors for each chunk
         """
         try:
             logging.info("Building FAISS index")
 
-            if len(chunks) == 0 or len(embeddings) == 0:
-                logging.warning("No chunks or embeddings provided")
+            if len(chunks) == 0:
+                logging.warning("No chunks provided")
                 return
 
+            if len(embeddings) == 0:
+                raise ValueError(f"No embeddings provided for {len(chunks)} chunks")
+
             # Store chunks for later retrieval
-            self.chunks = chunks
+            self.chunks = as_chunk_store(chunks)
+            self.is_mapped = False
 
             # Get embedding dimension
             self.dimension = embeddings.shape[1]
@@ -49,8 +191,12 @@ class VectorStore:
             # Normalize embeddings for cosine similarity
             faiss.normalize_L2(embeddings)
 
-            # Create FAISS index using Inner Product (cosine similarity)
-            self.index = faiss.IndexFlatIP(self.dimension)
+            # Create FAISS index using Inner Product (cosine similarity),
+            # exact or approximate depending on corpus size
+            self.index = self._create_index(len(embeddings), self.dimension)
+            if not self.index.is_trained:
+                self.index.train(embeddings)
+            self.set_search_params()
 
             # Add embeddings to index
             self.index.add(embeddings)
@@ -61,6 +207,110 @@ class VectorStore:
             logging.error("Error building FAISS index")
             raise CustomException(e, sys)
 
+    def build_index_from_batches(self, chunks: list, embedding_batches) -> None:
+        """
+        Build FAISS index by adding embeddings batch by batch,
+        so the full embedding matrix never has to exist in memory.
+
+        Args:
+            chunks (ChunkStore | list): Original text chunks
+            embedding_batches (iterable): float32 arrays of already
+                L2-normalized embeddings, in chunk order
+        """
+        try:
+            logging.info("Building FAISS index from embedding batches")
+
+            if len(chunks) == 0:
+                logging.warning("No chunks provided")
+                return
+
+            # Fail before touching the current index if no embeddings arrive
+            embedding_batches = iter(embedding_batches)
+            first_batch = next(embedding_batches, None)
+            if first_batch is None:
+                raise ValueError(f"No embeddings provided for {len(chunks)} chunks")
+
+            self.index = None
+            self.chunks = as_chunk_store(chunks)
+            self.is_mapped = False
+
+            # Indexes that need training (IVF) buffer batches until
+            # there are enough vectors to learn centroids from
+            pending = []
+            num_pending = 0
+
+            for batch in itertools.chain([first_batch], embedding_batches):
+                batch = np.ascontiguousarray(batch, dtype="float32")
+
+                if self.index is None:
+                    self.dimension = batch.shape[1]
+                    self.index = self._create_index(len(chunks), self.dimension)
+                    train_size = min(len(chunks), 256 * getattr(self.index, "nlist", 1))
+
+                if self.index.is_trained:
+                    self.index.add(batch)
+                    continue
+
+                pending.append(batch)
+                num_pending += len(batch)
+                if num_pending >= train_size:
+                    training = np.concatenate(pending)
+                    self.index.train(training)
+                    self.index.add(training)
+                    pending = []
+
+            self.set_search_params()
+
+            logging.info(f"FAISS index built with {self.index.ntotal} vectors")
+
+        except Exception as e:
+            logging.error("Error building FAISS index from batches")
+            raise CustomException(e, sys)
+
+    def add(self, chunks: list, embeddings: np.ndarray) -> None:
+        """
+        Append new chunks and their embeddings to the live index
+        without touching vectors already stored. Creates the index
+        if none exists yet.
+
+        Args:
+            chunks (ChunkStore | list): New text chunks
+            embeddings (np.ndarray): L2-normalized embedding vectors for each chunk
+        """
+        try:
+            logging.info(f"Adding {len(chunks)} chunks to FAISS index")
+
+            if len(chunks) == 0 or len(embeddings) == 0:
+                logging.warning("No chunks or embeddings provided")
+                return
+
+            embeddings = np.ascontiguousarray(embeddings, dtype="float32")
+
+            if self.index is None:
+                self.build_index(chunks, embeddings)
+                return
+
+            if embeddings.shape[1] != self.dimension:
+                raise ValueError(
+                    f"Embedding dimension {embeddings.shape[1]} does not match index dimension {self.dimension}"
+                )
+
+            if self.is_mapped:
+                # Memory-mapped stores are read-only and shared — take a private copy first
+                # (faiss.clone_index would still point at the mapped file)
+                self.index = faiss.read_index(os.path.join(self._source_dir, INDEX_FILE))
+                self.set_search_params()
+                self.is_mapped = False
+
+            self.chunks = self.chunks.concat(chunks)
+            self.index.add(embeddings)
+
+            logging.info(f"FAISS index now holds {self.index.ntotal} vectors")
+
+        except Exception as e:
+            logging.error("Error adding to FAISS index")
+            raise CustomException(e, sys)
+
     def search(self, query_embedding: np.ndarray, top_k: int = 5) -> list:
         """
         Search for top-k most similar chunks to the query embedding.
@@ -72,9 +322,20 @@ class VectorStore:
         Returns:
             list: Top-k most relevant text chunks
         """
-        try:
-            logging.info(f"Searching FAISS index for top {top_k} chunks")
+        return [chunk for chunk, _ in self.search_with_scores(query_embedding, top_k)]
+
+    def search_with_scores(self, query_embedding: np.ndarray, top_k: int = 5) -> list:
+        """
+        Search for top-k most similar chunks, keeping their similarity scores.
 
+        Args:
+            query_embedding (np.ndarray): Embedding of user's topic query
+            top_k (int): Number of relevant chunks to retrieve
+
+        Returns:
+            list: (chunk, cosine similarity) tuples, best first
+        """
+        try:
             if self.index is None:
                 logging.warning("FAISS index not built yet")
                 return []
@@ -89,18 +350,136 @@ class VectorStore:
             distances, indices = self.index.search(query_embedding, top_k)
 
             # Retrieve actual text chunks
-            retrieved_chunks = []
-            for idx in indices[0]:
+            retrieved = []
+            for score, idx in zip(distances[0], indices[0]):
                 if idx != -1 and idx < len(self.chunks):
-                    retrieved_chunks.append(self.chunks[idx])
+                    retrieved.append((self.chunks[idx], float(score)))
 
-            logging.info(f"Retrieved {len(retrieved_chunks)} relevant chunks")
-            return retrieved_chunks
+            log_event(logging.INFO, "Searched FAISS index", sampled=True,
+                      top_k=top_k, results=len(retrieved))
+            return retrieved
 
         except Exception as e:
             logging.error("Error searching FAISS index")
             raise CustomException(e, sys)
 
+    def search_batch(self, query_embeddings: np.ndarray, top_k: int = 5) -> list:
+        """
+        Search for the top-k chunks of many queries with a single FAISS call.
+
+        Args:
+            query_embeddings (np.ndarray): One L2-normalized query vector per row
+            top_k (int): Number of chunks to retrieve per query
+
+        Returns:
+            list: One list of (chunk, score) tuples per query, best first
+        """
+        try:
+            logging.info(f"Batch searching FAISS index for {len(query_embeddings)} queries")
+
+            if self.index is None:
+                logging.warning("FAISS index not built yet")
+                return [[] for _ in range(len(query_embeddings))]
+
+            queries = np.ascontiguousarray(query_embeddings, dtype="float32")
+            distances, indices = self.index.search(queries, top_k)
+
+            num_chunks = len(self.chunks)
+            return [
+                [(self.chunks[idx], float(score))
+                 for score, idx in zip(row_scores, row_ids) if idx != -1 and idx < num_chunks]
+                for row_scores, row_ids in zip(distances, indices)
+            ]
+
+        except Exception as e:
+            logging.error("Error batch searching FAISS index")
+            raise CustomException(e, sys)
+
+    def save(self, directory: str) -> None:
+        """
+        Persist the FAISS index and chunk texts to a directory.
+
+        Chunks are written as the document's UTF-8 text plus chunk
+        offset and page arrays, so load(memory_map=True) can map them
+        read-only instead of unpickling thousands of separate strings.
+
+        Args:
+            directory (str): Target directory (created if missing)
+        """
+        try:
+            logging.info(f"Saving FAISS index to {directory}")
+
+            os.makedirs(directory, exist_ok=True)
+            faiss.write_index(self.index, os.path.join(directory, INDEX_FILE))
+
+            self.chunks.save(directory)
+
+        except Exception as e:
+            logging.error("Error saving FAISS index")
+            raise CustomException(e, sys)
+
+    def load(self, directory: str, memory_map: bool = True) -> None:
+        """
+        Load a FAISS index and chunk texts saved with save().
+
+        With memory_map=True the index vectors and chunk texts are memory-mapped
+        read-only, so every session and process that loads the same
+        directory shares one physical copy through the OS page cache.
+        A mapped store is read-only: rebuild it instead of modifying it.
+
+        Args:
+            directory (str): Directory written by save()
+            memory_map (bool): Memory-map files instead of reading them into RAM
+        """
+        try:
+            logging.info(f"Loading FAISS index from {directory} (memory_map={memory_map})")
+
+            index_path = os.path.join(directory, INDEX_FILE)
+            if memory_map:
+                # IO_FLAG_MMAP_IFC also maps flat-index codes; IO_FLAG_MMAP
+                # alone maps only inverted lists
+                mmap_flag = getattr(faiss, "IO_FLAG_MMAP_IFC", None)
+                if mmap_flag is None:
+                    logging.warning(
+                        f"faiss {getattr(faiss, '__version__', '?')} has no IO_FLAG_MMAP_IFC: "
+                        "flat index vectors are read into RAM instead of being shared"
+                    )
+                    mmap_flag = faiss.IO_FLAG_MMAP
+                flags = mmap_flag | faiss.IO_FLAG_READ_ONLY
+                self.index = faiss.read_index(index_path, flags)
+            else:
+                self.index = faiss.read_index(index_path)
+            self.dimension = self.index.d
+            self.set_search_params()
+
+            self.chunks = ChunkStore.load(directory, memory_map)
+            self.is_mapped = memory_map
+            self._source_dir = directory
+
+            logging.info(f"Loaded FAISS index with {self.index.ntotal} vectors")
+
+        except Exception as e:
+            logging.error("Error loading FAISS index")
+            raise CustomException(e, sys)
+
+    def memory_bytes(self) -> int:
+        """
+        Approximate memory held by the index and chunk texts.
+
+        Returns:
+            int: Bytes (vectors, graph links / inverted-list ids, chunks)
+        """
+        total = self.chunks.nbytes()
+        if self.index is not None:
+            num_vectors, dimension = self.index.ntotal, self.index.d
+            total += num_vectors * dimension * 4
+            if isinstance(self.index, faiss.IndexHNSW):
+                # Level-0 neighbour lists dominate the graph
+                total += num_vectors * self.index.hnsw.nb_neighbors(0) * 4
+            elif isinstance(self.index, faiss.IndexIVF):
+                total += num_vectors * 8 + self.index.nlist * dimension * 4
+        return total
+
     def is_ready(self) -> bool:
         """
         Check if vector store is built and ready for search.
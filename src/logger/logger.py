@@ -1,21 +1,266 @@
 # src/logger/logger.py
 
+import atexit
+import itertools
+import json
 import logging
 import os
-from datetime import datetime
+import queue
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
-# Create logs directory if it doesn't exist
-LOG_DIR = "logs"
-if not os.path.exists(LOG_DIR):
-    os.makedirs(LOG_DIR)
-
-# Log file name with timestamp
-LOG_FILE = f"{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}.log"
+# Logs go to one size-rotated file instead of a new timestamped file per process
+LOG_DIR = os.getenv("MCQ_LOG_DIR", "logs")
+LOG_FILE = "mcq_generator.log"
 LOG_FILE_PATH = os.path.join(LOG_DIR, LOG_FILE)
 
-# Configure logging
-logging.basicConfig(
-    filename=LOG_FILE_PATH,
-    format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
-    level=logging.INFO
-)
\ No newline at end of file
+LOG_MAX_BYTES = int(os.getenv("MCQ_LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+LOG_BACKUP_COUNT = int(os.getenv("MCQ_LOG_BACKUP_COUNT", "5"))
+LOG_QUEUE_SIZE = 10000
+
+# MCQ_LOG_ASYNC=0 writes from the calling thread (useful when debugging a crash)
+ASYNC_LOGGING = os.getenv("MCQ_LOG_ASYNC", "1") == "1"
+
+# Hot-path records (sampled=True) keep 1 in N per level; 1 keeps them all
+SAMPLE_EVERY = {
+    logging.DEBUG: int(os.getenv("MCQ_LOG_SAMPLE_DEBUG", "100")),
+    logging.INFO: int(os.getenv("MCQ_LOG_SAMPLE_INFO", "10")),
+    logging.WARNING: 1,
+    logging.ERROR: 1,
+    logging.CRITICAL: 1,
+}
+
+_listener = None
+_queue_handler = None
+_handlers = []  # handlers this module added to the root logger
+_config = {}
+
+
+def _format_value(value) -> str:
+    if isinstance(value, float):
+        return f"{value:.6g}"
+    text = str(value)
+    if not text or any(c in text for c in ' ="\n'):
+        return json.dumps(text)
+    return text
+
+
+class KeyValueFormatter(logging.Formatter):
+
+    def __init__(self):
+        """
+        One line per record: timestamp, level and module, the message,
+        then any structured fields passed via log_event as key=value pairs.
+        """
+        super().__init__("%(asctime)s - %(levelname)s - %(module)s - %(message)s")
+        self._cached_second = None
+        self._cached_prefix = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        # strftime dominates formatting cost; records arrive in bursts
+        # within the same second, so reuse the formatted seconds part
+        seconds = int(record.created)
+        if seconds != self._cached_second:
+            self._cached_second = seconds
+            self._cached_prefix = time.strftime("%Y-%m-%d %H:%M:%S", self.converter(seconds))
+        return f"{self._cached_prefix},{int(record.msecs):03d}"
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = getattr(record, "fields", None)
+        if fields:
+            line += " | " + " ".join(f"{k}={_format_value(v)}" for k, v in fields.items())
+        return line
+
+
+class SizeRotatingFileHandler(RotatingFileHandler):
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """
+        Rotate once the file has reached maxBytes.
+
+        The stock check formats every record a second time to measure
+        it; checking the current file size instead lets a file end up
+        one record over maxBytes, which is fine for logs.
+        """
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        return self.stream.tell() >= self.maxBytes
+
+
+class SamplingFilter(logging.Filter):
+
+    def __init__(self, sample_every: dict = None):
+        """
+        Keep 1 in N records marked sampled, per level. Other records pass.
+
+        sample_every: Level -> N (1 keeps every record)
+        """
+        super().__init__()
+        self.sample_every = dict(sample_every or SAMPLE_EVERY)
+        self._counters = {level: itertools.count() for level in self.sample_every}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "sampled", False):
+            return True
+        every = self.sample_every.get(record.levelno, 1)
+        if every <= 1:
+            return True
+        # next() on itertools.count is atomic under the GIL
+        return next(self._counters[record.levelno]) % every == 0
+
+
+class DroppingQueueHandler(QueueHandler):
+
+    def __init__(self, log_queue: queue.Queue):
+        """
+        QueueHandler that does not block the caller on routine records:
+        when the writer falls behind and the queue is full, DEBUG/INFO
+        records are dropped and counted.
+
+        log_queue: Bounded queue drained by the QueueListener
+        """
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if record.levelno >= logging.WARNING:
+            # Never lose warnings and errors — wait for the writer instead
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def configure_logging(log_dir: str = LOG_DIR, async_mode: bool = ASYNC_LOGGING,
+                      max_bytes: int = LOG_MAX_BYTES, backup_count: int = LOG_BACKUP_COUNT,
+                      level: int = logging.INFO, sample_every: dict = None,
+                      worker: bool = False) -> None:
+    """
+    (Re)configure the root logger. Safe to call again, e.g. from benchmarks.
+    Only handlers installed here are replaced; handlers the host set up
+    (Streamlit, pytest, an embedding application) are left alone.
+
+    In async mode callers only put the record on a bounded queue; a
+    background QueueListener thread formats and writes it to the
+    rotating file, so disk I/O stays out of request latency.
+
+    Args:
+        log_dir (str): Directory of the rotating log file
+        async_mode (bool): Write through a queue and background thread
+        max_bytes (int): Rotate when the file reaches this size
+        backup_count (int): Rotated files to keep
+        level (int): Root log level
+        sample_every (dict): Level -> keep 1 in N sampled records
+        worker (bool): Worker process (e.g. a PDF extraction worker):
+                       append to the file from the calling thread and
+                       leave rotating it to the main process
+    """
+    global _listener, _queue_handler
+
+    shutdown_logging()
+    os.makedirs(log_dir, exist_ok=True)
+
+    log_path = os.path.join(log_dir, LOG_FILE)
+    if worker:
+        file_handler = logging.FileHandler(log_path, encoding="utf-8", delay=True)
+    else:
+        file_handler = SizeRotatingFileHandler(
+            log_path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        )
+    file_handler.setFormatter(KeyValueFormatter())
+
+    root = logging.getLogger()
+    root.setLevel(level)
+
+    if async_mode and not worker:
+        _queue_handler = DroppingQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+        _queue_handler.addFilter(SamplingFilter(sample_every))
+        _listener = QueueListener(_queue_handler.queue, file_handler)
+        _listener.start()
+        _handlers.append(_queue_handler)
+    else:
+        file_handler.addFilter(SamplingFilter(sample_every))
+        _handlers.append(file_handler)
+    root.addHandler(_handlers[-1])
+
+    if not worker:
+        _config.update(log_dir=log_dir, async_mode=async_mode, max_bytes=max_bytes,
+                       backup_count=backup_count, level=level, sample_every=sample_every)
+
+
+def _remove_handlers() -> None:
+    root = logging.getLogger()
+    for handler in _handlers:
+        root.removeHandler(handler)
+        handler.close()
+    _handlers.clear()
+
+
+def shutdown_logging() -> None:
+    """
+    Stop the background writer after flushing queued records, and
+    detach the handlers configure_logging() installed.
+    """
+    global _listener, _queue_handler
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+    _queue_handler = None
+    _remove_handlers()
+
+
+def dropped_records() -> int:
+    """
+    Returns:
+        int: Records dropped because the log queue was full
+    """
+    return _queue_handler.dropped if _queue_handler is not None else 0
+
+
+def log_event(level: int, message: str, sampled: bool = False, **fields) -> None:
+    """
+    Log a structured record: a fixed message plus key=value fields.
+
+    Args:
+        level (int): e.g. logging.INFO
+        message (str): Constant description of the event
+        sampled (bool): Hot-path record subject to per-level sampling
+        **fields: Values written as key=value after the message
+    """
+    root = logging.getLogger()
+    if root.isEnabledFor(level):
+        root.log(level, message, extra={"fields": fields, "sampled": sampled}, stacklevel=2)
+
+
+def _in_worker_process() -> bool:
+    # Spawned multiprocessing children import this module afresh
+    mp = sys.modules.get("multiprocessing")
+    return mp is not None and mp.parent_process() is not None
+
+
+def _reset_after_fork() -> None:
+    # The listener thread does not survive fork(), and its queue's lock
+    # may have been held by a parent thread at fork time: drop both
+    # without stopping or draining anything. logging re-creates handler
+    # locks in the child, so the inherited handlers can be closed.
+    global _listener, _queue_handler
+    if not _handlers:
+        return
+    _listener = None
+    _queue_handler = None
+    _remove_handlers()
+    configure_logging(**_config, worker=True)
+
+
+configure_logging(worker=_in_worker_process())
+atexit.register(shutdown_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
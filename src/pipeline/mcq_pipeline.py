@@ -49,29 +49,72 @@
 
 # src/pipeline/mcq_pipeline.py
 
+import os
 import sys
+import uuid
 
-from src.components.pdf_reader import extract_text_from_pdf
+from src.components.pdf_reader import iter_pdf_pages
 from src.components.text_chunker import TextChunker
+from src.components.chunk_filter import ChunkFilter
+from src.components.chunk_store import ChunkStore
 from src.components.retriever import Retriever
+from src.components.index_cache import IndexCache, CACHE_FORMAT_VERSION
+from src.components.document_registry import DocumentRegistry
+from src.components.resource_manager import get_resource_manager
 from src.components.question_generator import QuestionGenerator
+from src.components.llm_scheduler import LLMUnavailableError
 
+from src.utils import metrics
 from src.logger.logger import logging
 from src.exception.custom_exception import CustomException
 
+# Document ID used when callers don't name their document
+DEFAULT_DOC_ID = "default"
+
 
 class MCQPipeline:
 
-    def __init__(self):
+    def __init__(self, use_index_cache: bool = True, index_mode: str = "dense",
+                 embedding_mode: str = "tfidf", index_params: dict = None,
+                 llm_backend=None, resources=None, question_generator=None,
+                 filter_chunks: bool = os.getenv("MCQ_CHUNK_FILTER", "1") == "1"):
         """
         Initialize all RAG pipeline components.
+
+        use_index_cache: Reuse indexes of previously seen documents
+                         from the on-disk IndexCache
+        index_mode: "dense" (FAISS) or "sparse" (CSR matrix) retrieval
+        embedding_mode: "tfidf" or "hashing" (fit-free; documents switch to it
+                        on their first append_document)
+        index_params: VectorStore options (index_type, latency_target_ms, nprobe, ef_search)
+        llm_backend: LLMBackend for question generation (default: MCQ_LLM_BACKEND)
+        resources: ResourceManager holding document indexes (default: the
+                   process-wide one), so sessions on the same document
+                   share one index within MCQ_MEMORY_BUDGET_MB
+        question_generator: Shared QuestionGenerator (one LLM client and
+                            rate limiter for every session in the process)
+        filter_chunks: Drop repeated per-page lines (headers, footers) and
+                       near-duplicate chunks before embedding
+
+        With MCQ_METRICS=1, per-stage latency histograms and counters are
+        served for a local Prometheus scraper on MCQ_METRICS_PORT (default 9464).
         """
         try:
             logging.info("Initializing RAG MCQ Pipeline")
 
+            self.index_mode = index_mode
+            self.embedding_mode = embedding_mode
+            self.index_params = index_params
+
             self.text_chunker = TextChunker()
-            self.retriever = Retriever()
-            self.question_generator = QuestionGenerator()
+            self.chunk_filter = ChunkFilter() if filter_chunks else None
+            self.resources = resources or get_resource_manager()
+            self.documents = DocumentRegistry(self.resources)
+            self.question_generator = question_generator or QuestionGenerator(backend=llm_backend)
+            self.index_cache = IndexCache() if use_index_cache else None
+
+            if metrics.is_enabled():
+                metrics.start_http_server()
 
             logging.info("RAG MCQ Pipeline initialized successfully")
 
@@ -79,42 +122,342 @@ class MCQPipeline:
             logging.error("Error initializing MCQ Pipeline")
             raise CustomException(e, sys)
 
-    def index_document(self, text: str) -> int:
+    @property
+    def retriever(self):
+        """
+        Retriever of the default document (single-document callers).
+        """
+        return self.documents.get(DEFAULT_DOC_ID) or self._new_retriever()
+
+    def _new_retriever(self) -> Retriever:
+        return Retriever(
+            index_mode=self.index_mode,
+            embedding_mode=self.embedding_mode,
+            index_params=self.index_params
+        )
+
+    def _cache_key(self, data: bytes, retriever: Retriever) -> str:
+        """
+        Cache key for a document under the current chunker
+        and vectorizer settings.
+        """
+        settings = {
+            "format_version": CACHE_FORMAT_VERSION,
+            "chunk_size": self.text_chunker.chunk_size,
+            "chunk_overlap": self.text_chunker.chunk_overlap,
+            "separators": self.text_chunker.separators,
+            "splitter_engine": self.text_chunker.engine,
+            "chunk_filter": self.chunk_filter.get_settings() if self.chunk_filter else None,
+            "index_mode": retriever.index_mode,
+            "vector_store": retriever.vector_store.get_settings(),
+            "embedding": retriever.embedding_generator.get_settings()
+        }
+        return IndexCache.make_key(data, settings)
+
+    def _load_cached(self, key: str, retriever: Retriever) -> int:
+        """
+        Try to restore the index for key from the cache.
+
+        Returns:
+            int: Number of chunks indexed, or 0 on a miss
+        """
+        if self.index_cache is None:
+            return 0
+        with metrics.timer("index_cache_load"):
+            if not self.index_cache.load(key, retriever):
+                return 0
+        metrics.DOCUMENTS_INDEXED.inc(source="cache")
+        return len(retriever.vector_store.chunks)
+
+    def _reload_cached(self, key: str):
+        """
+        Loader used after the shared index for key was evicted from memory.
+
+        Returns:
+            Retriever: Index restored from the IndexCache, or None if not cached
+        """
+        retriever = self._new_retriever()
+        return retriever if self._load_cached(key, retriever) else None
+
+    def _shared_index(self, key: str, retriever: Retriever, make_chunks, stage: str):
+        """
+        Get the process-wide index for key, building it at most once.
+        On a miss the index is restored from the IndexCache or built
+        from make_chunks(); concurrent sessions on the same document
+        wait for that single build. Without an IndexCache the index
+        could not be rebuilt after eviction, so it is returned pinned
+        and _register_shared() hands that pin to the document.
+
+        Args:
+            key (str): Content key from _cache_key()
+            retriever (Retriever): Empty retriever to load or build into
+            make_chunks (callable): Returns the document's chunks
+            stage (str): Metrics stage name for chunking
+
+        Returns:
+            Retriever: Shared, ready retriever, or None if the document has no chunks
+        """
+        def load():
+            if self._load_cached(key, retriever):
+                logging.info(f"Document loaded from index cache with {len(retriever.vector_store.chunks)} chunks")
+                return retriever
+
+            with metrics.timer(stage):
+                chunks = make_chunks()
+            if not chunks:
+                return None
+
+            retriever.index_chunks(chunks)
+            self._store_cached(key, retriever)
+            metrics.DOCUMENTS_INDEXED.inc(source="built")
+            return retriever
+
+        shared = self.resources.get_or_load(key, load, pin=self.index_cache is None)
+        if shared is not None and shared is not retriever:
+            metrics.DOCUMENTS_INDEXED.inc(source="shared")
+        return shared
+
+    def _drop_near_duplicates(self, chunks: ChunkStore) -> ChunkStore:
+        # Filter chunk numbers, so the kept chunks still share one buffer
+        kept = list(self.chunk_filter.drop_near_duplicates(range(len(chunks)), key=chunks.__getitem__))
+        return chunks.take(kept)
+
+    def _chunk_text(self, text: str) -> ChunkStore:
+        """
+        Split text into chunks, without boilerplate and near-duplicates
+        when chunk filtering is on.
+        """
+        if self.chunk_filter is None:
+            return self.text_chunker.chunk_text(text)
+        self.chunk_filter.reset_stats()
+        text = self.chunk_filter.strip_boilerplate_text(text)
+        return self._drop_near_duplicates(self.text_chunker.chunk_text(text))
+
+    def _chunk_pages(self, pages) -> ChunkStore:
+        """
+        Split a page stream into chunks that know their source page,
+        removing lines repeated across pages and near-duplicate chunks
+        when chunk filtering is on.
+        """
+        if self.chunk_filter is None:
+            return self.text_chunker.chunk_pages(pages)
+        self.chunk_filter.reset_stats()
+        pages = self.chunk_filter.strip_boilerplate(pages)
+        return self._drop_near_duplicates(self.text_chunker.chunk_pages(pages))
+
+    def _register_shared(self, doc_id: str, key: str) -> None:
+        # Without an IndexCache, _shared_index() already pinned the index
+        if self.index_cache is None:
+            self.documents.register_shared(doc_id, key, pinned=True)
+        else:
+            self.documents.register_shared(doc_id, key, lambda: self._reload_cached(key))
+
+    def _store_cached(self, key: str, retriever: Retriever) -> None:
+        """
+        Store the freshly built index, then swap the private in-memory
+        copy for the memory-mapped cache entry so concurrent sessions on
+        the same document share one physical copy.
+        """
+        if self.index_cache is not None:
+            with metrics.timer("index_cache_store"):
+                self.index_cache.save(key, retriever)
+                self.index_cache.load(key, retriever)
+
+    @metrics.timed("index_document")
+    def index_document(self, text: str, doc_id: str = DEFAULT_DOC_ID) -> int:
         """
         Process and index a document (text or PDF content).
         Called ONCE when user uploads a PDF or enters text.
 
         Args:
             text (str): Full extracted text from PDF or text input
+            doc_id (str): Name to register the document's index under;
+                          other documents' indexes are left untouched
 
         Returns:
             int: Number of chunks indexed
         """
         try:
-            logging.info("Starting document indexing")
+            logging.info(f"Starting document indexing: {doc_id}")
 
             if not text or len(text.strip()) == 0:
                 logging.warning("Empty text provided")
                 return 0
 
-            # Step 1: Split text into chunks
-            chunks = self.text_chunker.split_text(text)
+            retriever = self._new_retriever()
+            cache_key = self._cache_key(text.encode("utf-8"), retriever)
 
-            if not chunks:
+            # Split text into chunks, embed and build the index —
+            # unless this document is already shared in memory or cached
+            shared = self._shared_index(
+                cache_key, retriever, lambda: self._chunk_text(text), "chunk"
+            )
+            if shared is None:
                 logging.warning("No chunks generated from text")
                 return 0
 
-            # Step 2: Generate embeddings and build FAISS index
-            self.retriever.index_chunks(chunks)
+            self._register_shared(doc_id, cache_key)
 
-            logging.info(f"Document indexed successfully with {len(chunks)} chunks")
-            return len(chunks)
+            num_chunks = len(shared.vector_store.chunks)
+            logging.info(f"Document indexed successfully with {num_chunks} chunks")
+            return num_chunks
 
         except Exception as e:
             logging.error("Error indexing document")
             raise CustomException(e, sys)
 
-    def generate_mcqs(self, topic: str, num_questions: int = 5) -> list:
+    def _appendable_copy(self, current: Retriever) -> Retriever:
+        """
+        Private copy of a document's index for append_document().
+
+        A fitted TF-IDF vocabulary is frozen and holds only the corpus's
+        most frequent terms, so terms that only appended text uses would
+        embed as nothing and never be retrieved. Appended documents
+        therefore use the fit-free hashing embedder: a hashing index is
+        cloned, a TF-IDF one is re-embedded once.
+        """
+        if current is None:
+            return Retriever(index_mode=self.index_mode, embedding_mode="hashing",
+                             index_params=self.index_params)
+        if current.embedding_mode == "hashing":
+            return current.clone()
+
+        logging.info("Re-embedding TF-IDF document with hashing embeddings for appending")
+        retriever = Retriever(index_mode=current.index_mode, embedding_mode="hashing",
+                              index_params=self.index_params)
+        retriever.index_chunks(current.vector_store.chunks)
+        return retriever
+
+    @metrics.timed("append_document")
+    def append_document(self, text: str, doc_id: str = DEFAULT_DOC_ID) -> int:
+        """
+        Add more text (e.g. the next chapter) to a document's index
+        without re-embedding what is already indexed. Appended documents
+        use hashing embeddings, so terms only the new text contains are
+        searchable; a TF-IDF document is re-embedded on its first append.
+
+        Args:
+            text (str): Text to append
+            doc_id (str): Document to append to (created if missing)
+
+        Returns:
+            int: Number of new chunks indexed
+        """
+        try:
+            logging.info(f"Appending text to document index: {doc_id}")
+
+            if not text or len(text.strip()) == 0:
+                logging.warning("Empty text provided")
+                return 0
+
+            with metrics.timer("chunk"):
+                chunks = self._chunk_text(text)
+
+            if not chunks:
+                logging.warning("No chunks generated from text")
+                return 0
+
+            # Shared indexes are never modified in place — other sessions
+            # may be searching them. The first append copies the document
+            # into an index owned by this session; later appends embed
+            # only the new chunks.
+            ref = self.documents.get_ref(doc_id)
+            current = self.documents.get(doc_id)
+            if ref is not None and ref.owned and current is not None:
+                current.add_chunks(chunks)
+                self.resources.update_size(ref.key)
+            else:
+                retriever = self._appendable_copy(current)
+                retriever.add_chunks(chunks)
+                # Private indexes cannot be reloaded: pinned until released
+                key = f"private:{uuid.uuid4().hex}"
+                self.resources.put(key, retriever, pin=True)
+                self.documents.register_shared(doc_id, key, owned=True, pinned=True)
+
+            logging.info(f"Appended {len(chunks)} chunks to document index")
+            return len(chunks)
+
+        except Exception as e:
+            logging.error("Error appending to document index")
+            raise CustomException(e, sys)
+
+    @metrics.timed("index_pdf")
+    def index_pdf(self, file_path: str, doc_id: str = DEFAULT_DOC_ID) -> int:
+        """
+        Stream a PDF page by page into the index.
+        Pages are chunked incrementally as they are extracted, so the
+        whole document is never held as a single string.
+
+        Args:
+            file_path (str): Path of the uploaded PDF file
+            doc_id (str): Name to register the document's index under
+
+        Returns:
+            int: Number of chunks indexed
+        """
+        try:
+            logging.info(f"Starting streaming PDF indexing: {file_path}")
+
+            retriever = self._new_retriever()
+
+            with open(file_path, "rb") as f:
+                cache_key = self._cache_key(f.read(), retriever)
+
+            # Extract and chunk pages incrementally, then embed in batches —
+            # unless this PDF is already shared in memory or cached
+            shared = self._shared_index(
+                cache_key, retriever,
+                lambda: self._chunk_pages(iter_pdf_pages(file_path)),
+                "pdf_extract_chunk"
+            )
+            if shared is None:
+                logging.warning("No chunks generated from PDF")
+                return 0
+
+            self._register_shared(doc_id, cache_key)
+
+            num_chunks = len(shared.vector_store.chunks)
+            logging.info(f"PDF indexed successfully with {num_chunks} chunks")
+            return num_chunks
+
+        except Exception as e:
+            logging.error("Error indexing PDF")
+            raise CustomException(e, sys)
+
+    @metrics.timed("retrieve")
+    def _retrieve_chunks(self, topic: str, doc_ids) -> tuple:
+        """
+        Retrieve the chunks most relevant to a topic from the filtered documents.
+
+        Returns:
+            tuple: (relevant chunks best first, embedding generator of the
+                   best-matching document) — ([], None) if nothing is indexed
+        """
+        # Check if document is indexed
+        if not self.documents.is_ready(doc_ids):
+            logging.warning("Document not indexed yet")
+            return [], None
+
+        results = self.documents.search(
+            query=topic,
+            top_k=5,
+            doc_ids=doc_ids
+        )
+        relevant_chunks = [chunk for _, chunk, _ in results]
+
+        if not relevant_chunks:
+            logging.warning(f"No relevant chunks found for topic: {topic}")
+            return [], None
+
+        logging.info(f"Retrieved {len(relevant_chunks)} chunks for topic: {topic}")
+        # The document's own vectorizer is reused to spot duplicate questions
+        retriever = self.documents.get(results[0][0])
+        embedding_generator = retriever.embedding_generator if retriever is not None else None
+        return relevant_chunks, embedding_generator
+
+    @metrics.timed("generate_mcqs")
+    def generate_mcqs(self, topic: str, num_questions: int = 5, doc_ids=DEFAULT_DOC_ID,
+                      fresh: bool = False) -> list:
         """
         Generate MCQs for a given topic using RAG.
         Called every time user enters a topic query.
@@ -122,6 +465,9 @@ class MCQPipeline:
         Args:
             topic (str): User's topic e.g. "Gradient Descent"
             num_questions (int): Number of MCQs to generate
+            doc_ids (str | list | None): Document or collection of documents
+                to draw questions from; None searches every indexed document
+            fresh (bool): Generate new questions instead of reusing cached LLM responses
 
         Returns:
             list: List of generated MCQs
@@ -129,46 +475,81 @@ class MCQPipeline:
         try:
             logging.info(f"Generating MCQs for topic: {topic}")
 
-            # Check if document is indexed
-            if not self.retriever.is_ready():
-                logging.warning("Document not indexed yet")
-                return []
-
-            # Step 1: Retrieve relevant chunks for topic
-            relevant_chunks = self.retriever.retrieve(
-                query=topic,
-                top_k=5
-            )
-
+            # Step 1: Retrieve relevant chunks for topic (filtered documents only)
+            relevant_chunks, embedding_generator = self._retrieve_chunks(topic, doc_ids)
             if not relevant_chunks:
-                logging.warning(f"No relevant chunks found for topic: {topic}")
                 return []
 
-            logging.info(f"Retrieved {len(relevant_chunks)} chunks for topic: {topic}")
-
             # Step 2: Generate MCQs from retrieved chunks
             mcqs = self.question_generator.generate_mcqs(
                 retrieved_chunks=relevant_chunks,
                 topic=topic,
-                num_questions=num_questions
+                num_questions=num_questions,
+                fresh=fresh,
+                embedding_generator=embedding_generator
             )
 
             logging.info(f"Generated {len(mcqs)} MCQs for topic: {topic}")
             return mcqs
 
+        except LLMUnavailableError:
+            raise
+
         except Exception as e:
             logging.error("Error generating MCQs")
             raise CustomException(e, sys)
 
-    def is_document_indexed(self) -> bool:
+    def iter_mcqs(self, topic: str, num_questions: int = 5, doc_ids=DEFAULT_DOC_ID,
+                  fresh: bool = False):
+        """
+        Streaming variant of generate_mcqs(): yields each MCQ as soon as
+        it has been generated and validated, so the UI can show the first
+        question after one LLM round-trip.
+
+        Args:
+            topic (str): User's topic e.g. "Gradient Descent"
+            num_questions (int): Number of MCQs to generate
+            doc_ids (str | list | None): Document filter (None = all documents)
+            fresh (bool): Generate new questions instead of reusing cached LLM responses
+
+        Yields:
+            dict: Generated MCQ
+        """
+        try:
+            logging.info(f"Streaming MCQs for topic: {topic}")
+
+            relevant_chunks, embedding_generator = self._retrieve_chunks(topic, doc_ids)
+            if not relevant_chunks:
+                return
+
+            # Each MCQ cites the pages of its own prompt context
+            yield from self.question_generator.iter_mcqs(
+                retrieved_chunks=relevant_chunks,
+                topic=topic,
+                num_questions=num_questions,
+                fresh=fresh,
+                embedding_generator=embedding_generator
+            )
+
+        except LLMUnavailableError:
+            raise
+
+        except Exception as e:
+            logging.error("Error streaming MCQs")
+            raise CustomException(e, sys)
+
+    def is_document_indexed(self, doc_ids=DEFAULT_DOC_ID) -> bool:
         """
         Check if a document has been indexed and
         the pipeline is ready for MCQ generation.
 
+        Args:
+            doc_ids (str | list | None): Document filter (None = any document)
+
         Returns:
             bool: True if ready, False otherwise
         """
-        return self.retriever.is_ready()
+        return self.documents.is_ready(doc_ids)
 
 
 '''
@@ -66,12 +66,15 @@ def format_mcq_output(mcqs: list) -> list:
         formatted = []
 
         for idx, mcq in enumerate(mcqs, start=1):
-            formatted.append({
+            item = {
                 "question_id": idx,
                 "question": mcq["question"],
                 "options": mcq["options"],
                 "correct_answer": mcq["correct_answer"]
-            })
+            }
+            if mcq.get("source_pages"):
+                item["source_pages"] = mcq["source_pages"]
+            formatted.append(item)
 
         return formatted
 
@@ -0,0 +1,50 @@
+# src/utils/lazy_import.py
+
+import importlib
+import threading
+
+
+class LazyModule:
+
+    def __init__(self, name: str):
+        """
+        Stand-in for a module that is imported on first attribute access.
+
+        Heavy dependencies (scikit-learn, FAISS, SciPy, LangChain, PyPDF2)
+        take seconds to import; binding them through a LazyModule keeps
+        that cost out of process start-up and charges it to the first
+        request that actually needs the library.
+
+        name: Fully qualified module name e.g. "scipy.sparse"
+        """
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        # Only called for attributes not set in __init__
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """
+    Bind a module name without importing it yet.
+
+    Args:
+        name (str): Fully qualified module name
+
+    Returns:
+        LazyModule: Proxy that imports the module on first use
+    """
+    return LazyModule(name)
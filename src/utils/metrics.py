@@ -0,0 +1,362 @@
+# src/utils/metrics.py
+
+import os
+import threading
+import functools
+import contextlib
+from time import perf_counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.logger.logger import logging
+
+# Metrics are off unless MCQ_METRICS=1; disabled calls return immediately
+_enabled = os.getenv("MCQ_METRICS", "0") == "1"
+
+DEFAULT_PORT = int(os.getenv("MCQ_METRICS_PORT", "9464"))
+
+# Seconds — covers sub-millisecond searches up to slow LLM calls
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_registry = []
+_server = None
+_server_lock = threading.Lock()
+
+
+def enable() -> None:
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def _format_labels(labelnames: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple = ()):
+        """
+        Monotonic counter, optionally split by labels.
+
+        name: Metric name (Prometheus style, ending in _total)
+        help_text: One-line description
+        labelnames: Label names; values are passed to inc() as keywords
+        """
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self._values = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        if not _enabled:
+            return
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        return self._values.get(key, 0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def expose(self) -> list:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {value:g}")
+        return lines
+
+
+class Histogram:
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple = (),
+                 buckets: tuple = DEFAULT_BUCKETS):
+        """
+        Cumulative-bucket histogram (Prometheus semantics) with
+        percentile estimates for quick summaries.
+
+        name: Metric name
+        help_text: One-line description
+        labelnames: Label names; values are passed to observe() as keywords
+        buckets: Upper bounds of the buckets, ascending
+        """
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self.buckets = tuple(buckets)
+        self._series = {}  # label values -> [bucket counts..., +Inf count], sum
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def observe(self, value: float, **labels) -> None:
+        if not _enabled:
+            return
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            counts = series[0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            series[1] += value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def percentile(self, q: float, **labels):
+        """
+        Estimate a percentile by linear interpolation inside its bucket.
+
+        Args:
+            q (float): Percentile in [0, 100]
+
+        Returns:
+            float: Estimated value, or None with no observations
+        """
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                return None
+            counts = list(series[0])
+
+        total = sum(counts)
+        rank = q / 100 * total
+        seen = 0
+        lower = 0.0
+        for i, count in enumerate(counts):
+            upper = self.buckets[i] if i < len(self.buckets) else self.buckets[-1]
+            if count and seen + count >= rank:
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+            lower = upper
+        return self.buckets[-1]
+
+    def summary(self) -> dict:
+        """
+        Returns:
+            dict: label value(s) -> count, mean, p50, p99 (seconds)
+        """
+        result = {}
+        with self._lock:
+            items = [(key, sum(series[0]), series[1]) for key, series in self._series.items()]
+        for key, count, total in items:
+            labels = dict(zip(self.labelnames, key))
+            result[",".join(key)] = {
+                "count": count,
+                "mean": total / count if count else 0.0,
+                "p50": self.percentile(50, **labels),
+                "p99": self.percentile(99, **labels),
+            }
+        return result
+
+    def expose(self) -> list:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, (counts, total) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    labels = _format_labels(self.labelnames, key, f'le="{bound:g}"')
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                cumulative += counts[-1]
+                labels = _format_labels(self.labelnames, key, 'le="+Inf"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {total:.6f}")
+                lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+# ---------------------- PIPELINE METRICS ---------------------- #
+
+STAGE_SECONDS = Histogram(
+    "mcq_stage_seconds", "Latency of pipeline stages and component calls", ("stage",)
+)
+STAGE_ERRORS = Counter("mcq_stage_errors_total", "Pipeline stages that raised", ("stage",))
+DOCUMENTS_INDEXED = Counter(
+    "mcq_documents_indexed_total", "Documents indexed, by source (built, cache or shared)", ("source",)
+)
+CHUNKS_INDEXED = Counter("mcq_chunks_indexed_total", "Chunks embedded and added to an index")
+INGEST_DROPPED = Counter(
+    "mcq_ingest_dropped_total",
+    "Text dropped before embedding, by kind (boilerplate_line or near_duplicate_chunk)", ("kind",)
+)
+SEARCHES = Counter("mcq_searches_total", "Vector index searches")
+VECTORS_SEARCHED = Counter("mcq_vectors_searched_total", "Indexed vectors scanned by searches")
+QUERY_CACHE_HITS = Counter("mcq_query_cache_hits_total", "Retriever query cache hits")
+INDEX_EVICTIONS = Counter(
+    "mcq_index_evictions_total", "Document indexes evicted by the shared resource manager"
+)
+LLM_CALLS = Counter("mcq_llm_calls_total", "LLM requests completed")
+LLM_RETRIES = Counter("mcq_llm_retries_total", "LLM requests retried after a retryable error")
+LLM_FAILURES = Counter("mcq_llm_failures_total", "Failed LLM requests, by reason", ("reason",))
+LLM_TOKENS = Counter("mcq_llm_tokens_total", "LLM tokens billed, by kind", ("kind",))
+LLM_CACHE_HITS = Counter("mcq_llm_cache_hits_total", "Prompts answered from the LLM response cache")
+VALIDATION_REJECTS = Counter("mcq_validation_rejects_total", "MCQs rejected by validation")
+DUPLICATE_REJECTS = Counter(
+    "mcq_duplicate_rejects_total", "Generated MCQs dropped as near-duplicates of an accepted one"
+)
+QUESTIONS_GENERATED = Counter("mcq_questions_generated_total", "MCQs delivered to callers")
+
+
+class _StageTimer:
+
+    __slots__ = ("stage", "start")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        STAGE_SECONDS.observe(perf_counter() - self.start, stage=self.stage)
+        if exc_type is not None:
+            STAGE_ERRORS.inc(stage=self.stage)
+        return False
+
+
+_NULL_TIMER = contextlib.nullcontext()
+
+
+def timer(stage: str):
+    """
+    Context manager timing a stage into mcq_stage_seconds{stage=...}.
+    Returns a shared no-op context when metrics are disabled.
+
+    Args:
+        stage (str): Stage name e.g. "chunk", "embed", "llm_call"
+    """
+    if not _enabled:
+        return _NULL_TIMER
+    return _StageTimer(stage)
+
+
+def timed(stage: str):
+    """
+    Decorator timing every call of a function as a stage.
+    When metrics are disabled the wrapper only checks the flag.
+
+    Args:
+        stage (str): Stage name
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _StageTimer(stage):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def observe_stage(stage: str, seconds: float) -> None:
+    """
+    Record a stage latency measured by the caller.
+    """
+    STAGE_SECONDS.observe(seconds, stage=stage)
+
+
+def render_prometheus() -> str:
+    """
+    Returns:
+        str: All metrics in the Prometheus text exposition format
+    """
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.expose())
+    return "\n".join(lines) + "\n"
+
+
+def summary() -> dict:
+    """
+    Returns:
+        dict: Per-stage latency percentiles and all counter values
+    """
+    counters = {}
+    for metric in _registry:
+        if isinstance(metric, Counter):
+            with metric._lock:
+                for key, value in metric._values.items():
+                    name = metric.name + (_format_labels(metric.labelnames, key))
+                    counters[name] = value
+    return {"stages": STAGE_SECONDS.summary(), "counters": counters}
+
+
+def reset() -> None:
+    """
+    Clear every recorded value (metric definitions are kept).
+    """
+    for metric in _registry:
+        metric.reset()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        payload = render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def start_http_server(port: int = DEFAULT_PORT, addr: str = "127.0.0.1"):
+    """
+    Serve /metrics for a local Prometheus scraper on a daemon thread.
+    Only one server is started per process; later calls return it.
+
+    Args:
+        port (int): Port to listen on (0 = any free port)
+        addr (str): Interface to bind
+
+    Returns:
+        ThreadingHTTPServer: The running server, or None if the port is taken
+    """
+    global _server
+    with _server_lock:
+        if _server is not None:
+            return _server
+        try:
+            _server = ThreadingHTTPServer((addr, port), _MetricsHandler)
+        except OSError as e:
+            logging.warning(f"Metrics server not started on {addr}:{port}: {e}")
+            return None
+
+        threading.Thread(target=_server.serve_forever, daemon=True).start()
+        logging.info(f"Metrics exposed at http://{addr}:{_server.server_address[1]}/metrics")
+        return _server
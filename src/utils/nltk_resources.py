@@ -0,0 +1,82 @@
+# src/utils/nltk_resources.py
+
+import os
+import threading
+
+from src.utils.lazy_import import lazy_import
+from src.logger.logger import logging
+
+nltk = lazy_import("nltk")
+
+# Downloader package name -> path checked with nltk.data.find
+NLTK_RESOURCES = {
+    "stopwords": "corpora/stopwords",
+    "punkt": "tokenizers/punkt",
+    "punkt_tab": "tokenizers/punkt_tab",
+    "averaged_perceptron_tagger": "taggers/averaged_perceptron_tagger",
+    "averaged_perceptron_tagger_eng": "taggers/averaged_perceptron_tagger_eng",
+}
+
+# MCQ_NLTK_DOWNLOAD=0 never touches the downloader (offline / read-only
+# deployments); missing data then fails on first use with a clear message
+ALLOW_DOWNLOAD = os.getenv("MCQ_NLTK_DOWNLOAD", "1") == "1"
+
+_available = set()
+_lock = threading.Lock()
+
+
+def missing_nltk_resources(names=NLTK_RESOURCES) -> list:
+    """
+    Check which NLTK resources are not installed, without downloading.
+
+    Args:
+        names (iterable): Downloader package names
+
+    Returns:
+        list: Names whose data was not found on nltk.data.path
+    """
+    missing = []
+    for name in names:
+        if name in _available:
+            continue
+        try:
+            nltk.data.find(NLTK_RESOURCES[name])
+            _available.add(name)
+        except LookupError:
+            missing.append(name)
+    return missing
+
+
+def ensure_nltk_resources(names=NLTK_RESOURCES, allow_download: bool = None) -> None:
+    """
+    Make NLTK resources available, downloading only the missing ones.
+
+    Installed data is detected with nltk.data.find, so a warm start
+    never calls the downloader. Results are remembered per process.
+
+    Args:
+        names (iterable): Downloader package names
+        allow_download (bool): Download missing data (default: MCQ_NLTK_DOWNLOAD)
+
+    Raises:
+        LookupError: If data is missing and downloads are disabled or fail
+    """
+    if allow_download is None:
+        allow_download = ALLOW_DOWNLOAD
+
+    with _lock:
+        missing = missing_nltk_resources(names)
+        if not missing:
+            return
+
+        if allow_download:
+            for name in missing:
+                logging.info(f"Downloading NLTK resource '{name}'")
+                nltk.download(name, quiet=True)
+            missing = missing_nltk_resources(missing)
+
+        if missing:
+            raise LookupError(
+                f"NLTK data not installed: {', '.join(missing)}. "
+                f"Run: python -m nltk.downloader {' '.join(missing)}"
+            )
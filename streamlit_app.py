@@ -158,16 +158,13 @@
 
 # streamlit_app.py
 
-import nltk
-nltk.download('punkt', quiet=True)
-nltk.download('stopwords', quiet=True)
-nltk.download('punkt_tab', quiet=True)
-nltk.download('averaged_perceptron_tagger', quiet=True)
-nltk.download('averaged_perceptron_tagger_eng', quiet=True)
-
+# NLTK data is loaded on first use by text_cleaner (src/utils/nltk_resources.py),
+# never downloaded at start-up
 import streamlit as st
 from src.pipeline.mcq_pipeline import MCQPipeline
-from src.components.pdf_reader import extract_text_from_pdf
+from src.components.question_generator import QuestionGenerator
+from src.components.resource_manager import get_resource_manager
+from src.components.llm_scheduler import LLMRequestError, LLMUnavailableError
 from src.utils.helper import validate_text_input, format_mcq_output
 
 import tempfile
@@ -178,9 +175,25 @@ st.set_page_config(page_title="RAG MCQ Generator", layout="wide")
 st.title("🧠 RAG-Based Intelligent MCQ Generator")
 st.write("Upload a PDF or enter text → Enter a topic → Get AI-generated MCQs")
 
-# Initialize pipeline once
+
+# One LLM client / rate limiter and one index store per server process;
+# each browser session only keeps its own document IDs
+@st.cache_resource
+def shared_question_generator():
+    return QuestionGenerator()
+
+
+@st.cache_resource
+def shared_resources():
+    return get_resource_manager()
+
+
+# Initialize pipeline once per session
 if "pipeline" not in st.session_state:
-    st.session_state["pipeline"] = MCQPipeline()
+    st.session_state["pipeline"] = MCQPipeline(
+        resources=shared_resources(),
+        question_generator=shared_question_generator()
+    )
 
 pipeline = st.session_state["pipeline"]
 
@@ -242,10 +255,34 @@ def display_mcqs(formatted, tab="text"):
             else:
                 st.error("❌ Wrong!")
                 st.info(f"💡 Correct Answer: **{mcq['correct_answer']}**")
+            if mcq.get("source_pages"):
+                pages = ", ".join(str(page) for page in mcq["source_pages"])
+                st.caption(f"📄 Source: page{'s' if len(mcq['source_pages']) > 1 else ''} {pages}")
 
         st.divider()
 
 
+def stream_mcqs(mcq_stream, num_questions):
+    """Show each MCQ as a read-only preview the moment it is generated.
+    The preview is cleared at the end; the interactive quiz replaces it."""
+
+    mcqs = []
+    placeholder = st.empty()
+    preview = placeholder.container()
+
+    try:
+        for mcq in mcq_stream:
+            mcqs.append(mcq)
+            with preview:
+                st.markdown(f"**Q{len(mcqs)}: {mcq['question']}**")
+                st.markdown("\n".join(f"- {option}" for option in mcq["options"]))
+                st.caption(f"{len(mcqs)} of {num_questions} questions ready...")
+    finally:
+        placeholder.empty()
+
+    return mcqs
+
+
 # ---------------------- TABS ---------------------- #
 
 tab1, tab2 = st.tabs(["📄 Enter Text", "📑 Upload PDF"])
@@ -262,7 +299,7 @@ with tab1:
             st.warning("Please enter meaningful text (at least 20 characters).")
         else:
             with st.spinner("Processing and indexing text..."):
-                num_chunks = pipeline.index_document(user_text)
+                num_chunks = pipeline.index_document(user_text, doc_id="text")
                 if num_chunks == 0:
                     st.error("Could not process text. Try richer content.")
                 else:
@@ -283,19 +320,36 @@ with tab1:
         col1, col2 = st.columns([1, 5])
         with col1:
             num_q = st.selectbox("No. of MCQs", [3, 5, 7, 10], index=1, key="text_num_q")
+        with col2:
+            fresh = st.checkbox("New questions (skip cache)", key="text_fresh")
 
         if st.button("Generate MCQs", key="text_generate"):
             if not topic or len(topic.strip()) == 0:
                 st.warning("⚠️ Please enter a topic first!")
             else:
                 with st.spinner(f"Retrieving relevant content and generating MCQs on '{topic}'..."):
-                    mcqs = pipeline.generate_mcqs(
-                        topic=topic,
-                        num_questions=num_q
-                    )
-                    formatted = format_mcq_output(mcqs)
-
-                    if not formatted:
+                    try:
+                        mcqs = stream_mcqs(
+                            pipeline.iter_mcqs(
+                                topic=topic,
+                                num_questions=num_q,
+                                doc_ids="text",
+                                fresh=fresh
+                            ),
+                            num_q
+                        )
+                    except LLMRequestError as e:
+                        mcqs = None
+                        error = f"❌ The question service rejected the request: {e.__cause__ or e}"
+                    except LLMUnavailableError:
+                        mcqs = None
+                        error = "⏳ The question service is busy or unavailable. Please try again in a minute."
+
+                    formatted = format_mcq_output(mcqs) if mcqs else []
+
+                    if mcqs is None:
+                        st.error(error)
+                    elif not formatted:
                         st.error(f"No MCQs generated for topic '{topic}'. Try a different topic.")
                     else:
                         clear_mcq_state()
@@ -323,19 +377,18 @@ with tab2:
                     tmp_file.write(uploaded_file.read())
                     temp_path = tmp_file.name
 
-                text = extract_text_from_pdf(temp_path)
-                os.remove(temp_path)
+                # Pages are streamed straight into the chunker and index
+                try:
+                    num_chunks = pipeline.index_pdf(temp_path, doc_id="pdf")
+                finally:
+                    os.remove(temp_path)
 
-                if not validate_text_input(text):
+                if num_chunks == 0:
                     st.error("PDF does not contain enough readable text.")
                 else:
-                    num_chunks = pipeline.index_document(text)
-                    if num_chunks == 0:
-                        st.error("Could not process PDF. Try a different file.")
-                    else:
-                        st.session_state["pdf_indexed"] = True
-                        st.session_state["pdf_num_chunks"] = num_chunks
-                        st.success(f"✅ PDF processed! Indexed {num_chunks} chunks. Now enter a topic below.")
+                    st.session_state["pdf_indexed"] = True
+                    st.session_state["pdf_num_chunks"] = num_chunks
+                    st.success(f"✅ PDF processed! Indexed {num_chunks} chunks. Now enter a topic below.")
 
     # Step 2 — Enter topic and generate MCQs
     if st.session_state.get("pdf_indexed"):
@@ -350,19 +403,36 @@ with tab2:
         col1, col2 = st.columns([1, 5])
         with col1:
             num_q = st.selectbox("No. of MCQs", [3, 5, 7, 10], index=1, key="pdf_num_q")
+        with col2:
+            fresh = st.checkbox("New questions (skip cache)", key="pdf_fresh")
 
         if st.button("Generate MCQs", key="pdf_generate"):
             if not topic or len(topic.strip()) == 0:
                 st.warning("⚠️ Please enter a topic first!")
             else:
                 with st.spinner(f"Retrieving relevant content and generating MCQs on '{topic}'..."):
-                    mcqs = pipeline.generate_mcqs(
-                        topic=topic,
-                        num_questions=num_q
-                    )
-                    formatted = format_mcq_output(mcqs)
-
-                    if not formatted:
+                    try:
+                        mcqs = stream_mcqs(
+                            pipeline.iter_mcqs(
+                                topic=topic,
+                                num_questions=num_q,
+                                doc_ids="pdf",
+                                fresh=fresh
+                            ),
+                            num_q
+                        )
+                    except LLMRequestError as e:
+                        mcqs = None
+                        error = f"❌ The question service rejected the request: {e.__cause__ or e}"
+                    except LLMUnavailableError:
+                        mcqs = None
+                        error = "⏳ The question service is busy or unavailable. Please try again in a minute."
+
+                    formatted = format_mcq_output(mcqs) if mcqs else []
+
+                    if mcqs is None:
+                        st.error(error)
+                    elif not formatted:
                         st.error(f"No MCQs generated for topic '{topic}'. Try a different topic.")
                     else:
                         clear_mcq_state()
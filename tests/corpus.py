@@ -0,0 +1,90 @@
+# tests/corpus.py
+#
+# Deterministic pseudo-textbook text shared by the tests and benchmarks.
+
+import random
+
+TOPICS = [
+    "gradient descent", "neural networks", "normalization", "regularization",
+    "decision trees", "support vector machines", "backpropagation",
+    "convolution", "recurrent networks", "attention", "clustering",
+    "dimensionality reduction", "probability", "bayes theorem", "overfitting",
+]
+
+WORDS = (
+    "model data learning training error loss function weight bias layer input "
+    "output feature vector matrix gradient update rate step parameter value "
+    "sample batch epoch accuracy prediction label class distribution variance "
+    "mean estimate optimum minimum convergence iteration algorithm method"
+).split()
+
+
+def make_paragraph(rng: random.Random, num_sentences: int = 5) -> str:
+    """
+    Build one paragraph of pseudo-textbook prose.
+
+    Args:
+        rng (random.Random): Seeded random generator
+        num_sentences (int): Sentences in the paragraph
+
+    Returns:
+        str: Paragraph text
+    """
+    sentences = []
+    for _ in range(num_sentences):
+        topic = rng.choice(TOPICS)
+        words = rng.choices(WORDS, k=rng.randint(8, 18))
+        sentences.append(f"{topic.capitalize()} uses the {' '.join(words)}.")
+    return " ".join(sentences)
+
+
+def make_pages(num_pages: int, paragraphs_per_page: int = 4, seed: int = 0) -> list:
+    """
+    Build a deterministic list of page texts.
+
+    Args:
+        num_pages (int): Number of pages
+        paragraphs_per_page (int): Paragraphs on each page
+        seed (int): Random seed
+
+    Returns:
+        list: Text of each page
+    """
+    rng = random.Random(seed)
+    return [
+        "\n\n".join(make_paragraph(rng) for _ in range(paragraphs_per_page))
+        for _ in range(num_pages)
+    ]
+
+
+HEADER = "CS 229 Machine Learning - Lecture Notes"
+COPYRIGHT = "Copyright 2024 Example University. All rights reserved."
+
+
+def make_lecture_pages(num_pages: int, repeat_rate: float, seed: int = 0) -> list:
+    """
+    Build lecture-notes pages: every page carries a course header, a
+    slide title, a "Page n of N" footer and a copyright line, and a
+    share of the slides repeats an earlier one with a small edit.
+
+    Args:
+        num_pages (int): Number of pages
+        repeat_rate (float): Chance that a slide is a recap of an earlier one
+        seed (int): Random seed
+
+    Returns:
+        list: Text of each page
+    """
+    rng = random.Random(seed)
+    bodies = make_pages(num_pages, paragraphs_per_page=2, seed=seed)
+    for i in range(1, num_pages):
+        if rng.random() < repeat_rate:
+            # Recap slide: an earlier slide with one sentence changed
+            sentences = bodies[rng.randrange(i)].split(". ")
+            sentences[rng.randrange(len(sentences))] = "Recap of the key ideas so far"
+            bodies[i] = ". ".join(sentences)
+    return [
+        f"{HEADER}\nSlide: {TOPICS[i % len(TOPICS)].title()}\n{body}\n"
+        f"Page {i + 1} of {num_pages}\n{COPYRIGHT}"
+        for i, body in enumerate(bodies)
+    ]
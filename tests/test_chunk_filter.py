@@ -0,0 +1,57 @@
+import os
+import random
+import subprocess
+import sys
+
+from src.components.chunk_filter import ChunkFilter
+from tests.corpus import COPYRIGHT, HEADER, make_lecture_pages
+
+
+def test_strip_boilerplate_text_with_page_breaks():
+    text = "\f".join(make_lecture_pages(20, 0.0))
+    out = ChunkFilter().strip_boilerplate_text(text)
+    assert HEADER not in out and COPYRIGHT not in out
+    assert "\f" not in out
+
+
+def test_strip_boilerplate_text_without_page_breaks():
+    # Extracted pages joined with newlines, as index_document receives them
+    text = "\n".join(make_lecture_pages(40, 0.3))
+    out = ChunkFilter().strip_boilerplate_text(text)
+    # Only page joins are known: the first page's header stays
+    assert out.count(HEADER) == 1 and COPYRIGHT not in out
+    assert "Page 7 of 40" not in out
+    assert len(out) > 0.8 * len(text)
+
+
+def test_strip_boilerplate_text_keeps_repeated_body_lines():
+    # Pasted notes: a definition and a heading recur throughout the body
+    definition = "A gradient is the vector of partial derivatives."
+    rng = random.Random(0)
+    words = ["weights", "loss", "step", "batch", "epoch", "rate", "bias", "layer", "error"]
+
+    def sentence() -> str:
+        return " ".join(rng.choice(words) for _ in range(12)).capitalize() + "."
+
+    paragraphs = [f"Key idea\n{sentence()}\n{definition}\n{sentence()}" for _ in range(120)]
+    text = "\n\n".join(paragraphs)
+    out = ChunkFilter().strip_boilerplate_text(text)
+    assert out == text
+
+
+def test_strip_boilerplate_text_keeps_short_text():
+    text = "Gradient descent\nGradient descent\nStep size"
+    assert ChunkFilter().strip_boilerplate_text(text) == text
+
+
+def test_signature_is_stable_across_processes():
+    # Cached indexes keep the chunks that survived deduplication, so the
+    # decision must not depend on the interpreter's hash seed
+    code = ("from src.components.chunk_filter import ChunkFilter; "
+            "print(ChunkFilter().signature('gradient descent takes a step').tolist())")
+    outputs = {
+        subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                       env={**os.environ, "PYTHONHASHSEED": seed}).stdout
+        for seed in ("1", "2")
+    }
+    assert len(outputs) == 1
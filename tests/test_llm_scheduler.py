@@ -0,0 +1,159 @@
+import pytest
+
+from src.components import llm_scheduler
+from src.components.llm_backend import LLMBackend, LLMResponse, SimulatedAPIError
+from src.components.llm_scheduler import (
+    CircuitBreaker, CircuitOpenError, LLMRequestError, LLMScheduler, LLMUnavailableError, TokenBucket
+)
+
+REQUEST = {"model": "m", "messages": [{"role": "user", "content": "hi"}], "temperature": 0.0}
+
+
+class ScriptedBackend(LLMBackend):
+
+    name = "scripted"
+
+    def __init__(self, outcomes: list):
+        # Each outcome is an exception to raise or None for a success
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def complete(self, model: str, messages: list, temperature: float) -> LLMResponse:
+        self.calls += 1
+        outcome = self.outcomes.pop(0) if self.outcomes else None
+        if outcome is not None:
+            raise outcome
+        return LLMResponse("ok", 10, 5)
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # Replaces the time module as seen by the scheduler only
+    fake = FakeClock()
+    monkeypatch.setattr(llm_scheduler, "time", fake)
+    return fake
+
+
+def make_scheduler(outcomes: list, **kwargs) -> LLMScheduler:
+    kwargs.setdefault("requests_per_minute", 1e9)
+    kwargs.setdefault("tokens_per_minute", 1e12)
+    return LLMScheduler(ScriptedBackend(outcomes), **kwargs)
+
+
+def test_token_bucket_waits_for_refill(clock):
+    bucket = TokenBucket(60)  # one token per second
+    assert bucket.acquire(60) == 0.0
+    assert bucket.acquire(2) == pytest.approx(2.0)
+    assert clock.sleeps == [pytest.approx(2.0)]
+
+
+def test_token_bucket_clamps_and_adjusts(clock):
+    bucket = TokenBucket(10)
+    assert bucket.acquire(1000) == 0.0  # clamped to capacity
+    bucket.adjust(-4)
+    assert bucket.tokens == pytest.approx(4.0)
+    bucket.adjust(100)
+    assert bucket.tokens < 0
+
+
+def test_breaker_opens_half_opens_and_closes(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    for _ in range(2):
+        breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+    clock.sleep(0.06)
+    breaker.allow()
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()  # only one trial at a time
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.failures == 0
+
+
+def test_failed_trial_reopens_breaker(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.allow()
+    breaker.record_failure()
+    clock.sleep(0.06)
+    breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+
+def test_released_trial_lets_another_through(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.allow()
+    breaker.record_failure()
+    clock.sleep(0.06)
+    breaker.allow()
+    breaker.release_trial()
+    breaker.allow()
+    assert breaker.state == "half_open"
+
+
+def test_client_error_does_not_close_half_open_breaker(clock):
+    scheduler = make_scheduler([SimulatedAPIError(401, "bad key")],
+                               failure_threshold=1, reset_timeout=0.05)
+    scheduler.breaker.allow()
+    scheduler.breaker.record_failure()
+    clock.sleep(0.06)
+    with pytest.raises(LLMRequestError) as raised:
+        scheduler.complete(**REQUEST)
+    assert raised.value.__cause__.status_code == 401
+    assert scheduler.breaker.state == "half_open"
+    assert scheduler.complete(**REQUEST).content == "ok"
+    assert scheduler.breaker.state == "closed"
+
+
+def test_rate_limits_do_not_open_breaker(clock):
+    scheduler = make_scheduler([SimulatedAPIError(429, "slow down")] * 4, failure_threshold=2)
+    assert scheduler.complete(**REQUEST).content == "ok"
+    assert scheduler.breaker.state == "closed"
+    assert scheduler.retries == 4
+
+
+def test_server_errors_open_breaker(clock):
+    scheduler = make_scheduler([SimulatedAPIError(503, "down")] * 5, failure_threshold=2, max_retries=1)
+    with pytest.raises(LLMUnavailableError):
+        scheduler.complete(**REQUEST)
+    assert scheduler.breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        scheduler.complete(**REQUEST)
+    assert scheduler.rejected == 1
+
+
+def test_retry_after_is_honored(clock):
+    scheduler = make_scheduler([SimulatedAPIError(429, "slow down", retry_after=1.5)], max_delay=30.0)
+    scheduler.complete(**REQUEST)
+    assert clock.sleeps == [pytest.approx(1.5)]
+
+
+def test_retry_after_is_capped(clock):
+    scheduler = make_scheduler([SimulatedAPIError(429, "slow down", retry_after=120)], max_delay=5.0)
+    scheduler.complete(**REQUEST)
+    assert clock.sleeps == [pytest.approx(5.0)]
+
+
+def test_backoff_without_retry_after(clock):
+    scheduler = make_scheduler([SimulatedAPIError(503, "down")] * 3, base_delay=1.0, max_delay=30.0)
+    scheduler.complete(**REQUEST)
+    assert len(clock.sleeps) == 3
+    assert all(0 <= delay <= 2 ** attempt for attempt, delay in enumerate(clock.sleeps))
@@ -0,0 +1,85 @@
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.logger import logger as log_config
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    saved = dict(log_config._config)
+    yield str(tmp_path)
+    log_config.configure_logging(**saved)
+
+
+def worker_handlers() -> tuple:
+    logging.getLogger().warning("from worker")
+    return ([type(handler).__name__ for handler in logging.getLogger().handlers],
+            log_config._listener is None)
+
+
+def read_log(log_dir: str) -> str:
+    with open(os.path.join(log_dir, log_config.LOG_FILE), encoding="utf-8") as f:
+        return f.read()
+
+
+def test_configure_keeps_host_handlers(log_dir):
+    host = logging.NullHandler()
+    root = logging.getLogger()
+    root.addHandler(host)
+    try:
+        log_config.configure_logging(log_dir, async_mode=True)
+        log_config.configure_logging(log_dir, async_mode=False)
+        assert host in root.handlers
+        ours = [h for h in root.handlers if isinstance(h, log_config.SizeRotatingFileHandler)]
+        assert len(ours) == 1
+        assert not any(isinstance(h, log_config.DroppingQueueHandler) for h in root.handlers)
+    finally:
+        root.removeHandler(host)
+
+
+def test_fork_with_queue_lock_held_does_not_deadlock(log_dir):
+    log_config.configure_logging(log_dir, async_mode=True)
+    log_queue = log_config._queue_handler.queue
+
+    # Another thread holding the queue's lock at fork time is copied
+    # into the child as a lock nobody will release
+    with log_queue.mutex:
+        pid = os.fork()
+        if pid == 0:
+            logging.getLogger().warning("from child")
+            os._exit(0 if log_config._listener is None else 1)
+
+    deadline = time.monotonic() + 10
+    while True:
+        done, status = os.waitpid(pid, os.WNOHANG)
+        if done:
+            break
+        if time.monotonic() > deadline:
+            os.kill(pid, 9)
+            os.waitpid(pid, 0)
+            pytest.fail("forked child deadlocked in the logging fork hook")
+        time.sleep(0.01)
+    assert os.waitstatus_to_exitcode(status) == 0
+
+    log_config.shutdown_logging()
+    assert "from child" in read_log(log_dir)
+
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_workers_append_without_rotating(log_dir, start_method, monkeypatch):
+    monkeypatch.setenv("MCQ_LOG_DIR", log_dir)
+    log_config.configure_logging(log_dir, async_mode=True)
+    context = multiprocessing.get_context(start_method)
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        handlers, no_listener = executor.submit(worker_handlers).result(timeout=60)
+    assert "FileHandler" in handlers
+    assert not {"SizeRotatingFileHandler", "DroppingQueueHandler"} & set(handlers)
+    assert no_listener
+
+    log_config.shutdown_logging()
+    assert "from worker" in read_log(log_dir)
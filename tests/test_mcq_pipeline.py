@@ -0,0 +1,69 @@
+import pytest
+
+from src.components.llm_backend import SimulatedBackend
+from src.components.resource_manager import ResourceManager
+from src.components.text_chunker import TextChunker
+from src.pipeline import mcq_pipeline
+from src.pipeline.mcq_pipeline import MCQPipeline
+from tests.corpus import make_pages
+
+
+def make_pipeline(**kwargs) -> MCQPipeline:
+    kwargs.setdefault("use_index_cache", False)
+    return MCQPipeline(llm_backend=SimulatedBackend(latency_s=0.0),
+                       resources=ResourceManager(), **kwargs)
+
+
+def test_cache_key_covers_splitter_settings():
+    pipeline = make_pipeline()
+    retriever = pipeline._new_retriever()
+    key = pipeline._cache_key(b"document", retriever)
+    assert pipeline._cache_key(b"document", retriever) == key
+
+    pipeline.text_chunker = TextChunker(separators=["\n\n", " "])
+    assert pipeline._cache_key(b"document", retriever) != key
+    pipeline.text_chunker = TextChunker(engine="langchain")
+    assert pipeline._cache_key(b"document", retriever) != key
+
+
+APPENDED = ("Photosynthesis converts light energy into chemical energy inside chloroplasts. "
+            "Chlorophyll absorbs photons, and the Calvin cycle fixes carbon dioxide into glucose. ")
+
+
+@pytest.mark.parametrize("index_mode", ["dense", "sparse"])
+@pytest.mark.parametrize("embedding_mode", ["tfidf", "hashing"])
+def test_appended_terms_are_retrievable(index_mode, embedding_mode):
+    pipeline = make_pipeline(index_mode=index_mode, embedding_mode=embedding_mode)
+    pipeline.index_document("\n\n".join(make_pages(20)))
+    pipeline.append_document(APPENDED * 3)
+
+    top = pipeline.retriever.retrieve("chlorophyll photosynthesis", top_k=1)
+    assert "Chlorophyll" in top[0]
+
+
+def test_append_embeds_only_new_chunks_after_first_append():
+    pipeline = make_pipeline()
+    pipeline.index_document("\n\n".join(make_pages(20)))
+    pipeline.append_document(APPENDED)
+    retriever = pipeline.retriever
+    indexed = len(retriever.vector_store.chunks)
+
+    pipeline.append_document("Mitochondria produce ATP through cellular respiration.")
+    assert pipeline.retriever is retriever
+    assert len(retriever.vector_store.chunks) == indexed + 1
+    assert "Mitochondria" in retriever.retrieve("mitochondria ATP", top_k=1)[0]
+
+
+def test_questions_from_different_pages_cite_different_pages(tmp_path, monkeypatch):
+    page_texts = make_pages(30)
+    monkeypatch.setattr(mcq_pipeline, "iter_pdf_pages", lambda path: iter(page_texts))
+    pdf = tmp_path / "notes.pdf"
+    pdf.write_bytes(b"%PDF notes")
+
+    pipeline = make_pipeline()
+    pipeline.index_pdf(str(pdf))
+    mcqs = pipeline.generate_mcqs("gradient descent convergence", num_questions=5)
+
+    # Each question cites only the chunks in its own prompt context
+    cited = {tuple(mcq["source_pages"]) for mcq in mcqs}
+    assert len(mcqs) > 1 and len(cited) > 1
@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+from src.components.chunk_store import Chunk
+from src.components.llm_backend import LLMBackend, LLMResponse, SimulatedAPIError
+from src.components.llm_scheduler import LLMRequestError
+from src.components.question_generator import QuestionGenerator
+from src.utils import metrics
+
+CHUNKS = [f"Gradient descent fact number {i} about step sizes and convergence." for i in range(6)]
+
+
+class ReplyBackend(LLMBackend):
+
+    name = "reply"
+
+    def __init__(self, reply):
+        # reply: response text, or an exception to raise
+        self.reply = reply
+
+    def complete(self, model: str, messages: list, temperature: float) -> LLMResponse:
+        if isinstance(self.reply, Exception):
+            raise self.reply
+        return LLMResponse(self.reply, 10, 5)
+
+
+class ContextBackend(LLMBackend):
+
+    name = "context"
+
+    def complete(self, model: str, messages: list, temperature: float) -> LLMResponse:
+        # Asks about the first chunk of the prompt's context
+        first = messages[0]["content"].split("Context:\n", 1)[1].split("\n\n", 1)[0]
+        options = [first, "none of these", "all of these", "cannot be determined"]
+        mcq = {"question": f"Which statement is true: {first}?", "options": options,
+               "correct_answer": first}
+        return LLMResponse(json.dumps(mcq), 10, 5)
+
+
+@pytest.fixture
+def failures(monkeypatch):
+    monkeypatch.setattr(metrics, "_enabled", True)
+    metrics.LLM_FAILURES.reset()
+    yield metrics.LLM_FAILURES
+    metrics.LLM_FAILURES.reset()
+
+
+def make_generator(reply, **kwargs) -> QuestionGenerator:
+    generator = QuestionGenerator(backend=ReplyBackend(reply), use_response_cache=False,
+                                  max_concurrency=1, **kwargs)
+    generator.scheduler.base_delay = 0.0
+    return generator
+
+
+@pytest.mark.parametrize("generation_mode", ["per_question", "batched"])
+def test_client_error_propagates_and_is_counted_once(failures, generation_mode):
+    generator = make_generator(SimulatedAPIError(401, "invalid api key"), generation_mode=generation_mode)
+    with pytest.raises(LLMRequestError, match="invalid api key"):
+        generator.generate_mcqs(CHUNKS, "gradient descent", 3)
+    assert failures.value(reason="client_error") == 1
+    assert failures.value(reason="invalid_response") == 0
+
+
+@pytest.mark.parametrize("reply", ["not json", json.dumps({"question": "q?"}), json.dumps([1, 2])])
+def test_invalid_response_is_skipped(failures, reply):
+    generator = make_generator(reply)
+    assert generator._generate_mcq_with_groq("context", "topic") is None
+    assert failures.value(reason="client_error") == 0
+
+
+def test_unparseable_response_counts_as_invalid(failures):
+    generator = make_generator("not json")
+    assert generator.generate_mcqs(CHUNKS, "gradient descent", 2) == []
+    assert failures.value(reason="invalid_response") == 2
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_questions_cite_the_pages_of_their_own_context(max_concurrency):
+    chunks = [Chunk("Mitochondria produce ATP by oxidative phosphorylation.", page=3),
+              Chunk("Ribosomes translate messenger RNA into protein chains.", page=3),
+              Chunk("Tectonic plates drift over the viscous asthenosphere.", page=8),
+              Chunk("Glaciers carve U-shaped valleys during ice ages.", page=8)]
+    generator = QuestionGenerator(backend=ContextBackend(), use_response_cache=False,
+                                  max_concurrency=max_concurrency)
+
+    mcqs = generator.generate_mcqs(chunks, "science", 3)
+    pages = {mcq["correct_answer"]: mcq["source_pages"] for mcq in mcqs}
+    # Question i is asked over chunks i and i + 1
+    assert pages == {chunks[0]: [3], chunks[1]: [3, 8], chunks[2]: [8]}
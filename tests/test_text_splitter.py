@@ -0,0 +1,112 @@
+import itertools
+import random
+
+import pytest
+
+from src.components.text_chunker import TextChunker
+from tests.corpus import make_pages
+
+SETTINGS = [(500, 50), (200, 0), (1000, 200), (100, 100), (50, 10)]
+SEPARATOR_SETS = [None, ["\n\n", "\n", " ", ""], [".", " "]]
+PIECES = ["word", "ab", " ", "  ", "\n", "\n\n", "\n\n\n", ".", "!", "?", ". ",
+          "\t", "x" * 40, "y" * 600, " \n ", "é", "ü", "中文"]
+
+LECTURE = "\n".join(make_pages(20, seed=1))
+SAMPLES = {
+    "lecture": LECTURE,
+    "whitespace": "  \n\n \t \n  " + "Gradient descent.  \n\n\n  Step size!\t\t" * 30 + " \n ",
+    "separators": "...!!!???\n\n\n\n" * 40 + ". . . ! ? " * 60,
+    "long_words": "x" * 1200 + " " + "y" * 80 + "\n" + "z" * 700,
+    "non_ascii": "Théorème de Bayes: P(A|B) = P(B|A)·P(A)/P(B). 中文文本。 Ünïcödé naïve café. " * 40,
+    "empty": "",
+}
+
+
+def reference_chunks(text: str, chunk_size: int, chunk_overlap: int, separators=None) -> list:
+    text_splitter = pytest.importorskip("langchain.text_splitter")
+    splitter = text_splitter.RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        separators=separators or TextChunker().separators
+    )
+    return splitter.split_text(text)
+
+
+def check(text: str, chunk_size: int, chunk_overlap: int, separators=None) -> None:
+    chunker = TextChunker(chunk_size, chunk_overlap, separators, engine="native")
+    chunks = chunker.split_text(text)
+    assert chunks == reference_chunks(text, chunk_size, chunk_overlap, separators)
+    assert [text[start:end] for start, end in chunker.split_spans(text)] == chunks
+
+
+@pytest.mark.parametrize("chunk_size, chunk_overlap", SETTINGS)
+@pytest.mark.parametrize("name", sorted(SAMPLES))
+def test_matches_reference_splitter(name, chunk_size, chunk_overlap):
+    check(SAMPLES[name], chunk_size, chunk_overlap)
+
+
+@pytest.mark.parametrize("separators", SEPARATOR_SETS)
+def test_matches_reference_splitter_on_random_texts(separators):
+    rng = random.Random(0)
+    for _ in range(300):
+        text = "".join(rng.choice(PIECES) for _ in range(rng.randint(0, 300)))
+        chunk_size = rng.choice([5, 20, 50, 100, 500])
+        check(text, chunk_size, rng.randint(0, chunk_size), separators)
+
+
+def test_golden_chunks():
+    # LangChain's output, kept so boundaries are checked without it too:
+    # a separator stays at the start of the piece that follows it
+    text = "First paragraph is here.\n\nSecond one. It has two sentences!\nA new line follows"
+    chunker = TextChunker(30, 10, engine="native")
+    assert chunker.split_text(text) == [
+        "First paragraph is here.",
+        "Second one",
+        ". It has two sentences!",
+        "A new line follows",
+    ]
+
+
+def test_langchain_engine_offsets():
+    pytest.importorskip("langchain.text_splitter")
+    native = TextChunker(200, 50, engine="native").chunk_text(LECTURE)
+    reference = TextChunker(200, 50, engine="langchain").chunk_text(LECTURE)
+    assert list(native) == list(reference)
+
+
+@pytest.mark.parametrize("chunk_size, chunk_overlap", SETTINGS)
+def test_page_stream_matches_reference_splitter(chunk_size, chunk_overlap):
+    pages = make_pages(15, seed=2) + ["", "   "] + make_pages(5, seed=3)
+    chunker = TextChunker(chunk_size, chunk_overlap, engine="native")
+    chunks = list(chunker.split_pages(pages))
+    assert chunks == reference_chunks("\n".join(p for p in pages if p.strip()), chunk_size, chunk_overlap)
+    # Pages are joined with "\n", so a chunk's first line is on its page
+    for chunk in chunks:
+        assert chunk.split("\n")[0] in pages[chunk.page - 1]
+
+
+def test_split_pages_streams():
+    read = []
+
+    def endless_pages():
+        for number in itertools.count():
+            read.append(number)
+            yield LECTURE[:2000]
+
+    first = next(TextChunker(200, 50).split_pages(endless_pages()))
+    assert len(read) == 1 and first.page == 1
+
+
+def test_chunk_pages_matches_split_pages():
+    pages = make_pages(15, seed=4) + [""] + make_pages(3, seed=5)
+    chunker = TextChunker(200, 50)
+    store = chunker.chunk_pages(iter(pages))
+    streamed = list(chunker.split_pages(iter(pages)))
+    assert list(store) == streamed
+    assert [store.page(i) for i in range(len(store))] == [chunk.page for chunk in streamed]
+    assert store.buffer == "\n".join(page for page in pages if page)
+
+
+def test_rejects_overlap_larger_than_chunk():
+    with pytest.raises(ValueError):
+        TextChunker(100, 200)
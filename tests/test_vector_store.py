@@ -0,0 +1,41 @@
+import logging
+
+import faiss
+import numpy as np
+import pytest
+
+from src.components.chunk_store import ChunkStore
+from src.components.vector_store import VectorStore
+
+
+def saved_store(tmp_path) -> str:
+    rng = np.random.default_rng(0)
+    store = VectorStore(index_type="flat")
+    store.build_index(ChunkStore.from_texts([f"chunk {i}" for i in range(20)]),
+                      rng.random((20, 8), dtype="float32"))
+    store.save(str(tmp_path))
+    return str(tmp_path)
+
+
+def test_memory_mapped_load_matches_copy(tmp_path):
+    directory = saved_store(tmp_path)
+    mapped, loaded = VectorStore(), VectorStore()
+    mapped.load(directory, memory_map=True)
+    loaded.load(directory, memory_map=False)
+    query = np.ones(8, dtype="float32")
+    assert mapped.search(query, 3) == loaded.search(query, 3)
+    assert mapped.is_mapped and not loaded.is_mapped
+
+
+def test_load_warns_without_flat_index_mmap(tmp_path, monkeypatch, caplog):
+    directory = saved_store(tmp_path)
+    if hasattr(faiss, "IO_FLAG_MMAP_IFC"):
+        monkeypatch.delattr(faiss, "IO_FLAG_MMAP_IFC")
+    with caplog.at_level(logging.WARNING):
+        VectorStore().load(directory, memory_map=True)
+    assert "IO_FLAG_MMAP_IFC" in caplog.text
+
+
+def test_build_index_rejects_empty_batches():
+    with pytest.raises(Exception, match="No embeddings"):
+        VectorStore().build_index_from_batches(ChunkStore.from_texts(["a"]), iter([]))